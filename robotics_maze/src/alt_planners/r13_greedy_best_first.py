@@ -5,7 +5,12 @@ from __future__ import annotations
 import heapq
 from math import sqrt
 from time import perf_counter
-from typing import Callable, Dict, List, Sequence, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from ..heuristics import get_heuristic, heuristic_table
+except ImportError:
+    from heuristics import get_heuristic, heuristic_table
 
 Coord = Tuple[int, int]
 Grid = Sequence[Sequence[object]]
@@ -37,9 +42,28 @@ def _resolve_heuristic(heuristic: str | HeuristicFn | None) -> HeuristicFn:
         return _euclidean
     if key in {"chebyshev", "linf", "chessboard"}:
         return _chebyshev
+    # Names registered with `heuristics` (e.g. "alt" from `landmarks`).
+    try:
+        return get_heuristic(key)
+    except KeyError:
+        pass
     raise ValueError(f"Unsupported heuristic '{heuristic}'.")
 
 
+_TABLE_NAMES: Dict[HeuristicFn, str] = {
+    _manhattan: "manhattan",
+    _euclidean: "euclidean",
+    _chebyshev: "chebyshev",
+}
+
+
+def _lookup_table(
+    heuristic_fn: HeuristicFn, rows: int, cols: int, goal: Coord
+) -> Optional[Sequence[float]]:
+    """Return a cached per-goal table, or None to evaluate `heuristic_fn` per node."""
+    return heuristic_table(_TABLE_NAMES.get(heuristic_fn, heuristic_fn), (rows, cols), goal)
+
+
 def _validate_grid(grid: Grid) -> Tuple[int, int]:
     if not grid:
         raise ValueError("grid cannot be empty")
@@ -140,7 +164,9 @@ def plan_greedy_best_first(
     discovered: set[Coord] = {start}
     visited: set[Coord] = set()
 
-    heapq.heappush(frontier, (heuristic_fn(start, goal), tie, start))
+    h_table = _lookup_table(heuristic_fn, rows, cols, goal)
+    start_h = h_table[start[0] * cols + start[1]] if h_table is not None else heuristic_fn(start, goal)
+    heapq.heappush(frontier, (start_h, tie, start))
     tie += 1
     metrics["generated_nodes"] = 1
 
@@ -167,7 +193,8 @@ def plan_greedy_best_first(
 
             parents[nxt] = current
             discovered.add(nxt)
-            heapq.heappush(frontier, (heuristic_fn(nxt, goal), tie, nxt))
+            h = h_table[nxt[0] * cols + nxt[1]] if h_table is not None else heuristic_fn(nxt, goal)
+            heapq.heappush(frontier, (h, tie, nxt))
             tie += 1
             metrics["generated_nodes"] = int(metrics["generated_nodes"]) + 1
 
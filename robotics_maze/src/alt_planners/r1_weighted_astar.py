@@ -7,6 +7,11 @@ import math
 import time
 from typing import Dict, List, Sequence, Tuple
 
+try:
+    from ..heuristics import heuristic_table
+except ImportError:
+    from heuristics import heuristic_table
+
 Coord = Tuple[int, int]
 Grid = Sequence[Sequence[object]]
 
@@ -34,10 +39,6 @@ def _validate_grid(grid: Grid) -> Tuple[int, int]:
     return len(grid), row_len
 
 
-def _manhattan(a: Coord, b: Coord) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-
 def _reconstruct_path(came_from: Dict[Coord, Coord], current: Coord) -> List[Coord]:
     path = [current]
     while current in came_from:
@@ -81,10 +82,11 @@ def plan_weighted_astar(
         raise ValueError("start and goal must be on free cells")
 
     t0 = time.perf_counter()
+    h_table = heuristic_table("manhattan", (rows, cols), goal)
 
     # (f_score, tie_breaker, g_score, node)
     open_heap: List[Tuple[float, int, int, Coord]] = [
-        (weight * _manhattan(start, goal), 0, 0, start)
+        (weight * h_table[start[0] * cols + start[1]], 0, 0, start)
     ]
     tie = 1
     came_from: Dict[Coord, Coord] = {}
@@ -120,7 +122,7 @@ def plan_weighted_astar(
             if tentative_g < g_score.get(neighbor, math.inf):
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g
-                f = tentative_g + weight * _manhattan(neighbor, goal)
+                f = tentative_g + weight * h_table[neighbor[0] * cols + neighbor[1]]
                 heapq.heappush(open_heap, (f, tie, tentative_g, neighbor))
                 tie += 1
 
@@ -13,6 +13,11 @@ from math import inf
 from time import perf_counter
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+try:
+    from ..heuristics import heuristic_table
+except ImportError:
+    from heuristics import heuristic_table
+
 Grid = Sequence[Sequence[object]]
 Point = Tuple[int, int]
 Path = List[Point]
@@ -33,10 +38,6 @@ def _is_free_cell(cell: object) -> bool:
         return not bool(cell)
 
 
-def _manhattan(a: Point, b: Point) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-
 def _neighbors(point: Point, rows: int, cols: int) -> Iterable[Point]:
     r, c = point
     for dr, dc in ((-1, 0), (0, 1), (1, 0), (0, -1)):
@@ -174,8 +175,11 @@ def plan_bidirectional_astar(
     parent_forward: Dict[Point, Optional[Point]] = {start_pt: None}
     parent_backward: Dict[Point, Optional[Point]] = {goal_pt: None}
 
-    push(open_forward, start_pt, 0.0, float(_manhattan(start_pt, goal_pt)))
-    push(open_backward, goal_pt, 0.0, float(_manhattan(goal_pt, start_pt)))
+    # Forward search aims at the goal, backward search aims at the start.
+    h_forward = heuristic_table("manhattan", (rows, cols), goal_pt)
+    h_backward = heuristic_table("manhattan", (rows, cols), start_pt)
+    push(open_forward, start_pt, 0.0, h_forward[start_pt[0] * cols + start_pt[1]])
+    push(open_backward, goal_pt, 0.0, h_backward[goal_pt[0] * cols + goal_pt[1]])
     metrics["nodes_generated"] = 2
 
     best_cost = inf
@@ -231,7 +235,7 @@ def plan_bidirectional_astar(
                 if tentative < g_forward.get(nxt, inf):
                     g_forward[nxt] = tentative
                     parent_forward[nxt] = current
-                    push(open_forward, nxt, tentative, float(_manhattan(nxt, goal_pt)))
+                    push(open_forward, nxt, tentative, h_forward[nxt[0] * cols + nxt[1]])
 
                 other = g_backward.get(nxt)
                 if other is not None:
@@ -258,7 +262,7 @@ def plan_bidirectional_astar(
                 if tentative < g_backward.get(nxt, inf):
                     g_backward[nxt] = tentative
                     parent_backward[nxt] = current
-                    push(open_backward, nxt, tentative, float(_manhattan(nxt, start_pt)))
+                    push(open_backward, nxt, tentative, h_backward[nxt[0] * cols + nxt[1]])
 
                 other = g_forward.get(nxt)
                 if other is not None:
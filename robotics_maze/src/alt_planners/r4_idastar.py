@@ -12,6 +12,11 @@ from math import inf
 from time import perf_counter
 from typing import Dict, List, Sequence, Set, Tuple, Union
 
+try:
+    from ..heuristics import heuristic_table
+except ImportError:
+    from heuristics import heuristic_table
+
 Coord = Tuple[int, int]
 Grid = Sequence[Sequence[object]]
 SearchResult = Union[float, str]
@@ -20,10 +25,6 @@ _FOUND = "FOUND"
 _MOVES: Tuple[Coord, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
 
 
-def _heuristic(a: Coord, b: Coord) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-
 def _grid_shape(grid: Grid) -> Tuple[int, int]:
     if not grid:
         raise ValueError("grid cannot be empty")
@@ -59,17 +60,17 @@ def _is_blocked(grid: Grid, node: Coord) -> bool:
 def _ordered_neighbors(
     grid: Grid,
     node: Coord,
-    goal: Coord,
+    h_table: Sequence[float],
     rows: int,
     cols: int,
 ) -> List[Coord]:
-    ranked: List[Tuple[int, int, int, Coord]] = []
+    ranked: List[Tuple[float, int, int, Coord]] = []
     r, c = node
     for dr, dc in _MOVES:
         nxt = (r + dr, c + dc)
         if not _in_bounds(nxt, rows, cols) or _is_blocked(grid, nxt):
             continue
-        ranked.append((_heuristic(nxt, goal), nxt[0], nxt[1], nxt))
+        ranked.append((h_table[nxt[0] * cols + nxt[1]], nxt[0], nxt[1], nxt))
     ranked.sort()
     return [item[-1] for item in ranked]
 
@@ -123,11 +124,12 @@ def plan_idastar(grid: Grid, start: Coord, goal: Coord) -> Tuple[List[Coord], Di
         metrics["elapsed_ms"] = runtime_ms
         return [start], metrics
 
+    h_table = heuristic_table("manhattan", (rows, cols), goal)
     path: List[Coord] = [start]
     in_path: Set[Coord] = {start}
 
     def _search(node: Coord, g_cost: int, threshold: float) -> SearchResult:
-        f_cost = g_cost + _heuristic(node, goal)
+        f_cost = g_cost + h_table[node[0] * cols + node[1]]
         if f_cost > threshold:
             return float(f_cost)
         if node == goal:
@@ -137,7 +139,7 @@ def plan_idastar(grid: Grid, start: Coord, goal: Coord) -> Tuple[List[Coord], Di
         metrics["max_depth"] = max(int(metrics["max_depth"]), g_cost)
         next_threshold = inf
 
-        for neighbor in _ordered_neighbors(grid, node, goal, rows, cols):
+        for neighbor in _ordered_neighbors(grid, node, h_table, rows, cols):
             metrics["generated_nodes"] = int(metrics["generated_nodes"]) + 1
             if neighbor in in_path:
                 continue
@@ -154,7 +156,7 @@ def plan_idastar(grid: Grid, start: Coord, goal: Coord) -> Tuple[List[Coord], Di
 
         return next_threshold
 
-    threshold = float(_heuristic(start, goal))
+    threshold = float(h_table[start[0] * cols + start[1]])
     while True:
         metrics["iterations"] = int(metrics["iterations"]) + 1
         cast_thresholds = metrics["threshold_history"]
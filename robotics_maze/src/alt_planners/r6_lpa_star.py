@@ -215,6 +215,13 @@ class _LPAStarPlanner:
 _CACHE: Optional[_LPAStarPlanner] = None
 
 
+def reset_lpa_star_state() -> None:
+    """Drop the cached planner so the next call starts cold."""
+
+    global _CACHE
+    _CACHE = None
+
+
 def _normalize_grid(grid: GridLike) -> List[List[bool]]:
     if not grid:
         raise ValueError("grid must not be empty")
@@ -313,4 +320,11 @@ def plan_lpa_star(grid: GridLike, start: Node, goal: Node) -> Tuple[List[Node],
     return path, metrics
 
 
-__all__ = ["plan_lpa_star"]
+# Results depend on the previous call's tree, so parallel benchmark runs must
+# keep this planner's trials in maze order within a single worker.
+plan_lpa_star.reuses_state = True  # type: ignore[attr-defined]
+# Lets the benchmark start every run (and every worker) from a cold cache.
+plan_lpa_star.reset_state = reset_lpa_star_state  # type: ignore[attr-defined]
+
+
+__all__ = ["plan_lpa_star", "reset_lpa_star_state"]
@@ -10,16 +10,17 @@ from math import inf
 from time import perf_counter
 from typing import Dict, List, Optional, Sequence, Tuple
 
+try:
+    from ..heuristics import heuristic_table
+except ImportError:
+    from heuristics import heuristic_table
+
 Coord = Tuple[int, int]
 Grid = Sequence[Sequence[int]]
 
 _CARDINAL_STEPS: Tuple[Coord, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
 
 
-def _manhattan(a: Coord, b: Coord) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-
 def _in_bounds(rows: int, cols: int, node: Coord) -> bool:
     return 0 <= node[0] < rows and 0 <= node[1] < cols
 
@@ -111,6 +112,7 @@ def plan_beam_search(
             "optimality_guaranteed": False,
         }
 
+    h_table = heuristic_table("manhattan", (rows, cols), goal)
     parents: Dict[Coord, Optional[Coord]] = {start: None}
     g_score: Dict[Coord, int] = {start: 0}
     beam: List[Coord] = [start]
@@ -121,7 +123,7 @@ def plan_beam_search(
     found_goal = False
 
     while beam and not found_goal:
-        candidate_scores: Dict[Coord, Tuple[int, int, int, int, int]] = {}
+        candidate_scores: Dict[Coord, Tuple[float, float, int, int, int]] = {}
 
         for node in beam:
             expanded_nodes += 1
@@ -144,7 +146,7 @@ def plan_beam_search(
                     found_goal = True
                     break
 
-                h = _manhattan(nxt, goal)
+                h = h_table[nxt[0] * cols + nxt[1]]
                 rank = (new_g + h, h, new_g, nxt[0], nxt[1])
                 prev = candidate_scores.get(nxt)
                 if prev is None or rank < prev:
@@ -12,6 +12,11 @@ from math import inf
 from time import perf_counter
 from typing import Dict, List, Sequence, Tuple
 
+try:
+    from ..heuristics import heuristic_table
+except ImportError:
+    from heuristics import heuristic_table
+
 Coord = Tuple[int, int]
 Grid = Sequence[Sequence[object]]
 
@@ -44,10 +49,6 @@ def _is_blocked(cell: object) -> bool:
     return bool(cell)
 
 
-def _manhattan(a: Coord, b: Coord) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-
 def _reconstruct_path(came_from: Dict[Coord, Coord], goal: Coord) -> List[Coord]:
     path: List[Coord] = [goal]
     node = goal
@@ -109,7 +110,8 @@ def plan_fringe_search(
         metrics["elapsed_ms"] = (perf_counter() - started) * 1000.0
         return [start], metrics
 
-    threshold = float(_manhattan(start, goal))
+    h_table = heuristic_table("manhattan", (rows, cols), goal)
+    threshold = float(h_table[start[0] * cols + start[1]])
     cast_thresholds = metrics["threshold_history"]
     assert isinstance(cast_thresholds, list)
     cast_thresholds.append(threshold)
@@ -138,7 +140,7 @@ def plan_fringe_search(
             if queued_g != current_g:
                 continue
 
-            f_cost = current_g + _manhattan(node, goal)
+            f_cost = current_g + h_table[node[0] * cols + node[1]]
             if f_cost > threshold:
                 later.append((node, current_g))
                 if f_cost < f_min:
@@ -175,7 +177,7 @@ def plan_fringe_search(
                 metrics["generated_nodes"] = int(metrics["generated_nodes"]) + 1
 
                 neighbor_state = (neighbor, tentative_g)
-                neighbor_f = tentative_g + _manhattan(neighbor, goal)
+                neighbor_f = tentative_g + h_table[neighbor[0] * cols + neighbor[1]]
                 if neighbor_f <= threshold:
                     now.append(neighbor_state)
                     metrics["max_now_size"] = max(int(metrics["max_now_size"]), len(now))
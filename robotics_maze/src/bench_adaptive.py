@@ -0,0 +1,119 @@
+"""Adaptive sampling: grow a benchmark in batches of mazes until its ranking settles."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+import bench_stats
+import benchmark
+from trial_store import TrialResult
+
+
+# Why `run_adaptive_benchmark` stopped adding mazes.
+ADAPTIVE_STOP_REASONS: tuple[str, ...] = ("settled", "max_mazes", "time_budget")
+
+
+@dataclass(frozen=True)
+class AdaptiveOutcome:
+    """How many mazes an adaptive run used and why it stopped."""
+
+    maze_count: int
+    batches: int
+    stop_reason: str
+    elapsed_s: float
+    # Adjacent planners in the final rank order whose CIs still overlap.
+    unsettled_pairs: tuple[tuple[str, str], ...] = ()
+
+    def describe(self) -> str:
+        if self.stop_reason == "settled":
+            reason = "rank order settled"
+        else:
+            reason = "maze cap reached" if self.stop_reason == "max_mazes" else "time budget ran out"
+            if self.unsettled_pairs:
+                overlapping = ", ".join(f"{upper} ~ {lower}" for upper, lower in self.unsettled_pairs)
+                reason += f" with CIs still overlapping ({overlapping})"
+        return f"{self.maze_count} mazes in {self.batches} batch(es), {self.elapsed_s:.1f} s; {reason}"
+
+
+def run_adaptive_benchmark(
+    planners: Mapping[str, benchmark.PlannerFn] | None = None,
+    *,
+    batch_mazes: int = 10,
+    max_mazes: int = 1000,
+    time_budget_s: float | None = None,
+    confidence: float = bench_stats.DEFAULT_CONFIDENCE,
+    completed_trials: Sequence[TrialResult] = (),
+    **run_options: Any,
+) -> tuple[list[TrialResult], list[dict[str, Any]], AdaptiveOutcome]:
+    """Add mazes in batches of `batch_mazes` until the planner ranking is settled.
+
+    After each batch the summary is recomputed over every maze so far. The
+    run stops once the rank order is settled: every pair of adjacent planners
+    is told apart by success rate or by non-overlapping `confidence` CIs
+    (see `benchmark.unsettled_rank_pairs`), and the order matches the
+    previous batch's. It also stops at `max_mazes`, or when `time_budget_s`
+    of wall-clock time is spent or the next batch (estimated from the last
+    one) would exceed it.
+
+    Remaining keyword arguments go to `benchmark.run_benchmark`. Each batch
+    is one `run_benchmark` call over just its new mazes (`first_maze`), with
+    the earlier trials passed in for the summary. Planners that reuse state
+    across mazes therefore start every batch from a reset cache.
+    """
+    if batch_mazes < 1:
+        raise ValueError("batch_mazes must be >= 1.")
+    if max_mazes < 1:
+        raise ValueError("max_mazes must be >= 1.")
+    if time_budget_s is not None and time_budget_s <= 0:
+        raise ValueError("time_budget_s must be > 0.")
+    if not run_options.get("keep_trials", True) or run_options.get("shard") is not None:
+        raise ValueError("Adaptive runs need keep_trials=True and no shard.")
+    started = time.perf_counter()
+    trials = list(completed_trials)
+    summary_rows: list[dict[str, Any]] = []
+    previous_order: list[str] | None = None
+    maze_count = max((t.maze_index + 1 for t in trials), default=0)
+    batches = 0
+    while True:
+        batch_started = time.perf_counter()
+        # The first batch also fills any gaps in `completed_trials`.
+        first_maze = maze_count if batches else 0
+        maze_count = min(maze_count + batch_mazes, max_mazes)
+        trials, summary_rows = benchmark.run_benchmark(
+            planners=planners,
+            maze_count=maze_count,
+            completed_trials=trials,
+            confidence=confidence,
+            first_maze=first_maze,
+            **run_options,
+        )
+        batches += 1
+        now = time.perf_counter()
+        order = [str(row["planner"]) for row in summary_rows]
+        unsettled = benchmark.unsettled_rank_pairs(summary_rows)
+        if not unsettled and order == previous_order:
+            stop_reason = "settled"
+        elif maze_count >= max_mazes:
+            stop_reason = "max_mazes"
+        elif time_budget_s is not None and (now - started) + (now - batch_started) > time_budget_s:
+            stop_reason = "time_budget"
+        else:
+            previous_order = order
+            continue
+        outcome = AdaptiveOutcome(
+            maze_count=maze_count,
+            batches=batches,
+            stop_reason=stop_reason,
+            elapsed_s=now - started,
+            unsettled_pairs=tuple(unsettled),
+        )
+        return trials, summary_rows, outcome
+
+
+__all__ = [
+    "ADAPTIVE_STOP_REASONS",
+    "AdaptiveOutcome",
+    "run_adaptive_benchmark",
+]
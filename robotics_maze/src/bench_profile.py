@@ -0,0 +1,223 @@
+"""Per-planner profiling hooks for the benchmark harness.
+
+`PlannerProfiler` wraps planner calls in one of two profilers and keeps the
+results separate per planner:
+
+- `cprofile`: deterministic `cProfile`, one profile per planner. Writes a
+  `.pstats` file plus collapsed stacks rebuilt from the caller graph (each
+  function's self time is attributed along its heaviest caller chain, since
+  cProfile does not record full stacks).
+- `sample`: a background thread samples the calling thread's stack every
+  `sample_interval_s`, giving true collapsed stacks with lower overhead but
+  no call counts.
+
+Collapsed-stack files (`<planner>.collapsed`, one `frame;frame;leaf weight`
+line per stack) load directly into flamegraph.pl, speedscope or inferno.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+import cProfile
+from pathlib import Path
+import pstats
+import re
+import sys
+import threading
+from types import FrameType
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+PROFILE_MODES: Tuple[str, ...] = ("cprofile", "sample")
+DEFAULT_SAMPLE_INTERVAL_S = 0.0002
+
+T = TypeVar("T")
+FunctionKey = Tuple[str, int, str]
+
+
+def _label(filename: str, name: str) -> str:
+    """Flamegraph-safe frame label: `module:function` (no `;` or spaces)."""
+
+    module = Path(filename).stem if filename not in {"~", ""} else "builtins"
+    return re.sub(r"[;\s]+", "_", f"{module}:{name}")
+
+
+def _code_label(code: Any) -> str:
+    return _label(code.co_filename, getattr(code, "co_qualname", code.co_name))
+
+
+def _safe_filename(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name) or "planner"
+
+
+class PlannerProfiler:
+    """Profile planner calls, keyed by planner name."""
+
+    def __init__(self, mode: str = "cprofile", *, sample_interval_s: float = DEFAULT_SAMPLE_INTERVAL_S) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unsupported profile mode '{mode}'. Expected one of {list(PROFILE_MODES)}.")
+        if sample_interval_s <= 0:
+            raise ValueError("sample_interval_s must be > 0.")
+        self.mode = mode
+        self.sample_interval_s = sample_interval_s
+        self.calls: Counter[str] = Counter()
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._samples: Dict[str, Counter[Tuple[str, ...]]] = defaultdict(Counter)
+
+    @property
+    def unit(self) -> str:
+        return "ms" if self.mode == "cprofile" else "samples"
+
+    def planners(self) -> List[str]:
+        return sorted(self.calls)
+
+    def profile(self, planner_name: str, call: Callable[[], T]) -> T:
+        """Run `call` under this profiler and attribute it to `planner_name`."""
+
+        self.calls[planner_name] += 1
+        if self.mode == "cprofile":
+            profile = self._profiles.setdefault(planner_name, cProfile.Profile())
+            return profile.runcall(call)
+        return self._sampled_call(self._samples[planner_name], call)
+
+    def _sampled_call(self, counts: Counter[Tuple[str, ...]], call: Callable[[], T]) -> T:
+        target = threading.get_ident()
+        boundary: List[FrameType] = []
+        stop = threading.Event()
+
+        def planner_region() -> T:
+            # Stacks are trimmed at this frame, which holds nothing but the
+            # planner call, so time spent joining the sampler is never charged.
+            boundary.append(sys._getframe())
+            return call()
+
+        def sample() -> None:
+            while not stop.wait(self.sample_interval_s):
+                frame = sys._current_frames().get(target)
+                if not boundary or stop.is_set():
+                    continue
+                stack: List[str] = []
+                while frame is not None and frame is not boundary[0]:
+                    stack.append(_code_label(frame.f_code))
+                    frame = frame.f_back
+                if frame is not None and stack and not stop.is_set():
+                    counts[tuple(reversed(stack))] += 1
+
+        # The sampler only runs when the GIL switches, so switch at least as
+        # often as we want samples.
+        previous_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(previous_interval, self.sample_interval_s))
+        sampler = threading.Thread(target=sample, name="planner-sampler", daemon=True)
+        sampler.start()
+        try:
+            return planner_region()
+        finally:
+            stop.set()
+            sampler.join()
+            sys.setswitchinterval(previous_interval)
+
+    def _stats(self, planner_name: str) -> Dict[FunctionKey, Any]:
+        profile = self._profiles.get(planner_name)
+        if profile is None:
+            return {}
+        stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+        # `runcall` records the profiler's own `disable()` call; drop it.
+        return {key: value for key, value in stats.items() if "_lsprof.Profiler" not in key[2]}
+
+    def collapsed_stacks(self, planner_name: str) -> Dict[str, int]:
+        """`{"root;...;leaf": weight}`: microseconds of self time or sample counts."""
+
+        if self.mode == "sample":
+            return {";".join(stack): count for stack, count in self._samples.get(planner_name, {}).items()}
+        stats = self._stats(planner_name)
+        stacks: Counter[str] = Counter()
+        for function, (_, _, self_time, _, _) in stats.items():
+            weight = round(self_time * 1e6)
+            if weight <= 0:
+                continue
+            chain = [function]
+            seen = {function}
+            while True:
+                callers = [
+                    (caller, timing[3])
+                    for caller, timing in stats[chain[-1]][4].items()
+                    if caller in stats and caller not in seen
+                ]
+                if not callers:
+                    break
+                caller = max(callers, key=lambda item: item[1])[0]
+                chain.append(caller)
+                seen.add(caller)
+            stacks[";".join(_label(key[0], key[2]) for key in reversed(chain))] += weight
+        return dict(stacks)
+
+    def top_functions(self, planner_name: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Hottest functions by self cost: `function`, `self`, `total` (in `unit`) and `calls`."""
+
+        rows: List[Dict[str, Any]] = []
+        if self.mode == "cprofile":
+            for (filename, _, name), (_, call_count, self_time, total_time, _) in self._stats(planner_name).items():
+                rows.append(
+                    {
+                        "function": _label(filename, name),
+                        "self": self_time * 1000.0,
+                        "total": total_time * 1000.0,
+                        "calls": call_count,
+                    }
+                )
+        else:
+            leaf_counts: Counter[str] = Counter()
+            total_counts: Counter[str] = Counter()
+            for stack, count in self._samples.get(planner_name, {}).items():
+                leaf_counts[stack[-1]] += count
+                for function in set(stack):
+                    total_counts[function] += count
+            rows = [
+                {"function": function, "self": float(leaf_counts[function]), "total": float(count), "calls": None}
+                for function, count in total_counts.items()
+            ]
+        rows.sort(key=lambda row: (-row["self"], -row["total"], row["function"]))
+        return rows[:limit]
+
+    def write(self, output_dir: Path) -> List[Path]:
+        """Write `<planner>.pstats` (cprofile only) and `<planner>.collapsed` per planner.
+
+        Planners with no recorded stacks (in `sample` mode, every call ended
+        before the first sample) get a warning instead of an empty
+        `.collapsed` file.
+        """
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        written: List[Path] = []
+        for planner_name in self.planners():
+            stem = _safe_filename(planner_name)
+            profile = self._profiles.get(planner_name)
+            if profile is not None:
+                stats_path = output_dir / f"{stem}.pstats"
+                profile.dump_stats(str(stats_path))
+                written.append(stats_path)
+            stacks = self.collapsed_stacks(planner_name)
+            if not stacks:
+                reason = (
+                    f"its calls may be shorter than the {self.sample_interval_s * 1000:g} ms sample interval"
+                    if self.mode == "sample"
+                    else "its profiled self time rounds to zero"
+                )
+                print(
+                    f"[WARN] No stacks recorded for {planner_name} over {self.calls[planner_name]} call(s); "
+                    f"{reason}. Skipping its .collapsed file."
+                )
+                continue
+            collapsed_path = output_dir / f"{stem}.collapsed"
+            collapsed_path.write_text(
+                "".join(f"{stack} {weight}\n" for stack, weight in sorted(stacks.items())),
+                encoding="utf-8",
+            )
+            written.append(collapsed_path)
+        return written
+
+
+__all__ = [
+    "DEFAULT_SAMPLE_INTERVAL_S",
+    "PROFILE_MODES",
+    "PlannerProfiler",
+]
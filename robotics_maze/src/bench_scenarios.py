@@ -0,0 +1,372 @@
+"""Dynamic-map scenario benchmark: replay `scenarios` to planners and report replan costs.
+
+Every planner answers a scenario's base query and then one replanning query
+per occupancy update, in order, so incremental planners (r6 LPA*) can reuse
+their search state. Results go to `scenario_results.csv` and
+`scenario_summary.md`; the trial loop helpers come from `benchmark`.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import mean
+from typing import Any, Iterable, Mapping, Sequence
+
+import bench_stats
+import benchmark
+import scenarios as scenario_mod
+from workspace import PlannerWorkspace
+
+
+@dataclass(frozen=True)
+class ScenarioTrialResult:
+    """One planner replaying one dynamic scenario (see `scenarios`)."""
+
+    planner: str
+    scenario_index: int
+    kind: str
+    maze_seed: int
+    width: int
+    height: int
+    # Latency of the first query (base grid) and of every replan after an update.
+    initial_ms: float
+    update_times_ms: tuple[float, ...]
+    # Replans that reused search state (`reused_tree` in the planner's metrics)
+    # versus full searches; planners without incremental state always search fully.
+    reused_updates: int
+    full_resets: int
+    # Queries answered wrongly: no valid path although one exists.
+    failed_queries: int
+    expansions: int | None
+
+    @property
+    def cumulative_ms(self) -> float:
+        return self.initial_ms + math.fsum(self.update_times_ms)
+
+
+SCENARIO_CSV_COLUMNS: tuple[str, ...] = (
+    "planner",
+    "scenario_index",
+    "kind",
+    "maze_seed",
+    "width",
+    "height",
+    "updates",
+    "initial_ms",
+    "cumulative_ms",
+    "mean_update_ms",
+    "reused_updates",
+    "full_resets",
+    "failed_queries",
+    "expansions",
+    "update_times_ms",
+)
+
+
+def _planner_metrics(result: Any) -> Mapping[str, Any]:
+    if isinstance(result, tuple) and len(result) >= 2 and isinstance(result[1], Mapping):
+        return result[1]
+    if isinstance(result, Mapping):
+        return result
+    return {}
+
+
+def _replay_scenario(
+    planner_name: str,
+    planner_fn: benchmark.PlannerFn,
+    call_kwargs: Mapping[str, Any],
+    scenario: scenario_mod.Scenario,
+    *,
+    scenario_index: int,
+    maze_seed: int,
+    width: int,
+    height: int,
+) -> ScenarioTrialResult:
+    """Feed the scenario's queries to one planner in order, timing each call.
+
+    The planner's cached state is reset first, so the initial query is cold.
+    """
+    benchmark._reset_planner_state([(planner_name, planner_fn)])
+    times_ms: list[float] = []
+    reused = 0
+    failed = 0
+    total_expansions: int | None = None
+    for query_index, query_grid in enumerate(scenario.queries()):
+        started = time.perf_counter()
+        try:
+            result = planner_fn(benchmark._copy_grid(query_grid), scenario.start, scenario.goal, **call_kwargs)
+        except Exception:
+            result = None
+        times_ms.append((time.perf_counter() - started) * 1000.0)
+        reported_success, path, expansions = benchmark._normalize_planner_output(result, scenario.start, scenario.goal)
+        valid_path, _, _ = benchmark._validate_and_measure_path(
+            grid=query_grid, path=path, start=scenario.start, goal=scenario.goal
+        )
+        if scenario.solvable[query_index] and not (reported_success and valid_path):
+            failed += 1
+        if query_index > 0 and _planner_metrics(result).get("reused_tree"):
+            reused += 1
+        if expansions is not None:
+            total_expansions = (total_expansions or 0) + expansions
+    return ScenarioTrialResult(
+        planner=planner_name,
+        scenario_index=scenario_index,
+        kind=scenario.kind,
+        maze_seed=maze_seed,
+        width=width,
+        height=height,
+        initial_ms=times_ms[0],
+        update_times_ms=tuple(times_ms[1:]),
+        reused_updates=reused,
+        full_resets=len(scenario.updates) - reused,
+        failed_queries=failed,
+        expansions=total_expansions,
+    )
+
+
+def run_scenario_benchmark(
+    planners: Mapping[str, benchmark.PlannerFn] | None = None,
+    kinds: Sequence[str] = scenario_mod.SCENARIO_KINDS,
+    scenario_count: int = 5,
+    width: int = 15,
+    height: int = 15,
+    seed: int = 7,
+    algorithm: str = "backtracker",
+    steps: int = 20,
+) -> tuple[list[ScenarioTrialResult], list[dict[str, Any]]]:
+    """Replay dynamic-map scenarios to every planner as successive queries.
+
+    For each kind, scenario `i` perturbs the benchmark maze of seed `seed + i`
+    with `steps` occupancy updates. Every planner answers the base query and
+    then one replanning query per update, in order, so incremental planners
+    can reuse their search state between queries. Planner order rotates per
+    scenario as in `benchmark.run_benchmark`.
+    """
+    if scenario_count < 1:
+        raise ValueError("scenario_count must be >= 1.")
+    unknown = sorted(set(kinds) - set(scenario_mod.SCENARIO_KINDS))
+    if unknown or not kinds:
+        raise ValueError(
+            f"Unsupported scenario kind(s) {unknown}. Expected some of {list(scenario_mod.SCENARIO_KINDS)}."
+        )
+    if planners is None:
+        planners = benchmark._resolve_default_benchmark_planners(benchmark.load_available_planners(include_alt=True))
+    planner_items = sorted(planners.items(), key=lambda item: item[0])
+    if not planner_items:
+        raise ValueError("At least one planner is required.")
+    planner_kwargs = benchmark._planner_call_kwargs(planner_items, PlannerWorkspace())
+
+    results: list[ScenarioTrialResult] = []
+    for kind in kinds:
+        for scenario_index in range(scenario_count):
+            maze_seed = seed + scenario_index
+            grid, start, goal = benchmark.generate_benchmark_maze(
+                width=width, height=height, seed=maze_seed, algorithm=algorithm
+            )
+            scenario = scenario_mod.generate_scenario(kind, grid, start, goal, steps=steps, seed=maze_seed)
+            offset = scenario_index % len(planner_items)
+            for planner_name, planner_fn in planner_items[offset:] + planner_items[:offset]:
+                results.append(
+                    _replay_scenario(
+                        planner_name,
+                        planner_fn,
+                        planner_kwargs[planner_name],
+                        scenario,
+                        scenario_index=scenario_index,
+                        maze_seed=maze_seed,
+                        width=width,
+                        height=height,
+                    )
+                )
+    return results, summarize_scenarios(results)
+
+
+def summarize_scenarios(results: Sequence[ScenarioTrialResult]) -> list[dict[str, Any]]:
+    """Per (kind, planner): replan latency, reuse counts and cumulative time, fastest replan first."""
+    grouped: dict[tuple[str, str], list[ScenarioTrialResult]] = defaultdict(list)
+    for result in results:
+        grouped[(result.kind, result.planner)].append(result)
+    rows: list[dict[str, Any]] = []
+    for (kind, planner_name), planner_results in grouped.items():
+        update_times = [value for result in planner_results for value in result.update_times_ms]
+        updates = len(update_times)
+        reused = sum(result.reused_updates for result in planner_results)
+        spread = bench_stats.timing_summary(update_times)
+        rows.append(
+            {
+                "kind": kind,
+                "planner": planner_name,
+                "scenarios": len(planner_results),
+                "updates": updates,
+                "mean_initial_ms": mean(result.initial_ms for result in planner_results),
+                "mean_update_ms": mean(update_times) if update_times else math.nan,
+                "median_update_ms": spread["median"],
+                "p95_update_ms": spread["p95"],
+                "reused_updates": reused,
+                "full_resets": sum(result.full_resets for result in planner_results),
+                "reuse_rate": reused / updates if updates else 0.0,
+                "mean_cumulative_ms": mean(result.cumulative_ms for result in planner_results),
+                "failed_queries": sum(result.failed_queries for result in planner_results),
+            }
+        )
+    rows.sort(
+        key=lambda row: (
+            row["kind"],
+            row["failed_queries"],
+            benchmark._rank_metric(row["mean_update_ms"]),
+            row["planner"],
+        )
+    )
+    return rows
+
+
+def write_scenario_csv(results: Iterable[ScenarioTrialResult], output_path: Path) -> Path:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(SCENARIO_CSV_COLUMNS)
+        for result in results:
+            updates = len(result.update_times_ms)
+            writer.writerow(
+                [
+                    result.planner,
+                    result.scenario_index,
+                    result.kind,
+                    result.maze_seed,
+                    result.width,
+                    result.height,
+                    updates,
+                    f"{result.initial_ms:.6f}",
+                    f"{result.cumulative_ms:.6f}",
+                    f"{math.fsum(result.update_times_ms) / updates:.6f}" if updates else "",
+                    result.reused_updates,
+                    result.full_resets,
+                    result.failed_queries,
+                    result.expansions if result.expansions is not None else "",
+                    ";".join(f"{value:.6f}" for value in result.update_times_ms),
+                ]
+            )
+    return output_path
+
+
+def _scenario_table(scenario_rows: list[dict[str, Any]]) -> tuple[list[str], list[list[str]]]:
+    headers = [
+        "Scenario",
+        "Planner",
+        "Updates",
+        "Mean Replan (ms)",
+        "p95 Replan (ms)",
+        "Reused / Full",
+        "Initial (ms)",
+        "Cumulative (ms)",
+        "Failed",
+    ]
+    rows = [
+        [
+            str(row["kind"]),
+            str(row["planner"]),
+            str(row["updates"]),
+            benchmark._fmt_metric(float(row["mean_update_ms"])),
+            benchmark._fmt_metric(float(row["p95_update_ms"])),
+            f"{row['reused_updates']} / {row['full_resets']}",
+            benchmark._fmt_metric(float(row["mean_initial_ms"])),
+            benchmark._fmt_metric(float(row["mean_cumulative_ms"])),
+            str(row["failed_queries"]),
+        ]
+        for row in scenario_rows
+    ]
+    return headers, rows
+
+
+def render_console_scenario_table(scenario_rows: list[dict[str, Any]]) -> str:
+    headers, rows = _scenario_table(scenario_rows)
+    alignments = ["left", "left", *["right"] * (len(headers) - 2)]
+    return benchmark._render_text_table(list(zip(headers, alignments)), rows)
+
+
+def write_scenario_markdown(
+    scenario_rows: list[dict[str, Any]],
+    output_path: Path,
+    *,
+    scenario_count: int,
+    width: int,
+    height: int,
+    seed: int,
+    algorithm: str,
+    steps: int,
+) -> Path:
+    headers, rows = _scenario_table(scenario_rows)
+    lines = [
+        "# Dynamic Scenario Benchmark",
+        "",
+        f"- Scenarios per kind: {scenario_count} ({width}x{height} {algorithm} mazes, seed {seed})",
+        f"- Updates per scenario: {steps}",
+        "- Each planner answers the base query, then one replan per occupancy update, in order.",
+        "- Reused counts replans where the planner reported reusing its search tree; "
+        "Failed counts queries without a valid path although one existed.",
+        "",
+        "| " + " | ".join(headers) + " |",
+        "|" + "|".join(["---", "---", *["---:"] * (len(headers) - 2)]) + "|",
+    ]
+    lines += ["| " + " | ".join(row) + " |" for row in rows]
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return output_path
+
+
+def run_scenarios_and_write_reports(
+    planners: Mapping[str, benchmark.PlannerFn] | None = None,
+    kinds: Sequence[str] = scenario_mod.SCENARIO_KINDS,
+    scenario_count: int = 5,
+    width: int = 15,
+    height: int = 15,
+    seed: int = 7,
+    algorithm: str = "backtracker",
+    steps: int = 20,
+    output_dir: Path | str | None = None,
+) -> tuple[list[ScenarioTrialResult], list[dict[str, Any]], Path, Path]:
+    """Run `run_scenario_benchmark` and write `scenario_results.csv` and `scenario_summary.md`."""
+    output_dir = (
+        Path(output_dir)
+        if output_dir is not None
+        else Path(__file__).resolve().parents[1] / "results"
+    )
+    results, scenario_rows = run_scenario_benchmark(
+        planners=planners,
+        kinds=kinds,
+        scenario_count=scenario_count,
+        width=width,
+        height=height,
+        seed=seed,
+        algorithm=algorithm,
+        steps=steps,
+    )
+    csv_path = write_scenario_csv(results, output_dir / "scenario_results.csv")
+    summary_path = write_scenario_markdown(
+        scenario_rows,
+        output_dir / "scenario_summary.md",
+        scenario_count=scenario_count,
+        width=width,
+        height=height,
+        seed=seed,
+        algorithm=algorithm,
+        steps=steps,
+    )
+    return results, scenario_rows, csv_path, summary_path
+
+
+__all__ = [
+    "SCENARIO_CSV_COLUMNS",
+    "ScenarioTrialResult",
+    "render_console_scenario_table",
+    "run_scenario_benchmark",
+    "run_scenarios_and_write_reports",
+    "summarize_scenarios",
+    "write_scenario_csv",
+    "write_scenario_markdown",
+]
@@ -0,0 +1,316 @@
+"""Timing statistics for the benchmark harness.
+
+Small, dependency-light helpers shared by `benchmark.py`:
+
+- `percentile`: linear-interpolated percentile (same convention as
+  `numpy.percentile`'s default) of a list or array of timings.
+- `timing_summary`: min/median/p95/p99 of one sample.
+- `bootstrap_mean_ci`: seeded percentile-bootstrap confidence interval of the
+  mean, so the same benchmark seed always reports the same interval.
+- `intervals_overlap`: whether two intervals can be told apart.
+- `loglog_slope`: empirical scaling exponent (`y ~ x**slope`).
+- `mann_whitney_u`: one-sided rank-sum test for "sample a is slower than b".
+- `RunningMoments` / `QuantileSketch`: constant-memory streaming mean,
+  variance and quantiles for live summaries of long runs.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+import math
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_RESAMPLES = 2000
+# Resamples drawn per NumPy batch; bounds memory to `batch * len(values)` indices.
+_BOOTSTRAP_BATCH = 256
+
+
+def percentile(values: Sequence[float] | np.ndarray, q: float) -> float:
+    """Return the `q`-th percentile (0-100) of `values`, or NaN when empty."""
+
+    if not 0.0 <= q <= 100.0:
+        raise ValueError("q must be within [0, 100]")
+    return _sorted_percentile(np.sort(np.asarray(values, dtype=np.float64)), q)
+
+
+def _sorted_percentile(ordered: np.ndarray, q: float) -> float:
+    if not ordered.size:
+        return math.nan
+    position = (ordered.size - 1) * q / 100.0
+    lower = math.floor(position)
+    upper = min(lower + 1, ordered.size - 1)
+    fraction = position - lower
+    low = float(ordered[lower])
+    return low + (float(ordered[upper]) - low) * fraction
+
+
+def timing_summary(values: Iterable[float] | np.ndarray) -> Dict[str, float]:
+    """Min, median, p95 and p99 of a timing sample (NaN when empty)."""
+
+    sample = values if isinstance(values, np.ndarray) else np.fromiter(values, dtype=np.float64)
+    ordered = np.sort(sample.astype(np.float64, copy=False))
+    return {
+        "min": float(ordered[0]) if ordered.size else math.nan,
+        "median": _sorted_percentile(ordered, 50.0),
+        "p95": _sorted_percentile(ordered, 95.0),
+        "p99": _sorted_percentile(ordered, 99.0),
+    }
+
+
+def bootstrap_mean_ci(
+    values: Sequence[float],
+    *,
+    confidence: float = DEFAULT_CONFIDENCE,
+    resamples: int = DEFAULT_RESAMPLES,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """Percentile-bootstrap confidence interval for the mean of `values`.
+
+    Returns `(nan, nan)` for an empty sample and a zero-width interval for a
+    single value.
+    """
+
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be within (0, 1)")
+    if resamples < 1:
+        raise ValueError("resamples must be >= 1")
+    data = np.asarray(values, dtype=np.float64)
+    if data.size == 0:
+        return math.nan, math.nan
+    if data.size == 1:
+        return float(data[0]), float(data[0])
+
+    rng = np.random.default_rng(seed)
+    means = np.empty(resamples, dtype=np.float64)
+    for first in range(0, resamples, _BOOTSTRAP_BATCH):
+        count = min(_BOOTSTRAP_BATCH, resamples - first)
+        picks = rng.integers(0, data.size, size=(count, data.size))
+        means[first : first + count] = data[picks].mean(axis=1)
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    low, high = np.percentile(means, [tail, 100.0 - tail])
+    return float(low), float(high)
+
+
+def intervals_overlap(a: Tuple[float, float], b: Tuple[float, float]) -> bool:
+    """True when the intervals intersect or either is undefined (NaN)."""
+
+    if any(math.isnan(bound) for bound in (*a, *b)):
+        return True
+    return a[0] <= b[1] and b[0] <= a[1]
+
+
+def loglog_slope(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """Least-squares slope of `log(y)` against `log(x)`.
+
+    Non-positive points are ignored; returns NaN when fewer than two distinct
+    `x` values remain.
+    """
+
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len({x for x, _ in points}) < 2:
+        return math.nan
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance
+
+
+def _average_ranks(values: Sequence[float]) -> Tuple[list, list]:
+    """1-based ranks with ties averaged, plus the size of every tie group."""
+
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties: list = []
+    start = 0
+    while start < len(order):
+        stop = start
+        while stop + 1 < len(order) and values[order[stop + 1]] == values[order[start]]:
+            stop += 1
+        for position in range(start, stop + 1):
+            ranks[order[position]] = (start + stop) / 2.0 + 1.0
+        ties.append(stop - start + 1)
+        start = stop + 1
+    return ranks, ties
+
+
+def mann_whitney_u(
+    a: Sequence[float],
+    b: Sequence[float],
+    *,
+    alternative: str = "greater",
+) -> Tuple[float, float]:
+    """Mann-Whitney U statistic of `a` and its one-sided p-value.
+
+    `alternative="greater"` tests whether values in `a` tend to be larger than
+    in `b` (`"less"` the reverse). Uses the normal approximation with tie and
+    continuity corrections, which is adequate from roughly 8 samples per side.
+    Returns `(nan, 1.0)` when either sample is empty.
+    """
+
+    if alternative not in {"greater", "less"}:
+        raise ValueError("alternative must be 'greater' or 'less'")
+    n1, n2 = len(a), len(b)
+    if not n1 or not n2:
+        return math.nan, 1.0
+    ranks, ties = _average_ranks([*a, *b])
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    tie_term = sum(t**3 - t for t in ties) / (n * (n - 1)) if n > 1 else 0.0
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term)
+    if variance <= 0.0:
+        return u, 1.0
+    centred = u - n1 * n2 / 2.0
+    if alternative == "greater":
+        z = (centred - 0.5) / math.sqrt(variance)
+        return u, 0.5 * math.erfc(z / math.sqrt(2.0))
+    z = (centred + 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(-z / math.sqrt(2.0))
+
+
+class RunningMoments:
+    """Welford's online count, mean and variance, plus min/max."""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (NaN below two values)."""
+
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    def mean_or_nan(self) -> float:
+        return self.mean if self.count else math.nan
+
+    def mean_ci(self, confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float]:
+        """Normal-approximation confidence interval of the mean."""
+
+        if not self.count:
+            return math.nan, math.nan
+        if self.count == 1:
+            return self.mean, self.mean
+        z = math.sqrt(2.0) * _inverse_erf(confidence)
+        half_width = z * math.sqrt(self.variance / self.count)
+        return self.mean - half_width, self.mean + half_width
+
+
+def _inverse_erf(value: float) -> float:
+    """`erf^-1` by Newton iteration; enough for confidence levels in (0, 1)."""
+
+    estimate = 0.0
+    for _ in range(60):
+        error = math.erf(estimate) - value
+        if abs(error) < 1e-15:
+            break
+        estimate -= error / (2.0 / math.sqrt(math.pi) * math.exp(-estimate * estimate))
+    return estimate
+
+
+class QuantileSketch:
+    """Merging t-digest style quantile sketch.
+
+    Values are buffered and periodically merged into centroids whose size is
+    bounded by `4 * n * q * (1 - q) / compression`, so tails stay precise and
+    memory stays `O(compression)`. Below about `2 * compression` values no
+    centroids merge and `quantile` matches `percentile` exactly.
+    """
+
+    def __init__(self, compression: int = 100) -> None:
+        if compression < 10:
+            raise ValueError("compression must be >= 10")
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._means: List[float] = []
+        self._weights: List[float] = []
+        self._buffer: List[float] = []
+
+    def __len__(self) -> int:
+        self._merge()
+        return len(self._means)
+
+    def add(self, value: float) -> None:
+        value = float(value)
+        self._buffer.append(value)
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= 5 * self.compression:
+            self._merge()
+
+    def _merge(self) -> None:
+        if not self._buffer:
+            return
+        points = sorted(zip(self._means + self._buffer, self._weights + [1.0] * len(self._buffer)))
+        self._buffer = []
+        means: List[float] = []
+        weights: List[float] = []
+        closed = 0.0
+        for value, weight in points:
+            if means:
+                merged = weights[-1] + weight
+                q = (closed + merged / 2.0) / self.count
+                if merged <= max(1.0, 4.0 * self.count * q * (1.0 - q) / self.compression):
+                    means[-1] += (value - means[-1]) * weight / merged
+                    weights[-1] = merged
+                    continue
+                closed += weights[-1]
+            means.append(value)
+            weights.append(weight)
+        self._means, self._weights = means, weights
+
+    def quantile(self, q: float) -> float:
+        """Estimated `q`-quantile (0-1), or NaN when empty."""
+
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be within [0, 1]")
+        self._merge()
+        if not self.count:
+            return math.nan
+        # Centroid centres in rank units: a weight-1 centroid sits on its own rank.
+        centres: List[float] = []
+        closed = 0.0
+        for weight in self._weights:
+            centres.append(closed + (weight - 1.0) / 2.0)
+            closed += weight
+        position = q * (self.count - 1)
+        anchors = [0.0, *centres, self.count - 1.0]
+        values = [self.min, *self._means, self.max]
+        index = min(max(bisect_right(anchors, position) - 1, 0), len(anchors) - 2)
+        span = anchors[index + 1] - anchors[index]
+        if span <= 0.0:
+            return values[index + 1]
+        return values[index] + (values[index + 1] - values[index]) * (position - anchors[index]) / span
+
+
+__all__ = [
+    "DEFAULT_CONFIDENCE",
+    "DEFAULT_RESAMPLES",
+    "QuantileSketch",
+    "RunningMoments",
+    "bootstrap_mean_ci",
+    "intervals_overlap",
+    "loglog_slope",
+    "mann_whitney_u",
+    "percentile",
+    "timing_summary",
+]
@@ -0,0 +1,131 @@
+"""Planner parameter sweeps in the benchmark: build variants, mark the Pareto front, report it.
+
+`sweeps` parses the grids and builds each variant; this module checks the
+variants before a run and turns a run's summary into the sweep report
+(`sweep_summary.md`).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+import benchmark
+import sweeps as sweep_mod
+
+
+def build_sweep_variants(
+    grids: Sequence[tuple[str, sweep_mod.ParamGrid]],
+    available: Mapping[str, benchmark.PlannerFn],
+) -> dict[str, benchmark.PlannerFn]:
+    """One planner variant per combination of each planner's parameter grid (see `sweeps`).
+
+    Every variant is tried once on a tiny maze, so a bad value (say an
+    unknown `tie_break`) fails here with the variant's name instead of as
+    failed trials.
+    """
+    grid, start, goal = benchmark.generate_benchmark_maze(width=2, height=2, seed=0)
+    variants: dict[str, benchmark.PlannerFn] = {}
+    for planner_name, param_grid in grids:
+        if planner_name not in available:
+            raise ValueError(f"Unknown planner '{planner_name}' in sweep. Available: {', '.join(sorted(available))}")
+        for params in sweep_mod.expand_grid(param_grid):
+            name = sweep_mod.variant_name(planner_name, params)
+            variant = sweep_mod.make_variant(available[planner_name], params)
+            try:
+                variant(grid, start, goal)
+            except Exception as exc:
+                raise ValueError(f"Planner variant {name} rejected its parameters: {exc}") from exc
+            variants[name] = variant
+    benchmark._reset_planner_state(list(variants.items()))
+    return variants
+
+
+def summarize_sweep(summary_rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mark the summary rows on the Pareto front of time, path length and success rate.
+
+    The objectives are the comparable solve time (lower is better), the
+    comparable path length (lower) and the success rate (higher). Front rows
+    come first, each group in rank order.
+    """
+    ranked_rows = benchmark.rank_summary_rows(summary_rows)
+    on_front = sweep_mod.pareto_front(
+        [
+            (benchmark._comparison_time_ms(row), benchmark._comparison_path_length(row), -float(row["success_rate"]))
+            for row in ranked_rows
+        ]
+    )
+    rows = [{**row, "pareto": front} for row, front in zip(ranked_rows, on_front)]
+    return sorted(rows, key=lambda row: not row["pareto"])
+
+
+def _sweep_table(sweep_rows: list[dict[str, Any]]) -> tuple[list[str], list[list[str]]]:
+    headers = ["Pareto", "Rank", "Planner", "Success Rate", "Comparable Time (ms)", "CI (ms)", "Comparable Path"]
+    rows = [
+        [
+            "yes" if row["pareto"] else "",
+            str(row["rank"]),
+            str(row["planner"]),
+            benchmark._fmt_success(int(row["successes"]), int(row["runs"])),
+            benchmark._fmt_metric(benchmark._comparison_time_ms(row)),
+            benchmark._fmt_ci(row),
+            benchmark._fmt_metric(benchmark._comparison_path_length(row)),
+        ]
+        for row in sweep_rows
+    ]
+    return headers, rows
+
+
+def render_console_sweep_table(sweep_rows: list[dict[str, Any]]) -> str:
+    headers, rows = _sweep_table(sweep_rows)
+    alignments = ["left", "right", "left", *["right"] * (len(headers) - 3)]
+    return benchmark._render_text_table(list(zip(headers, alignments)), rows)
+
+
+def write_sweep_markdown(
+    sweep_rows: list[dict[str, Any]],
+    output_path: Path,
+    *,
+    grids: Sequence[tuple[str, sweep_mod.ParamGrid]],
+    maze_count: int,
+    width: int,
+    height: int,
+    seed: int,
+    algorithm: str,
+    sizes: Sequence[int] | None = None,
+) -> Path:
+    """Write the sweep table; with `sizes`, its rows pool every swept maze size."""
+    headers, rows = _sweep_table(sweep_rows)
+    maze_text = (
+        f"{maze_count} per size ({', '.join(f'{size}x{size}' for size in sorted(set(sizes)))} {algorithm} mazes, "
+        f"seed {seed}; each row pools all sizes)"
+        if sizes
+        else f"{maze_count} ({width}x{height} {algorithm} mazes, seed {seed})"
+    )
+    lines = [
+        "# Planner Parameter Sweep",
+        "",
+        f"- Mazes: {maze_text}",
+        *(
+            f"- Grid `{planner}`: "
+            + "; ".join(f"{name} = {', '.join(map(str, values))}" for name, values in sorted(grid.items()))
+            for planner, grid in grids
+        ),
+        "- Pareto front: configurations no other configuration beats on comparable solve time, comparable path "
+        "length and success rate at once (point estimates; check the CI before preferring a faster one).",
+        "",
+        "| " + " | ".join(headers) + " |",
+        "|" + "|".join(["---", "---:", "---", *["---:"] * (len(headers) - 3)]) + "|",
+    ]
+    lines += ["| " + " | ".join(row) + " |" for row in rows]
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return output_path
+
+
+__all__ = [
+    "build_sweep_variants",
+    "render_console_sweep_table",
+    "summarize_sweep",
+    "write_sweep_markdown",
+]
@@ -4,16 +4,30 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import gc
 import importlib
+import inspect
+import io
+import json
 import math
+import multiprocessing
+import os
+import pickle
+import platform
 import sys
 import time
+import tracemalloc
 from collections import defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from statistics import mean
-from typing import Any, Callable, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Container, Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
 
 # Ensure sibling modules (maze.py, planners.py, alt_planners/*) are importable
 # when benchmark.py is loaded directly from a file path.
@@ -21,13 +35,28 @@ _SRC_DIR = Path(__file__).resolve().parent
 if str(_SRC_DIR) not in sys.path:
     sys.path.insert(0, str(_SRC_DIR))
 
+import bench_profile
+import bench_stats
+import isolation
 import maze as maze_mod
 import planners as baseline_planners
+import queries as query_mod
+import scenarios as scenario_mod
+import shards as shard_mod
+import sweeps as sweep_mod
+import trial_store
+from maze import maze_to_occupancy_grid
+from paths import GridPath
+from trial_store import TrialResult
+from workspace import PlannerWorkspace
+
+if TYPE_CHECKING:  # pragma: no cover
+    import bench_adaptive
 
 Grid = list[list[int]]
 Cell = tuple[int, int]
 PlannerFn = Callable[[Grid, Cell, Cell], Any]
-TrialKey = tuple[int, int, int, int, str]
+TrialKey = tuple[int, int, int, int, str, int]
 
 ALT_PLANNER_SPECS: tuple[tuple[str, str, str], ...] = (
     ("r1_weighted_astar", "alt_planners.r1_weighted_astar", "plan_weighted_astar"),
@@ -41,6 +70,13 @@ ALT_PLANNER_SPECS: tuple[tuple[str, str, str], ...] = (
     ("r9_bidirectional_bfs", "alt_planners.r9_bidirectional_bfs", "plan_bidirectional_bfs"),
 )
 
+# Planners with a per-grid `preprocess` hook (see `_run_maze_trials`). They are
+# discovered but opt-in: select them with --planner.
+INDEXED_PLANNERS: tuple[str, ...] = ("astar_alt",)
+
+# Planner label used for trials solved by the batched multi-maze wavefront.
+BATCHED_PLANNER_NAME = "batched_wavefront"
+
 DEFAULT_BENCHMARK_PLANNERS: tuple[str, ...] = (
     "astar",
     "dijkstra",
@@ -57,26 +93,14 @@ DEFAULT_BENCHMARK_PLANNERS: tuple[str, ...] = (
 )
 
 
-@dataclass(frozen=True)
-class TrialResult:
-    planner: str
-    maze_index: int
-    maze_seed: int
-    width: int
-    height: int
-    algorithm: str
-    success: bool
-    solve_time_ms: float
-    path_length: int | None
-    expansions: int | None
-    error: str | None = None
-
-
 def _copy_grid(grid: Grid) -> Grid:
     return [row[:] for row in grid]
 
 
-def _coerce_path(raw_path: Any) -> list[Cell]:
+def _coerce_path(raw_path: Any) -> list[Cell] | GridPath:
+    if isinstance(raw_path, GridPath):
+        # Cells are already `(int, int)` pairs; keep the compact form.
+        return raw_path
     if not isinstance(raw_path, (list, tuple)):
         return []
     path: list[Cell] = []
@@ -162,9 +186,33 @@ def _bresenham_segment(start: Cell, end: Cell) -> list[Cell]:
     return out
 
 
+def _measure_grid_path(grid: Grid, path: GridPath) -> tuple[bool, int | None, str | None] | None:
+    """Validate a `GridPath` of adjacent cells on its flat indices.
+
+    Returns None when a step is not between distinct 8-neighbors (any-angle
+    segments, repeats), so the caller falls back to rasterizing segments.
+    """
+    rows = len(grid)
+    cols = path.cols
+    limit = rows * cols
+    previous = -1
+    for idx, flat in enumerate(path.flat_indices):
+        if not 0 <= flat < limit:
+            return False, None, f"Path cell out of bounds at index {idx}: {divmod(flat, cols)}."
+        row, col = divmod(flat, cols)
+        if _is_blocked_cell(grid[row][col]):
+            return False, None, f"Path crosses blocked cell at index {idx}: {(row, col)}."
+        if previous >= 0:
+            prev_row, prev_col = divmod(previous, cols)
+            if flat == previous or abs(row - prev_row) > 1 or abs(col - prev_col) > 1:
+                return None
+        previous = flat
+    return True, len(path) - 1, None
+
+
 def _validate_and_measure_path(
     grid: Grid,
-    path: list[Cell],
+    path: list[Cell] | GridPath,
     start: Cell,
     goal: Cell,
 ) -> tuple[bool, int | None, str | None]:
@@ -183,6 +231,11 @@ def _validate_and_measure_path(
         if _is_blocked_cell(grid[cell[0]][cell[1]]):
             return False, None, f"Endpoint {cell} is blocked."
 
+    if isinstance(path, GridPath) and path.cols == cols:
+        measured = _measure_grid_path(grid, path)
+        if measured is not None:
+            return measured
+
     for idx, cell in enumerate(path):
         if not _in_bounds(cell, rows, cols):
             return False, None, f"Path cell out of bounds at index {idx}: {cell}."
@@ -206,9 +259,9 @@ def _validate_and_measure_path(
 
 def _normalize_planner_output(
     result: Any, start: Cell, goal: Cell
-) -> tuple[bool, list[Cell], int | None]:
+) -> tuple[bool, list[Cell] | GridPath, int | None]:
     payload: dict[str, Any] = {}
-    path: list[Cell] = []
+    path: list[Cell] | GridPath = []
 
     if isinstance(result, tuple):
         if len(result) >= 1:
@@ -241,7 +294,7 @@ def _normalize_planner_output(
 
 
 def _trial_key(row: TrialResult) -> TrialKey:
-    return (row.maze_index, row.maze_seed, row.width, row.height, row.algorithm)
+    return (row.maze_index, row.maze_seed, row.width, row.height, row.algorithm, row.query_index)
 
 
 def _safe_import(module_name: str):
@@ -257,7 +310,7 @@ def _safe_import(module_name: str):
 def load_available_planners(include_alt: bool = True) -> dict[str, PlannerFn]:
     planners: dict[str, PlannerFn] = {}
 
-    for name in ("astar", "dijkstra", "greedy_best_first"):
+    for name in ("astar", "dijkstra", "greedy_best_first", *INDEXED_PLANNERS):
         planner_fn = getattr(baseline_planners, name, None)
         if callable(planner_fn):
             planners[name] = planner_fn
@@ -272,9 +325,16 @@ def load_available_planners(include_alt: bool = True) -> dict[str, PlannerFn]:
     return planners
 
 
+def _accepts_workspace(planner_fn: PlannerFn) -> bool:
+    try:
+        return "workspace" in inspect.signature(planner_fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 def _resolve_default_benchmark_planners(available: Mapping[str, PlannerFn]) -> dict[str, PlannerFn]:
     expected = set(DEFAULT_BENCHMARK_PLANNERS)
-    discovered = set(available)
+    discovered = set(available) - set(INDEXED_PLANNERS)
     missing = sorted(expected - discovered)
     unexpected = sorted(discovered - expected)
     if missing or unexpected:
@@ -291,32 +351,6 @@ def _resolve_default_benchmark_planners(available: Mapping[str, PlannerFn]) -> d
     return {name: available[name] for name in DEFAULT_BENCHMARK_PLANNERS}
 
 
-def maze_to_occupancy_grid(maze: Any) -> tuple[Grid, Cell, Cell]:
-    """Convert wall-based maze representation to occupancy grid expected by planners."""
-    width = int(maze.width)
-    height = int(maze.height)
-    grid_rows = 2 * height + 1
-    grid_cols = 2 * width + 1
-    grid: Grid = [[1 for _ in range(grid_cols)] for _ in range(grid_rows)]
-
-    for y in range(height):
-        for x in range(width):
-            row = 2 * y + 1
-            col = 2 * x + 1
-            grid[row][col] = 0
-
-            if x < width - 1 and not maze.has_wall_between((x, y), (x + 1, y)):
-                grid[row][col + 1] = 0
-            if y < height - 1 and not maze.has_wall_between((x, y), (x, y + 1)):
-                grid[row + 1][col] = 0
-
-    start = (2 * int(maze.start[1]) + 1, 2 * int(maze.start[0]) + 1)
-    goal = (2 * int(maze.goal[1]) + 1, 2 * int(maze.goal[0]) + 1)
-    grid[start[0]][start[1]] = 0
-    grid[goal[0]][goal[1]] = 0
-    return grid, start, goal
-
-
 def generate_benchmark_maze(
     width: int,
     height: int,
@@ -332,70 +366,313 @@ def generate_benchmark_maze(
     return maze_to_occupancy_grid(maze)
 
 
-def summarize_trials(trials: list[TrialResult]) -> list[dict[str, Any]]:
-    grouped: dict[str, list[TrialResult]] = defaultdict(list)
-    by_maze_key: dict[TrialKey, dict[str, TrialResult]] = defaultdict(dict)
-    for trial in trials:
-        grouped[trial.planner].append(trial)
-        by_maze_key[_trial_key(trial)][trial.planner] = trial
-
-    planner_count = len(grouped)
-    shared_success_keys = {
-        key
-        for key, planner_trials in by_maze_key.items()
-        if len(planner_trials) == planner_count and all(row.success for row in planner_trials.values())
-    }
+def _mean_or_nan(values: np.ndarray) -> float:
+    return math.fsum(values.tolist()) / values.size if values.size else math.nan
+
+
+def summarize_trials(
+    trials: Iterable[TrialResult] | trial_store.TrialColumns | Path | str,
+    *,
+    seed: int = 0,
+    confidence: float = bench_stats.DEFAULT_CONFIDENCE,
+    resamples: int = bench_stats.DEFAULT_RESAMPLES,
+    cold_timings_ms: Mapping[str, float] | None = None,
+) -> list[dict[str, Any]]:
+    """Aggregate trials per planner.
+
+    Besides means, each row carries min/median/p95/p99 of the per-trial solve
+    times and a seeded bootstrap confidence interval for the comparable solve
+    time (`comparison_ci_low_ms`/`comparison_ci_high_ms`). `cold_timings_ms`
+    (first call per planner, from hygiene pre-warming) is reported as
+    `cold_solve_time_ms` next to the warm `median_solve_time_ms`. Each
+    (maze, query) pair is one trial; `mean_preprocess_ms` is an indexed
+    planner's per-maze preprocessing amortized per query (NaN for others),
+    kept out of the solve times but added to the comparable time and its CI,
+    so indexed and search-from-scratch planners rank on equal terms. Memory
+    columns (`median_peak_memory_bytes`, `max_peak_memory_bytes`,
+    `mean_retained_blocks`) are NaN unless trials were memory-profiled.
+
+    `trials` may also be a columnar `.npz` store path, read chunk by chunk
+    without building `TrialResult` objects, or already-packed columns.
+    """
+    if isinstance(trials, (str, Path)):
+        columns = trial_store.read_columns(Path(trials))
+    elif isinstance(trials, trial_store.TrialColumns):
+        columns = trials
+    else:
+        columns = trial_store.columns_from_trials(trials)
+    if not columns.size:
+        return []
+
+    # Sequential-run order within each planner (size, then maze), whatever
+    # order the trials were stored in; the bootstrap resamples depend on it.
+    order = np.lexsort((columns["maze_index"], columns["width"], columns["height"]))
+    planner_codes = columns["planner"][order]
+    success = columns["success"][order]
+    solve_times = columns["solve_time_ms"][order]
+    path_lengths = columns["path_length"][order]
+    expansions = columns["expansions"][order]
+    peak_memory = columns["peak_memory_bytes"][order]
+    retained_blocks = columns["retained_blocks"][order]
+    preprocess = columns["preprocess_ms"][order]
+    maze_keys = np.stack(
+        [
+            columns[name][order].astype(np.int64)
+            for name in ("maze_index", "maze_seed", "width", "height", "algorithm", "query_index")
+        ],
+        axis=1,
+    )
+    _, key_ids = np.unique(maze_keys, axis=0, return_inverse=True)
+    key_ids = key_ids.reshape(-1)
+    key_count = int(key_ids.max()) + 1
+
+    # A maze counts as shared when every planner ran it and all of them solved it.
+    present_codes = np.unique(planner_codes)
+    code_span = int(present_codes.max()) + 1
+    planner_pairs = np.unique(key_ids * code_span + planner_codes)
+    planners_per_key = np.bincount(planner_pairs // code_span, minlength=key_count)
+    failures_per_key = np.bincount(key_ids, weights=~success, minlength=key_count)
+    shared = ((planners_per_key == present_codes.size) & (failures_per_key == 0))[key_ids]
 
     summary_rows: list[dict[str, Any]] = []
-    for planner_name in sorted(grouped):
-        rows = grouped[planner_name]
-        successes = [row for row in rows if row.success]
-        shared_rows = [row for row in rows if _trial_key(row) in shared_success_keys]
+    for code in sorted(present_codes.tolist(), key=lambda value: columns.planners[value]):
+        planner_name = columns.planners[code]
+        mask = planner_codes == code
+        runs = int(mask.sum())
+        solved = success[mask]
+        successes = int(solved.sum())
+        times = solve_times[mask]
+        shared_rows = shared[mask]
+        shared_times = times[shared_rows]
+        paths = path_lengths[mask]
+        planner_expansions = expansions[mask]
+        peaks = peak_memory[mask]
+        peaks = peaks[peaks != trial_store.MISSING]
+        retained = retained_blocks[mask]
+        planner_preprocess = preprocess[mask]
+        amortized = times + np.nan_to_num(planner_preprocess)
+        spread = bench_stats.timing_summary(times)
+        ci_low, ci_high = bench_stats.bootstrap_mean_ci(
+            amortized[shared_rows] if shared_times.size else amortized,
+            confidence=confidence,
+            resamples=resamples,
+            seed=seed,
+        )
         summary_rows.append(
             {
                 "planner": planner_name,
-                "runs": len(rows),
-                "successes": len(successes),
-                "failures": len(rows) - len(successes),
-                "success_rate": len(successes) / len(rows) if rows else 0.0,
-                "mean_solve_time_ms": mean(row.solve_time_ms for row in rows) if rows else 0.0,
-                "shared_success_maze_count": len(shared_rows),
-                "mean_shared_solve_time_ms": (
-                    mean(row.solve_time_ms for row in shared_rows) if shared_rows else math.nan
-                ),
-                "mean_path_length": (
-                    mean(row.path_length for row in successes if row.path_length is not None)
-                    if successes
-                    else math.nan
-                ),
-                "mean_shared_path_length": (
-                    mean(row.path_length for row in shared_rows if row.path_length is not None)
-                    if shared_rows
-                    else math.nan
-                ),
-                "mean_expansions": (
-                    mean(valid_expansions)
-                    if (
-                        valid_expansions := [
-                            row.expansions for row in successes if row.expansions is not None
-                        ]
-                    )
-                    else math.nan
+                "runs": runs,
+                "successes": successes,
+                "failures": runs - successes,
+                "success_rate": successes / runs,
+                "mean_solve_time_ms": _mean_or_nan(times),
+                "min_solve_time_ms": spread["min"],
+                "median_solve_time_ms": spread["median"],
+                "p95_solve_time_ms": spread["p95"],
+                "p99_solve_time_ms": spread["p99"],
+                "cold_solve_time_ms": float((cold_timings_ms or {}).get(planner_name, math.nan)),
+                "shared_success_maze_count": int(shared_rows.sum()),
+                "mean_shared_solve_time_ms": _mean_or_nan(shared_times),
+                "mean_path_length": _mean_or_nan(paths[solved & (paths != trial_store.MISSING)]),
+                "mean_shared_path_length": _mean_or_nan(paths[shared_rows & (paths != trial_store.MISSING)]),
+                "mean_expansions": _mean_or_nan(
+                    planner_expansions[solved & (planner_expansions != trial_store.MISSING)]
                 ),
+                "comparison_ci_low_ms": ci_low,
+                "comparison_ci_high_ms": ci_high,
+                "ci_confidence": confidence,
+                "median_peak_memory_bytes": bench_stats.percentile(peaks, 50.0),
+                "max_peak_memory_bytes": float(peaks.max()) if peaks.size else math.nan,
+                "mean_retained_blocks": _mean_or_nan(retained[retained != trial_store.MISSING]),
+                "mean_preprocess_ms": _mean_or_nan(planner_preprocess[~np.isnan(planner_preprocess)]),
             }
         )
     return rank_summary_rows(summary_rows)
 
 
+@dataclass
+class _PlannerAggregate:
+    runs: int = 0
+    successes: int = 0
+    solve_time_ms: bench_stats.RunningMoments = field(default_factory=bench_stats.RunningMoments)
+    solve_time_quantiles: bench_stats.QuantileSketch = field(default_factory=bench_stats.QuantileSketch)
+    shared_solve_time_ms: bench_stats.RunningMoments = field(default_factory=bench_stats.RunningMoments)
+    path_length: bench_stats.RunningMoments = field(default_factory=bench_stats.RunningMoments)
+    shared_path_length: bench_stats.RunningMoments = field(default_factory=bench_stats.RunningMoments)
+    expansions: bench_stats.RunningMoments = field(default_factory=bench_stats.RunningMoments)
+    peak_memory_bytes: bench_stats.QuantileSketch = field(default_factory=bench_stats.QuantileSketch)
+    retained_blocks: bench_stats.RunningMoments = field(default_factory=bench_stats.RunningMoments)
+    preprocess_ms: bench_stats.RunningMoments = field(default_factory=bench_stats.RunningMoments)
+
+
+class OnlineTrialSummary:
+    """Incremental per-planner summary, updated one trial at a time.
+
+    Keeps Welford moments and a quantile sketch per planner, so memory is
+    O(planners) rather than O(trials). A maze joins the shared-success set
+    once every planner has reported on it; until then only that maze's
+    pending results are held (mazes a time budget cuts off stay pending).
+    `summary_rows()` can be called mid-run and returns the same keys as
+    `summarize_trials`, with sketch percentiles and a normal-approximation
+    CI in place of the exact percentiles and bootstrap CI.
+    """
+
+    def __init__(
+        self,
+        planner_names: Iterable[str],
+        *,
+        confidence: float = bench_stats.DEFAULT_CONFIDENCE,
+        cold_timings_ms: Mapping[str, float] | None = None,
+    ) -> None:
+        self.confidence = confidence
+        self.cold_timings_ms = dict(cold_timings_ms or {})
+        self.trial_count = 0
+        self.shared_maze_count = 0
+        self._planners = {name: _PlannerAggregate() for name in sorted(set(planner_names))}
+        if not self._planners:
+            raise ValueError("At least one planner is required.")
+        self._pending: dict[TrialKey, dict[str, tuple[bool, float, int | None]]] = {}
+
+    @property
+    def pending_maze_count(self) -> int:
+        return len(self._pending)
+
+    def add(self, trial: TrialResult) -> None:
+        aggregate = self._planners.get(trial.planner)
+        if aggregate is None:
+            raise ValueError(f"Trial for unknown planner '{trial.planner}'.")
+        self.trial_count += 1
+        aggregate.runs += 1
+        aggregate.solve_time_ms.add(trial.solve_time_ms)
+        aggregate.solve_time_quantiles.add(trial.solve_time_ms)
+        if trial.success:
+            aggregate.successes += 1
+            if trial.path_length is not None:
+                aggregate.path_length.add(trial.path_length)
+            if trial.expansions is not None:
+                aggregate.expansions.add(trial.expansions)
+        if trial.peak_memory_bytes is not None:
+            aggregate.peak_memory_bytes.add(trial.peak_memory_bytes)
+        if trial.retained_blocks is not None:
+            aggregate.retained_blocks.add(trial.retained_blocks)
+        if trial.preprocess_ms is not None:
+            aggregate.preprocess_ms.add(trial.preprocess_ms)
+
+        key = _trial_key(trial)
+        pending = self._pending.setdefault(key, {})
+        pending[trial.planner] = (trial.success, trial.solve_time_ms, trial.path_length)
+        if len(pending) < len(self._planners):
+            return
+        del self._pending[key]
+        if not all(success for success, _, _ in pending.values()):
+            return
+        self.shared_maze_count += 1
+        for planner_name, (_, solve_time_ms, path_length) in pending.items():
+            shared = self._planners[planner_name]
+            shared.shared_solve_time_ms.add(solve_time_ms)
+            if path_length is not None:
+                shared.shared_path_length.add(path_length)
+
+    def summary_rows(self) -> list[dict[str, Any]]:
+        summary_rows: list[dict[str, Any]] = []
+        for planner_name, aggregate in self._planners.items():
+            if not aggregate.runs:
+                continue
+            quantiles = aggregate.solve_time_quantiles
+            comparison = aggregate.shared_solve_time_ms
+            if not comparison.count:
+                comparison = aggregate.solve_time_ms
+            # Shift the solve-time CI by the amortized preprocessing, as the
+            # comparable time includes it.
+            preprocess_ms = aggregate.preprocess_ms.mean_or_nan()
+            ci_low, ci_high = (
+                bound + (0.0 if math.isnan(preprocess_ms) else preprocess_ms)
+                for bound in comparison.mean_ci(self.confidence)
+            )
+            summary_rows.append(
+                {
+                    "planner": planner_name,
+                    "runs": aggregate.runs,
+                    "successes": aggregate.successes,
+                    "failures": aggregate.runs - aggregate.successes,
+                    "success_rate": aggregate.successes / aggregate.runs,
+                    "mean_solve_time_ms": aggregate.solve_time_ms.mean,
+                    "min_solve_time_ms": aggregate.solve_time_ms.min,
+                    "median_solve_time_ms": quantiles.quantile(0.50),
+                    "p95_solve_time_ms": quantiles.quantile(0.95),
+                    "p99_solve_time_ms": quantiles.quantile(0.99),
+                    "cold_solve_time_ms": float(self.cold_timings_ms.get(planner_name, math.nan)),
+                    "shared_success_maze_count": aggregate.shared_solve_time_ms.count,
+                    "mean_shared_solve_time_ms": aggregate.shared_solve_time_ms.mean_or_nan(),
+                    "mean_path_length": aggregate.path_length.mean_or_nan(),
+                    "mean_shared_path_length": aggregate.shared_path_length.mean_or_nan(),
+                    "mean_expansions": aggregate.expansions.mean_or_nan(),
+                    "comparison_ci_low_ms": ci_low,
+                    "comparison_ci_high_ms": ci_high,
+                    "ci_confidence": self.confidence,
+                    "median_peak_memory_bytes": aggregate.peak_memory_bytes.quantile(0.50),
+                    "max_peak_memory_bytes": (
+                        aggregate.peak_memory_bytes.max if aggregate.peak_memory_bytes.count else math.nan
+                    ),
+                    "mean_retained_blocks": aggregate.retained_blocks.mean_or_nan(),
+                    "mean_preprocess_ms": preprocess_ms,
+                }
+            )
+        return rank_summary_rows(summary_rows)
+
+    def progress_line(self, total_trials: int | None = None) -> str:
+        """One-line live status: trial count, shared mazes and the current leader."""
+
+        done = f"{self.trial_count}/{total_trials}" if total_trials else str(self.trial_count)
+        if total_trials:
+            done += f" ({100.0 * self.trial_count / total_trials:.0f}%)"
+        line = f"{done} trials, {self.shared_maze_count} shared mazes"
+        rows = self.summary_rows()
+        if rows:
+            leader = rows[0]
+            line += f"; leader {leader['planner']} ({_fmt_metric(_comparison_time_ms(leader))} ms)"
+        return line
+
+
+def _fan_out(*sinks: Callable[[TrialResult], None]) -> Callable[[TrialResult], None]:
+    if len(sinks) == 1:
+        return sinks[0]
+
+    def on_trial(trial: TrialResult) -> None:
+        for sink in sinks:
+            sink(trial)
+
+    return on_trial
+
+
+class _ProgressPrinter:
+    """`on_trial` hook feeding an `OnlineTrialSummary` and printing at most every `interval_s`."""
+
+    def __init__(self, summary: OnlineTrialSummary, total_trials: int | None, interval_s: float) -> None:
+        self.summary = summary
+        self.total_trials = total_trials
+        self.interval_s = interval_s
+        self._last_print = time.monotonic()
+
+    def __call__(self, trial: TrialResult) -> None:
+        self.summary.add(trial)
+        now = time.monotonic()
+        if now - self._last_print >= self.interval_s:
+            self._last_print = now
+            print(f"[INFO] Progress: {self.summary.progress_line(self.total_trials)}", flush=True)
+
+
 def _rank_metric(value: float) -> float:
     return value if not math.isnan(value) else math.inf
 
 
 def _comparison_time_ms(row: Mapping[str, Any]) -> float:
-    shared_time = float(row.get("mean_shared_solve_time_ms", math.nan))
-    if not math.isnan(shared_time):
-        return shared_time
-    return float(row["mean_solve_time_ms"])
+    """Mean solve time on shared-success mazes (all mazes if none), plus amortized preprocessing."""
+    solve_time = float(row.get("mean_shared_solve_time_ms", math.nan))
+    if math.isnan(solve_time):
+        solve_time = float(row["mean_solve_time_ms"])
+    preprocess = float(row.get("mean_preprocess_ms", math.nan))
+    return solve_time if math.isnan(preprocess) else solve_time + preprocess
 
 
 def _comparison_path_length(row: Mapping[str, Any]) -> float:
@@ -405,7 +682,31 @@ def _comparison_path_length(row: Mapping[str, Any]) -> float:
     return float(row["mean_path_length"])
 
 
+def _comparison_ci(row: Mapping[str, Any]) -> tuple[float, float]:
+    return (
+        float(row.get("comparison_ci_low_ms", math.nan)),
+        float(row.get("comparison_ci_high_ms", math.nan)),
+    )
+
+
+def _verdict_vs_leader(row: Mapping[str, Any], leader: Mapping[str, Any]) -> str:
+    if row is leader:
+        return "leader"
+    if float(row["success_rate"]) < float(leader["success_rate"]):
+        return "fewer successes"
+    if bench_stats.intervals_overlap(_comparison_ci(row), _comparison_ci(leader)):
+        return "overlaps #1"
+    return "slower"
+
+
 def rank_summary_rows(summary_rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Order rows for display and mark how each compares with the #1 row.
+
+    `vs_leader` is `leader`, `slower` (CIs separate), `overlaps #1` (CIs
+    overlap, so their order is within noise) or `fewer successes`.
+    `memory_rank` orders memory-profiled rows by median (then max) peak
+    memory and is None for rows without a profile.
+    """
     ranked = sorted(
         summary_rows,
         key=lambda row: (
@@ -416,47 +717,229 @@ def rank_summary_rows(summary_rows: list[dict[str, Any]]) -> list[dict[str, Any]
             str(row["planner"]),
         ),
     )
-    return [{**row, "rank": idx} for idx, row in enumerate(ranked, start=1)]
+    if not ranked:
+        return []
+    leader = ranked[0]
+    profiled = sorted(
+        (row for row in ranked if not math.isnan(_peak_memory(row))),
+        key=lambda row: (
+            _peak_memory(row),
+            float(row.get("max_peak_memory_bytes", math.nan)),
+            str(row["planner"]),
+        ),
+    )
+    memory_ranks = {str(row["planner"]): idx for idx, row in enumerate(profiled, start=1)}
+    return [
+        {
+            **row,
+            "rank": idx,
+            "vs_leader": _verdict_vs_leader(row, leader),
+            "memory_rank": memory_ranks.get(str(row["planner"])),
+        }
+        for idx, row in enumerate(ranked, start=1)
+    ]
+
+
+def _peak_memory(row: Mapping[str, Any]) -> float:
+    return float(row.get("median_peak_memory_bytes", math.nan))
+
+
+def _fmt_kib(value: float) -> str:
+    return "n/a" if math.isnan(value) else f"{value / 1024.0:.1f}"
+
+
+def declared_winner(summary_rows: list[dict[str, Any]]) -> str | None:
+    """The #1 planner, or None when its interval overlaps another planner's."""
+    ranked_rows = rank_summary_rows(summary_rows)
+    if not ranked_rows or any(row["vs_leader"] == "overlaps #1" for row in ranked_rows):
+        return None
+    return str(ranked_rows[0]["planner"])
 
 
-def write_results_csv(trials: list[TrialResult], output_path: Path) -> Path:
+def unsettled_rank_pairs(summary_rows: list[dict[str, Any]]) -> list[tuple[str, str]]:
+    """Adjacent planners in rank order whose CIs overlap (success rates decide the others)."""
+    ranked_rows = rank_summary_rows(summary_rows)
+    return [
+        (str(upper["planner"]), str(lower["planner"]))
+        for upper, lower in zip(ranked_rows, ranked_rows[1:])
+        if float(upper["success_rate"]) == float(lower["success_rate"])
+        and bench_stats.intervals_overlap(_comparison_ci(upper), _comparison_ci(lower))
+    ]
+
+
+def _describe_winner(summary_rows: list[dict[str, Any]]) -> str:
+    winner = declared_winner(summary_rows)
+    if winner is not None:
+        return winner
+    tied = [
+        str(row["planner"])
+        for row in rank_summary_rows(summary_rows)
+        if row["vs_leader"] in {"leader", "overlaps #1"}
+    ]
+    return f"no clear winner ({', '.join(tied)} overlap within the confidence interval)"
+
+
+RESULTS_CSV_COLUMNS: tuple[str, ...] = (
+    "planner",
+    "maze_index",
+    "maze_seed",
+    "width",
+    "height",
+    "algorithm",
+    "success",
+    "solve_time_ms",
+    "path_length",
+    "expansions",
+    "error",
+    "repeats",
+    "min_ms",
+    "median_ms",
+    "p95_ms",
+    "p99_ms",
+    "timings_ms",
+    "peak_memory_bytes",
+    "retained_blocks",
+    "query_index",
+    "preprocess_ms",
+)
+
+
+def _trial_csv_row(row: TrialResult) -> list[Any]:
+    spread = bench_stats.timing_summary(row.timings_ms or (row.solve_time_ms,))
+    return [
+        row.planner,
+        row.maze_index,
+        row.maze_seed,
+        row.width,
+        row.height,
+        row.algorithm,
+        int(row.success),
+        f"{row.solve_time_ms:.6f}",
+        row.path_length if row.path_length is not None else "",
+        row.expansions if row.expansions is not None else "",
+        row.error or "",
+        len(row.timings_ms) or 1,
+        *(f"{spread[key]:.6f}" for key in ("min", "median", "p95", "p99")),
+        ";".join(f"{value:.6f}" for value in row.timings_ms),
+        row.peak_memory_bytes if row.peak_memory_bytes is not None else "",
+        row.retained_blocks if row.retained_blocks is not None else "",
+        row.query_index,
+        f"{row.preprocess_ms:.6f}" if row.preprocess_ms is not None else "",
+    ]
+
+
+def write_results_csv(trials: Iterable[TrialResult], output_path: Path) -> Path:
+    """Write all trials, replacing `output_path` atomically."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", newline="", encoding="utf-8") as handle:
+    partial_path = output_path.with_name(output_path.name + ".tmp")
+    with partial_path.open("w", newline="", encoding="utf-8") as handle:
         writer = csv.writer(handle)
-        writer.writerow(
-            [
-                "planner",
-                "maze_index",
-                "maze_seed",
-                "width",
-                "height",
-                "algorithm",
-                "success",
-                "solve_time_ms",
-                "path_length",
-                "expansions",
-                "error",
-            ]
-        )
+        writer.writerow(RESULTS_CSV_COLUMNS)
         for row in trials:
-            writer.writerow(
-                [
-                    row.planner,
-                    row.maze_index,
-                    row.maze_seed,
-                    row.width,
-                    row.height,
-                    row.algorithm,
-                    int(row.success),
-                    f"{row.solve_time_ms:.6f}",
-                    row.path_length if row.path_length is not None else "",
-                    row.expansions if row.expansions is not None else "",
-                    row.error or "",
-                ]
-            )
+            writer.writerow(_trial_csv_row(row))
+    os.replace(partial_path, output_path)
     return output_path
 
 
+class TrialCsvWriter:
+    """Append trials to a results CSV as they finish.
+
+    Rows are flushed after every write and fsync'ed every `fsync_every`
+    trials (and on close), so an interrupted run loses at most the trials
+    since the last sync. Opening with `append=True` keeps existing rows and
+    only writes the header when the file is new or empty.
+    """
+
+    def __init__(self, output_path: Path, *, append: bool = False, fsync_every: int = 25) -> None:
+        if fsync_every < 1:
+            raise ValueError("fsync_every must be >= 1.")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        needs_header = not append or not output_path.exists() or output_path.stat().st_size == 0
+        if append and not needs_header:
+            _drop_partial_row(output_path)
+        self.path = output_path
+        self.fsync_every = fsync_every
+        self.written = 0
+        self._handle = output_path.open("a" if append else "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._handle)
+        self._pending_sync = 0
+        if needs_header:
+            self._writer.writerow(RESULTS_CSV_COLUMNS)
+            self.sync()
+
+    def __enter__(self) -> "TrialCsvWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def write(self, trial: TrialResult) -> None:
+        self._writer.writerow(_trial_csv_row(trial))
+        self._handle.flush()
+        self.written += 1
+        self._pending_sync += 1
+        if self._pending_sync >= self.fsync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._pending_sync = 0
+
+    def close(self) -> None:
+        if self._handle.closed:
+            return
+        self.sync()
+        self._handle.close()
+
+
+def _drop_partial_row(path: Path) -> None:
+    """Truncate an interrupted final row so appended rows start on a fresh line."""
+    with path.open("rb+") as handle:
+        data = handle.read()
+        if data and not data.endswith(b"\n"):
+            handle.truncate(data.rfind(b"\n") + 1)
+
+
+def _optional_int(text: str) -> int | None:
+    return int(text) if text.strip() else None
+
+
+def read_results_csv(input_path: Path) -> list[TrialResult]:
+    """Load trials from a results CSV, skipping a torn or malformed trailing row."""
+    text = input_path.read_text(encoding="utf-8")
+    if not text.endswith("\n"):
+        # The run stopped mid-row; drop the partial record.
+        text = text[: text.rfind("\n") + 1]
+    trials: list[TrialResult] = []
+    for record in csv.DictReader(io.StringIO(text, newline="")):
+        try:
+            timings_text = record.get("timings_ms") or ""
+            trials.append(
+                TrialResult(
+                    planner=record["planner"],
+                    maze_index=int(record["maze_index"]),
+                    maze_seed=int(record["maze_seed"]),
+                    width=int(record["width"]),
+                    height=int(record["height"]),
+                    algorithm=record["algorithm"],
+                    success=record["success"] == "1",
+                    solve_time_ms=float(record["solve_time_ms"]),
+                    path_length=_optional_int(record["path_length"]),
+                    expansions=_optional_int(record["expansions"]),
+                    error=record["error"] or None,
+                    timings_ms=tuple(float(value) for value in timings_text.split(";") if value),
+                    peak_memory_bytes=_optional_int(record.get("peak_memory_bytes") or ""),
+                    retained_blocks=_optional_int(record.get("retained_blocks") or ""),
+                    query_index=int(record.get("query_index") or 0),
+                    preprocess_ms=float(record["preprocess_ms"]) if record.get("preprocess_ms") else None,
+                )
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            continue
+    return trials
+
+
 def _fmt_metric(value: float) -> str:
     if math.isnan(value):
         return "n/a"
@@ -473,6 +956,13 @@ def _fmt_delta_ms(value: float) -> str:
     return f"{value:+.2f}"
 
 
+def _fmt_ci(row: Mapping[str, Any]) -> str:
+    low, high = _comparison_ci(row)
+    if math.isnan(low) or math.isnan(high):
+        return "n/a"
+    return f"[{low:.2f}, {high:.2f}]"
+
+
 def render_console_summary_table(summary_rows: list[dict[str, Any]]) -> str:
     ranked_rows = rank_summary_rows(summary_rows)
     if not ranked_rows:
@@ -485,7 +975,12 @@ def render_console_summary_table(summary_rows: list[dict[str, Any]]) -> str:
         ("Success Rate", "right"),
         ("Comparable Mazes", "right"),
         ("Comparable Time (ms)", "right"),
+        ("CI (ms)", "right"),
         ("Delta vs #1 (ms)", "right"),
+        ("vs #1", "left"),
+        ("Median (ms)", "right"),
+        ("p95 (ms)", "right"),
+        ("p99 (ms)", "right"),
         ("Comparable Path", "right"),
         ("Mean Expansions", "right"),
     ]
@@ -496,14 +991,35 @@ def render_console_summary_table(summary_rows: list[dict[str, Any]]) -> str:
             _fmt_success(int(row["successes"]), int(row["runs"])),
             str(int(row.get("shared_success_maze_count", 0))),
             f"{_comparison_time_ms(row):.2f}",
+            _fmt_ci(row),
             _fmt_delta_ms(_comparison_time_ms(row) - baseline_time_ms),
+            str(row["vs_leader"]),
+            _fmt_metric(float(row.get("median_solve_time_ms", math.nan))),
+            _fmt_metric(float(row.get("p95_solve_time_ms", math.nan))),
+            _fmt_metric(float(row.get("p99_solve_time_ms", math.nan))),
             _fmt_metric(_comparison_path_length(row)),
             _fmt_metric(float(row["mean_expansions"])),
         ]
         for row in ranked_rows
     ]
+    if any(not math.isnan(float(row.get("mean_preprocess_ms", math.nan))) for row in ranked_rows):
+        headers.append(("Prep/Query (ms)", "right"))
+        for row, cells in zip(ranked_rows, rows):
+            cells.append(_fmt_metric(float(row.get("mean_preprocess_ms", math.nan))))
+    if any(row["memory_rank"] is not None for row in ranked_rows):
+        headers += [("Peak KiB", "right"), ("Mem #", "right")]
+        for row, cells in zip(ranked_rows, rows):
+            cells += [
+                _fmt_kib(_peak_memory(row)),
+                str(row["memory_rank"]) if row["memory_rank"] is not None else "-",
+            ]
+    winner_line = f"Winner: {_describe_winner(ranked_rows)}"
+    return "\n".join([_render_text_table(headers, rows), "", winner_line])
+
+
+def _render_text_table(headers: list[tuple[str, str]], rows: list[list[str]]) -> str:
     widths = [
-        max(len(headers[idx][0]), max(len(row[idx]) for row in rows))
+        max(len(headers[idx][0]), max((len(row[idx]) for row in rows), default=0))
         for idx in range(len(headers))
     ]
 
@@ -521,6 +1037,55 @@ def render_console_summary_table(summary_rows: list[dict[str, Any]]) -> str:
     return "\n".join([header_line, separator_line, *body_lines])
 
 
+def _scaling_table(scaling_rows: list[dict[str, Any]]) -> tuple[list[str], list[list[str]]]:
+    sizes = sorted({size for row in scaling_rows for size in row["median_solve_time_ms"]})
+    headers = ["Planner", *(f"{size}x{size} (ms)" for size in sizes), "Time Slope", "Expansion Slope", "Cut Off At"]
+    body = [
+        [
+            str(row["planner"]),
+            *(_fmt_metric(row["median_solve_time_ms"].get(size, math.nan)) for size in sizes),
+            _fmt_metric(row["time_slope"]),
+            _fmt_metric(row["expansion_slope"]),
+            f"{row['cut_off_at']}x{row['cut_off_at']}" if row["cut_off_at"] is not None else "-",
+        ]
+        for row in scaling_rows
+    ]
+    return headers, body
+
+
+def render_console_scaling_table(scaling_rows: list[dict[str, Any]]) -> str:
+    if not scaling_rows:
+        return "No scaling rows to display."
+    headers, body = _scaling_table(scaling_rows)
+    return _render_text_table([(name, "left" if idx == 0 else "right") for idx, name in enumerate(headers)], body)
+
+
+def render_console_profile_table(profiler: bench_profile.PlannerProfiler, limit: int = 3) -> str:
+    """Top `limit` functions by self cost for every profiled planner."""
+    unit = profiler.unit
+    headers = [
+        ("Planner", "left"),
+        ("Function", "left"),
+        (f"Self ({unit})", "right"),
+        (f"Total ({unit})", "right"),
+        ("Calls", "right"),
+    ]
+    rows = [
+        [
+            planner_name if idx == 0 else "",
+            str(row["function"]),
+            f"{row['self']:.2f}" if unit == "ms" else str(int(row["self"])),
+            f"{row['total']:.2f}" if unit == "ms" else str(int(row["total"])),
+            str(row["calls"]) if row["calls"] is not None else "-",
+        ]
+        for planner_name in profiler.planners()
+        for idx, row in enumerate(profiler.top_functions(planner_name, limit))
+    ]
+    if not rows:
+        return "No profile samples collected."
+    return _render_text_table(headers, rows)
+
+
 def write_summary_markdown(
     summary_rows: list[dict[str, Any]],
     output_path: Path,
@@ -529,26 +1094,60 @@ def write_summary_markdown(
     height: int,
     seed: int,
     algorithm: str,
+    warmup: int = 0,
+    repeats: int = 1,
+    hygiene: bool = False,
+    scaling_rows: list[dict[str, Any]] | None = None,
+    query_mix: str = "default",
+    queries_per_maze: int = 1,
+    shard_text: str | None = None,
+    adaptive: bench_adaptive.AdaptiveOutcome | None = None,
 ) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     generated_at = datetime.now(tz=timezone.utc).isoformat(timespec="seconds")
     ranked_rows = rank_summary_rows(summary_rows)
     baseline_time_ms = _comparison_time_ms(ranked_rows[0]) if ranked_rows else 0.0
     top_planner = str(ranked_rows[0]["planner"]) if ranked_rows else "n/a"
+    confidence = float(ranked_rows[0].get("ci_confidence", bench_stats.DEFAULT_CONFIDENCE)) if ranked_rows else 0.0
     lines = [
         "# Benchmark Summary",
         "",
         f"- Generated (UTC): {generated_at}",
         f"- Mazes: {maze_count}",
-        f"- Maze size (cells): {width}x{height}",
+        *([f"- Adaptive sampling: {adaptive.describe()}"] if adaptive is not None else []),
+        (
+            f"- Maze sizes (cells): {', '.join(f'{size}x{size}' for size in _scaling_sizes(scaling_rows))}"
+            if scaling_rows
+            else f"- Maze size (cells): {width}x{height}"
+        ),
         f"- Maze algorithm: {algorithm}",
+        (
+            "- Queries: maze start to centre goal"
+            if query_mix == "default"
+            else f"- Queries: {queries_per_maze} `{query_mix}` pair(s) per maze; each (maze, query) is one trial"
+        ),
         f"- Seed: {seed}",
+        *([f"- Shards: {shard_text}"] if shard_text else []),
+        f"- Timing: {warmup} warmup call(s), median of {repeats} timed repeat(s) per trial",
+        "- Timing hygiene: "
+        + ("on (pre-warmed planners, GC off in timed sections, collected between trials)" if hygiene else "off"),
         f"- Top planner: {top_planner}",
+        f"- Winner: {_describe_winner(ranked_rows)}",
+        f"- CI: {confidence * 100:.0f}% seeded bootstrap interval of the comparable solve time; "
+        "a winner is declared only when #1's interval separates from every other planner's.",
         "- Comparable mazes: mazes solved by every planner (shared-success set).",
         "- Ranking policy: success rate (desc), comparable solve time (asc), mean expansions (asc), mean solve time (asc), planner name (asc).",
+    ]
+    if any(row["planner"] == BATCHED_PLANNER_NAME for row in ranked_rows):
+        lines.append(
+            f"- `{BATCHED_PLANNER_NAME}` solves all mazes in one vectorized pass; "
+            "its solve time is the batch wall-clock divided by the maze count."
+        )
+    lines += [
         "",
-        "| Rank | Planner | Success Rate | Comparable Mazes | Comparable Solve Time (ms) | Delta vs #1 (ms) | Comparable Path Length | Mean Expansions |",
-        "|---:|---|---:|---:|---:|---:|---:|---:|",
+        "| Rank | Planner | Success Rate | Comparable Mazes | Comparable Solve Time (ms) | CI (ms) "
+        "| Delta vs #1 (ms) | vs #1 | Median (ms) | p95 (ms) | p99 (ms) | Comparable Path Length | Mean Expansions |",
+        "|---:|---|---:|---:|---:|---:|---:|---|---:|---:|---:|---:|---:|",
     ]
 
     for row in ranked_rows:
@@ -559,65 +1158,531 @@ def write_summary_markdown(
             + f"{_fmt_success(int(row['successes']), int(row['runs']))} | "
             + f"{int(row.get('shared_success_maze_count', 0))} | "
             + f"{_comparison_time_ms(row):.2f} | "
+            + f"{_fmt_ci(row)} | "
             + f"{_fmt_delta_ms(_comparison_time_ms(row) - baseline_time_ms)} | "
+            + f"{row['vs_leader']} | "
+            + f"{_fmt_metric(float(row.get('median_solve_time_ms', math.nan)))} | "
+            + f"{_fmt_metric(float(row.get('p95_solve_time_ms', math.nan)))} | "
+            + f"{_fmt_metric(float(row.get('p99_solve_time_ms', math.nan)))} | "
             + f"{_fmt_metric(_comparison_path_length(row))} | "
             + f"{_fmt_metric(row['mean_expansions'])} |"
         )
 
+    if scaling_rows:
+        headers, body = _scaling_table(scaling_rows)
+        lines += [
+            "",
+            "## Scaling",
+            "",
+            "Median solve time per maze size, and log-log slopes of median solve time and mean "
+            "expansions against maze cell count (1.00 = linear). Planners that exceeded the "
+            "per-size time budget are cut off from that size on.",
+            "",
+            "| " + " | ".join(headers) + " |",
+            "|---|" + "---:|" * (len(headers) - 1),
+        ]
+        lines += ["| " + " | ".join(cells) + " |" for cells in body]
+
+    cold_rows = [row for row in ranked_rows if not math.isnan(float(row.get("cold_solve_time_ms", math.nan)))]
+    if cold_rows:
+        lines += [
+            "",
+            "## Cold vs Warm",
+            "",
+            "Cold is each planner's first call in the process (pre-warm, outside the benchmark set); "
+            "warm is the median trial time after pre-warming.",
+            "",
+            "| Planner | Cold First Call (ms) | Warm Median (ms) |",
+            "|---|---:|---:|",
+        ]
+        lines += [
+            f"| {row['planner']} | {float(row['cold_solve_time_ms']):.2f} | "
+            f"{_fmt_metric(float(row.get('median_solve_time_ms', math.nan)))} |"
+            for row in cold_rows
+        ]
+
+    indexed_rows = [row for row in ranked_rows if not math.isnan(float(row.get("mean_preprocess_ms", math.nan)))]
+    if indexed_rows:
+        lines += [
+            "",
+            "## Preprocessing",
+            "",
+            "Indexed planners build a per-maze index once and reuse it for every query on that maze. "
+            "Its time, amortized per query, is reported here and added to the comparable time above, "
+            "but not to the per-query solve times.",
+            "",
+            "| Planner | Preprocess / Query (ms) | Mean Query (ms) | Amortized / Query (ms) |",
+            "|---|---:|---:|---:|",
+        ]
+        lines += [
+            f"| {row['planner']} | {float(row['mean_preprocess_ms']):.2f} | "
+            f"{_fmt_metric(float(row['mean_solve_time_ms']))} | "
+            f"{_fmt_metric(float(row['mean_solve_time_ms']) + float(row['mean_preprocess_ms']))} |"
+            for row in indexed_rows
+        ]
+
+    memory_rows = sorted(
+        (row for row in rank_summary_rows(summary_rows) if row["memory_rank"] is not None),
+        key=lambda row: row["memory_rank"],
+    )
+    if memory_rows:
+        lines += [
+            "",
+            "## Memory",
+            "",
+            "Peak is the tracemalloc high-water mark of one traced call per trial, above the level before it; "
+            "retained blocks are interpreter blocks still held after the call (result plus planner caches).",
+            "",
+            "| Memory Rank | Planner | Median Peak (KiB) | Max Peak (KiB) | Mean Retained Blocks |",
+            "|---:|---|---:|---:|---:|",
+        ]
+        lines += [
+            f"| {row['memory_rank']} | {row['planner']} | {_fmt_kib(_peak_memory(row))} | "
+            f"{_fmt_kib(float(row['max_peak_memory_bytes']))} | "
+            f"{_fmt_metric(float(row.get('mean_retained_blocks', math.nan)))} |"
+            for row in memory_rows
+        ]
+
     output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
     return output_path
 
 
-def run_benchmark(
-    planners: Mapping[str, PlannerFn] | None = None,
-    maze_count: int = 50,
-    width: int = 15,
-    height: int = 15,
-    seed: int = 7,
-    algorithm: str = "backtracker",
-) -> tuple[list[TrialResult], list[dict[str, Any]]]:
-    if maze_count < 1:
-        raise ValueError("maze_count must be >= 1.")
-    if width < 2 or height < 2:
-        raise ValueError("Maze width and height must be >= 2.")
+def _scaling_sizes(scaling_rows: list[dict[str, Any]] | None) -> list[int]:
+    return sorted({size for row in scaling_rows or () for size in row["median_solve_time_ms"]})
 
-    available = load_available_planners(include_alt=True)
-    if planners is None:
-        planners = _resolve_default_benchmark_planners(available)
-    planner_items = sorted(planners.items(), key=lambda item: item[0])
-    if not planner_items:
-        raise ValueError("At least one planner is required.")
-    if algorithm not in maze_mod.SUPPORTED_MAZE_ALGORITHMS:
-        raise ValueError(
-            f"Unsupported maze algorithm '{algorithm}'. "
-            f"Expected one of {sorted(maze_mod.SUPPORTED_MAZE_ALGORITHMS)}."
-        )
 
-    trials: list[TrialResult] = []
+def build_run_metadata(
+    summary_rows: list[dict[str, Any]],
+    *,
+    maze_count: int,
+    width: int,
+    height: int,
+    seed: int,
+    algorithm: str,
+    batched: bool = False,
+    jobs: int = 1,
+    pin_cpus: bool = False,
+    warmup: int = 0,
+    repeats: int = 1,
+    hygiene: bool = False,
+    cpu_affinity: int | None = None,
+    sizes: Sequence[int] | None = None,
+    time_budget_ms: float | None = None,
+    profile_memory: bool = False,
+    profile: str | None = None,
+    isolate: bool = False,
+    trial_timeout_ms: float | None = None,
+    memory_limit_mb: float | None = None,
+    query_mix: str = "default",
+    queries_per_maze: int = 1,
+    shard: shard_mod.Shard | None = None,
+    adaptive: Mapping[str, Any] | None = None,
+    confidence: float = bench_stats.DEFAULT_CONFIDENCE,
+) -> dict[str, Any]:
+    """Describe the run environment and timing settings for `benchmark_metadata.json`."""
+    cold_timings = {
+        str(row["planner"]): float(row["cold_solve_time_ms"])
+        for row in summary_rows
+        if not math.isnan(float(row.get("cold_solve_time_ms", math.nan)))
+    }
+    return {
+        "generated_at": datetime.now(tz=timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "benchmark": {
+            "maze_count": maze_count,
+            "width": width,
+            "height": height,
+            "seed": seed,
+            "algorithm": algorithm,
+            "batched": batched,
+            "jobs": jobs,
+            "pin_cpus": pin_cpus,
+            "sizes": list(sizes) if sizes else None,
+            "time_budget_ms": time_budget_ms,
+            "profile_memory": profile_memory,
+            "profile": profile,
+            "queries": {"mix": query_mix, "per_maze": queries_per_maze},
+            "confidence": confidence,
+            "shard": {"index": shard.index, "count": shard.count} if shard is not None else None,
+            "adaptive": dict(adaptive) if adaptive is not None else None,
+            "isolation": {
+                "enabled": isolate,
+                "trial_timeout_ms": trial_timeout_ms,
+                "memory_limit_mb": memory_limit_mb,
+            },
+        },
+        "timing": {
+            "clock": "time.perf_counter",
+            "warmup": warmup,
+            "repeats": repeats,
+            "hygiene": {
+                "enabled": hygiene,
+                "prewarm": hygiene,
+                "gc_disabled_in_timed_sections": hygiene,
+                "gc_collect_before_timed_sections": hygiene,
+                "cpu_affinity": cpu_affinity,
+            },
+        },
+        "cold_timings_ms": cold_timings,
+    }
 
-    for maze_index in range(maze_count):
-        maze_seed = seed + maze_index
-        grid, start, goal = generate_benchmark_maze(
-            width=width,
-            height=height,
-            seed=maze_seed,
-            algorithm=algorithm,
+
+def write_run_metadata(metadata: Mapping[str, Any], output_path: Path) -> Path:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(metadata, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return output_path
+
+
+def _run_batched_trials(
+    mazes: list[tuple[int, int, Grid, Cell, Cell]],
+    width: int,
+    height: int,
+    algorithm: str,
+) -> list[TrialResult]:
+    """Solve every maze in one batched wavefront pass; time is amortized per maze."""
+    import wavefront as wavefront_mod
+
+    started = time.perf_counter()
+    result = wavefront_mod.batched_wavefront(
+        [grid for _, _, grid, _, _ in mazes],
+        [start for _, _, _, start, _ in mazes],
+        [goal for _, _, _, _, goal in mazes],
+    )
+    paths = result.paths_to([goal for _, _, _, _, goal in mazes])
+    per_maze_ms = (time.perf_counter() - started) * 1000.0 / len(mazes)
+
+    trials: list[TrialResult] = []
+    for (maze_index, maze_seed, grid, start, goal), path, expansions in zip(
+        mazes, paths, result.expanded_nodes.tolist()
+    ):
+        success, path_length, error_text = _validate_and_measure_path(
+            grid=grid,
+            path=path,
+            start=start,
+            goal=goal,
+        )
+        trials.append(
+            TrialResult(
+                planner=BATCHED_PLANNER_NAME,
+                maze_index=maze_index,
+                maze_seed=maze_seed,
+                width=width,
+                height=height,
+                algorithm=algorithm,
+                success=success,
+                solve_time_ms=per_maze_ms,
+                path_length=path_length if success else None,
+                expansions=int(expansions),
+                error=error_text if not success else None,
+                timings_ms=(per_maze_ms,),
+            )
         )
+    return trials
+
+
+def _planner_call_kwargs(
+    planner_items: list[tuple[str, PlannerFn]],
+    workspace: PlannerWorkspace,
+) -> dict[str, dict[str, Any]]:
+    return {name: ({"workspace": workspace} if _accepts_workspace(fn) else {}) for name, fn in planner_items}
+
+
+def _reset_planner_state(planner_items: list[tuple[str, PlannerFn]]) -> None:
+    """Clear module-level caches of planners that expose a `reset_state` hook (r6 LPA*)."""
+    for _, planner_fn in planner_items:
+        reset = getattr(planner_fn, "reset_state", None)
+        if reset is not None:
+            reset()
+
+
+@contextmanager
+def _timed_section(hygiene: bool) -> Iterator[None]:
+    """Collect garbage up front and keep the collector off while timing."""
+    if not hygiene:
+        yield
+        return
+    gc.collect()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _profile_call(call: Callable[[], Any]) -> tuple[Any, int, int, float]:
+    """Run `call` under tracemalloc; return `(result, peak bytes, retained blocks, call ms)`.
+
+    The peak is measured above the traced level just before the call.
+    Retained blocks are the interpreter's allocated blocks still held after
+    the call (result plus anything the planner caches), floored at 0. The
+    time covers `call` alone, not the collections and tracemalloc setup
+    around it. Exceptions from `call` propagate.
+    """
+    gc.collect()
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline_bytes, _ = tracemalloc.get_traced_memory()
+    baseline_blocks = sys.getallocatedblocks()
+    try:
+        started = time.perf_counter()
+        result = call()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        gc.collect()
+        retained_blocks = max(0, sys.getallocatedblocks() - baseline_blocks)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return result, max(0, peak_bytes - baseline_bytes), retained_blocks, elapsed_ms
+
+
+def _profile_call_forked(call: Callable[[], Any]) -> tuple[int, int] | None:
+    """Run `_profile_call` in a forked child; return `(peak bytes, retained blocks)`.
+
+    The child starts from this process's planner state and its changes to
+    that state are discarded, so a stateful planner can be profiled on the
+    same query its timed call then answers untraced. Returns None where
+    `os.fork` is unavailable or the child fails.
+    """
+    if not hasattr(os, "fork"):
+        return None
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        os.close(read_fd)
+        try:
+            _, peak_bytes, retained_blocks, _ = _profile_call(call)
+            os.write(write_fd, json.dumps([peak_bytes, retained_blocks]).encode("ascii"))
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as reader:
+        payload = reader.read()
+    os.waitpid(pid, 0)
+    if not payload:
+        return None
+    peak_bytes, retained_blocks = json.loads(payload)
+    return int(peak_bytes), int(retained_blocks)
+
+
+def _prewarm_planners(
+    planner_items: list[tuple[str, PlannerFn]],
+    planner_kwargs: Mapping[str, Mapping[str, Any]],
+    width: int,
+    height: int,
+    seed: int,
+    algorithm: str,
+) -> dict[str, float]:
+    """Call every planner once on a maze outside the benchmark set.
+
+    This pays first-call costs (lazy imports such as `greedy_best_first`
+    loading r13, heuristic tables, workspace allocation) before timing
+    starts. Returns each planner's cold call time in milliseconds.
+    """
+    grid, start, goal = generate_benchmark_maze(width=width, height=height, seed=seed - 1, algorithm=algorithm)
+    cold_ms: dict[str, float] = {}
+    for planner_name, planner_fn in planner_items:
+        with _timed_section(True):
+            started = time.perf_counter()
+            try:
+                planner_fn(_copy_grid(grid), start, goal, **planner_kwargs[planner_name])
+            except Exception:
+                pass
+            cold_ms[planner_name] = (time.perf_counter() - started) * 1000.0
+    return cold_ms
 
-        # Rotate planner execution order per maze to reduce first-run cache bias.
-        offset = maze_index % len(planner_items)
-        ordered_items = planner_items[offset:] + planner_items[:offset]
 
-        for planner_name, planner_fn in ordered_items:
-            trial_grid = _copy_grid(grid)
+def _run_query_trial(
+    planner_name: str,
+    planner_fn: PlannerFn,
+    call_kwargs: Mapping[str, Any],
+    grid: Grid,
+    start: Cell,
+    goal: Cell,
+    *,
+    warmup: int,
+    repeats: int,
+    hygiene: bool,
+    profile_memory: bool,
+    profiler: bench_profile.PlannerProfiler | None,
+) -> tuple[Any, str | None, list[float], int | None, int | None]:
+    """Warm up, profile and time one planner on one query (see `_run_maze_trials`).
+
+    Returns the first timed call's result and error, every timed repeat, and
+    the memory profile (None unless `profile_memory`).
+    """
+    stateful = getattr(planner_fn, "reuses_state", False)
+    for _ in range(0 if stateful else warmup):
+        try:
+            planner_fn(_copy_grid(grid), start, goal, **call_kwargs)
+        except Exception:
+            break
+
+    peak_bytes: int | None = None
+    retained_blocks: int | None = None
+    if profile_memory and not stateful:
+        try:
+            _, peak_bytes, retained_blocks, _ = _profile_call(
+                functools.partial(planner_fn, _copy_grid(grid), start, goal, **call_kwargs)
+            )
+        except Exception:
+            pass
+    trace_timed_call = False
+    if profile_memory and stateful:
+        # Only the timed call may advance the planner's state: profile its
+        # query in a forked copy so tracemalloc stays out of the timing.
+        memory = _profile_call_forked(functools.partial(planner_fn, _copy_grid(grid), start, goal, **call_kwargs))
+        if memory is not None:
+            peak_bytes, retained_blocks = memory
+        trace_timed_call = memory is None
+    if profiler is not None and not stateful:
+        try:
+            profiler.profile(planner_name, functools.partial(planner_fn, _copy_grid(grid), start, goal, **call_kwargs))
+        except Exception:
+            pass
+
+    raw_result: Any = None
+    error_text: str | None = None
+    timings: list[float] = []
+    with _timed_section(hygiene):
+        for repeat in range(1 if stateful else repeats):
+            call = functools.partial(planner_fn, _copy_grid(grid), start, goal, **call_kwargs)
+            if stateful and profiler is not None:
+                call = functools.partial(profiler.profile, planner_name, call)
             started = time.perf_counter()
-            error_text: str | None = None
+            elapsed_ms: float | None = None
             try:
-                raw_result = planner_fn(trial_grid, start, goal)
+                if trace_timed_call:
+                    # Without fork the timed call is also traced; time the
+                    # call alone, without the tracing setup around it.
+                    result, peak_bytes, retained_blocks, elapsed_ms = _profile_call(call)
+                else:
+                    result = call()
             except Exception as exc:
-                raw_result = None
-                error_text = f"{type(exc).__name__}: {exc}"
-            elapsed_ms = (time.perf_counter() - started) * 1000.0
+                result = None
+                if repeat == 0:
+                    error_text = f"{type(exc).__name__}: {exc}"
+            timings.append(elapsed_ms if elapsed_ms is not None else (time.perf_counter() - started) * 1000.0)
+            if repeat == 0:
+                raw_result = result
+            if error_text is not None:
+                break
+    return raw_result, error_text, timings, peak_bytes, retained_blocks
+
+
+def _run_maze_trials(
+    planner_items: list[tuple[str, PlannerFn]],
+    planner_kwargs: Mapping[str, Mapping[str, Any]],
+    maze_index: int,
+    maze_seed: int,
+    width: int,
+    height: int,
+    algorithm: str,
+    warmup: int = 0,
+    repeats: int = 1,
+    hygiene: bool = False,
+    skip_planners: Container[str] = frozenset(),
+    profile_memory: bool = False,
+    profiler: bench_profile.PlannerProfiler | None = None,
+    query_mix: str = "default",
+    queries_per_maze: int = 1,
+) -> list[TrialResult]:
+    """Generate one maze and time every planner on its queries (except `skip_planners`).
+
+    The maze's queries come from `queries.generate_queries(query_mix,
+    queries_per_maze)`, seeded by the maze seed; each (query, planner) pair
+    is one trial. Planners with a `preprocess(grid)` hook (indexed planners)
+    build their index once per maze in a timed section and receive it as
+    `index=` on every query; the preprocessing time is split evenly over the
+    maze's queries as each trial's `preprocess_ms`, separate from
+    `solve_time_ms`.
+
+    Each planner gets `warmup` untimed calls per query, then `repeats` timed
+    calls on a fresh grid copy; the first timed call supplies the path and
+    expansions. Planners marked `reuses_state` are called once per query:
+    repeating them would time a replan against their cached tree rather than
+    a search. When skipped, they are still called (untimed) to keep their
+    state in step.
+
+    With `hygiene`, garbage left by earlier planners and validation is
+    collected before each planner's timed calls, and the collector stays
+    disabled while they run.
+
+    With `profile_memory`, one extra untimed call per planner and query runs
+    under `_profile_call` after the warmup; with `profiler`, another one runs
+    under that CPU profiler. `reuses_state` planners cannot take extra calls:
+    their memory profile comes from a forked copy of the process (see
+    `_profile_call_forked`), so their timed call runs untraced, while the CPU
+    profiler wraps their single timed call and its time includes that
+    overhead.
+    """
+    # Rotate planner execution order per maze to reduce first-run cache bias.
+    offset = maze_index % len(planner_items)
+    ordered_items = planner_items[offset:] + planner_items[:offset]
+    if all(
+        name in skip_planners and not getattr(fn, "reuses_state", False) for name, fn in ordered_items
+    ):
+        return []
+    grid, default_start, default_goal = generate_benchmark_maze(
+        width=width,
+        height=height,
+        seed=maze_seed,
+        algorithm=algorithm,
+    )
+    maze_queries = query_mod.generate_queries(
+        grid, default_start, default_goal, query_mix, queries_per_maze, seed=maze_seed
+    )
+
+    trials: list[TrialResult] = []
+    for planner_name, planner_fn in ordered_items:
+        call_kwargs = planner_kwargs[planner_name]
+        stateful = getattr(planner_fn, "reuses_state", False)
+        if planner_name in skip_planners:
+            if stateful:
+                # Replay skipped mazes untimed so later trials see the same
+                # planner history as an uninterrupted run.
+                for start, goal in maze_queries:
+                    try:
+                        planner_fn(_copy_grid(grid), start, goal, **call_kwargs)
+                    except Exception:
+                        pass
+            continue
+
+        preprocess_ms: float | None = None
+        preprocess = getattr(planner_fn, "preprocess", None)
+        if preprocess is not None:
+            with _timed_section(hygiene):
+                started = time.perf_counter()
+                try:
+                    index = preprocess(_copy_grid(grid))
+                except Exception:
+                    # The planner then does its per-grid work on every query.
+                    index = None
+                preprocess_ms = (time.perf_counter() - started) * 1000.0 / len(maze_queries)
+            call_kwargs = {**call_kwargs, "index": index}
+
+        for query_index, (start, goal) in enumerate(maze_queries):
+            raw_result, error_text, timings, peak_bytes, retained_blocks = _run_query_trial(
+                planner_name,
+                planner_fn,
+                call_kwargs,
+                grid,
+                start,
+                goal,
+                warmup=warmup,
+                repeats=repeats,
+                hygiene=hygiene,
+                profile_memory=profile_memory,
+                profiler=profiler,
+            )
+            elapsed_ms = bench_stats.percentile(timings, 50.0)
 
             reported_success, path, expansions = _normalize_planner_output(raw_result, start, goal)
             valid_path, path_length, validation_error = _validate_and_measure_path(
@@ -642,60 +1707,1530 @@ def run_benchmark(
                     path_length=path_length if success else None,
                     expansions=expansions,
                     error=error_text,
+                    timings_ms=tuple(timings),
+                    peak_memory_bytes=peak_bytes,
+                    retained_blocks=retained_blocks,
+                    query_index=query_index,
+                    preprocess_ms=preprocess_ms,
                 )
             )
+    return trials
 
-    return trials, summarize_trials(trials)
 
+# Per-process state for pool workers, filled by `_init_pool_worker`.
+_WORKER_STATE: dict[str, Any] = {}
 
-def run_benchmark_and_write_reports(
-    planners: Mapping[str, PlannerFn] | None = None,
-    maze_count: int = 50,
-    width: int = 15,
-    height: int = 15,
-    seed: int = 7,
-    algorithm: str = "backtracker",
-    output_dir: Path | str | None = None,
-) -> tuple[list[TrialResult], list[dict[str, Any]], Path, Path]:
-    output_dir = (
-        Path(output_dir)
-        if output_dir is not None
-        else Path(__file__).resolve().parents[1] / "results"
-    )
-    trials, summary_rows = run_benchmark(
-        planners=planners,
-        maze_count=maze_count,
-        width=width,
-        height=height,
-        seed=seed,
-        algorithm=algorithm,
+
+def _planner_specs(planner_items: list[tuple[str, PlannerFn]]) -> list[tuple[str, str | PlannerFn]]:
+    """Describe planners for workers: discoverable ones by name, others by reference."""
+    available = load_available_planners(include_alt=True)
+    specs: list[tuple[str, str | PlannerFn]] = []
+    for name, planner_fn in planner_items:
+        discovered = next((key for key, fn in available.items() if fn is planner_fn), None)
+        if discovered is not None:
+            specs.append((name, discovered))
+            continue
+        try:
+            pickle.dumps(planner_fn)
+        except Exception as exc:
+            raise ValueError(
+                f"Planner '{name}' cannot be sent to worker processes ({exc}); use jobs=1."
+            ) from exc
+        specs.append((name, planner_fn))
+    return specs
+
+
+def _pin_current_process(cpu: int) -> None:
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except (AttributeError, OSError) as exc:
+        print(f"[WARN] Could not pin benchmark worker to CPU {cpu}: {exc}")
+
+
+def _init_pool_worker(
+    planner_specs: list[tuple[str, str | PlannerFn]],
+    cpu_queue: Any | None,
+    warmup: int = 0,
+    repeats: int = 1,
+    prewarm: tuple[int, int, int, str] | None = None,
+    completed: frozenset[tuple[int, str]] = frozenset(),
+    time_budget_ms: float | None = None,
+    profile_memory: bool = False,
+    query_mix: str = "default",
+    queries_per_maze: int = 1,
+) -> None:
+    if cpu_queue is not None:
+        _pin_current_process(cpu_queue.get())
+    available: dict[str, PlannerFn] | None = None
+    planner_items: list[tuple[str, PlannerFn]] = []
+    for name, spec in planner_specs:
+        if isinstance(spec, str):
+            if available is None:
+                available = load_available_planners(include_alt=True)
+            planner_items.append((name, available[spec]))
+        else:
+            planner_items.append((name, spec))
+    _WORKER_STATE["planner_items"] = planner_items
+    _WORKER_STATE["planner_kwargs"] = _planner_call_kwargs(planner_items, PlannerWorkspace())
+    _WORKER_STATE["warmup"] = warmup
+    _WORKER_STATE["repeats"] = repeats
+    _WORKER_STATE["hygiene"] = prewarm is not None
+    _WORKER_STATE["completed"] = completed
+    _WORKER_STATE["time_budget_ms"] = time_budget_ms
+    _WORKER_STATE["profile_memory"] = profile_memory
+    _WORKER_STATE["query_mix"] = query_mix
+    _WORKER_STATE["queries_per_maze"] = queries_per_maze
+    _WORKER_STATE["spent"] = defaultdict(float)
+    if prewarm is not None:
+        _prewarm_planners(planner_items, _WORKER_STATE["planner_kwargs"], *prewarm)
+    # Forked workers inherit the parent's planner caches; start from cold ones.
+    _reset_planner_state(planner_items)
+
+
+def _run_chunk_in_worker(
+    task: tuple[tuple[str, ...], tuple[int, ...], int, int, int, str],
+) -> list[TrialResult]:
+    planner_names, maze_indices, seed, width, height, algorithm = task
+    by_name = dict(_WORKER_STATE["planner_items"])
+    planner_items = [(name, by_name[name]) for name in planner_names]
+    completed = _WORKER_STATE["completed"]
+    spent = _WORKER_STATE["spent"]
+    trials: list[TrialResult] = []
+    for maze_index in maze_indices:
+        active_items = _within_budget(planner_items, spent, _WORKER_STATE["time_budget_ms"])
+        if not active_items:
+            break
+        maze_trials = _run_maze_trials(
+            active_items,
+            _WORKER_STATE["planner_kwargs"],
+            maze_index,
+            seed + maze_index,
+            width,
+            height,
+            algorithm,
+            warmup=_WORKER_STATE["warmup"],
+            repeats=_WORKER_STATE["repeats"],
+            hygiene=_WORKER_STATE["hygiene"],
+            skip_planners={name for name in planner_names if (maze_index, name) in completed},
+            profile_memory=_WORKER_STATE["profile_memory"],
+            query_mix=_WORKER_STATE["query_mix"],
+            queries_per_maze=_WORKER_STATE["queries_per_maze"],
+        )
+        trials.extend(maze_trials)
+        _charge_budget(spent, maze_trials)
+    return trials
+
+
+def _init_isolated_worker(
+    planner_spec: tuple[str, str | PlannerFn],
+    warmup: int,
+    repeats: int,
+    hygiene: bool,
+    completed: frozenset[tuple[int, str]],
+    profile_memory: bool,
+    query_mix: str = "default",
+    queries_per_maze: int = 1,
+) -> None:
+    _init_pool_worker(
+        [planner_spec], None, warmup, repeats, None, completed, None, profile_memory, query_mix, queries_per_maze
     )
-    csv_path = write_results_csv(trials, output_dir / "benchmark_results.csv")
-    summary_path = write_summary_markdown(
-        summary_rows=summary_rows,
-        output_path=output_dir / "benchmark_summary.md",
-        maze_count=maze_count,
+    _WORKER_STATE["hygiene"] = hygiene
+
+
+def _prewarm_isolated_worker(width: int, height: int, seed: int, algorithm: str) -> dict[str, float]:
+    planner_items = _WORKER_STATE["planner_items"]
+    cold_ms = _prewarm_planners(planner_items, _WORKER_STATE["planner_kwargs"], width, height, seed, algorithm)
+    _reset_planner_state(planner_items)
+    return cold_ms
+
+
+def _run_isolated_chunk(task: tuple[tuple[str, ...], tuple[int, ...], int, int, int, str]) -> list[TrialResult]:
+    trials = _run_chunk_in_worker(task)
+    for trial in trials:
+        if trial.error is not None and trial.error.startswith("MemoryError"):
+            # Over the worker's memory limit: let `IsolatedWorker` report it as
+            # `oom` and respawn the process.
+            raise MemoryError(trial.error)
+    return trials
+
+
+def _isolation_failure_trial(
+    planner_name: str,
+    outcome: isolation.IsolatedResult,
+    elapsed_ms: float,
+    *,
+    maze_index: int,
+    maze_seed: int,
+    width: int,
+    height: int,
+    algorithm: str,
+) -> TrialResult:
+    return TrialResult(
+        planner=planner_name,
+        maze_index=maze_index,
+        maze_seed=maze_seed,
         width=width,
         height=height,
-        seed=seed,
         algorithm=algorithm,
+        success=False,
+        solve_time_ms=elapsed_ms,
+        path_length=None,
+        expansions=None,
+        error=outcome.status if outcome.detail is None else f"{outcome.status}: {outcome.detail}",
     )
-    return trials, summary_rows, csv_path, summary_path
 
 
-def _build_cli_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description="Benchmark maze planners over many generated mazes."
-    )
-    parser.add_argument("--mazes", type=int, default=50, help="Number of mazes to evaluate.")
-    parser.add_argument("--width", type=int, default=15, help="Maze width in cells.")
-    parser.add_argument("--height", type=int, default=15, help="Maze height in cells.")
-    parser.add_argument("--seed", type=int, default=7, help="Benchmark seed.")
-    parser.add_argument(
-        "--algorithm",
-        choices=sorted(maze_mod.SUPPORTED_MAZE_ALGORITHMS),
-        default="backtracker",
-        help="Maze generation algorithm.",
+def _run_isolated_trials(
+    planner_items: list[tuple[str, PlannerFn]],
+    *,
+    maze_indices: Sequence[int],
+    width: int,
+    height: int,
+    seed: int,
+    algorithm: str,
+    warmup: int = 0,
+    repeats: int = 1,
+    hygiene: bool = False,
+    completed: frozenset[tuple[int, str]] = frozenset(),
+    on_trial: Callable[[TrialResult], None] | None = None,
+    time_budget_ms: float | None = None,
+    keep_trials: bool = True,
+    profile_memory: bool = False,
+    trial_timeout_ms: float | None = None,
+    memory_limit_mb: float | None = None,
+    query_mix: str = "default",
+    queries_per_maze: int = 1,
+) -> tuple[list[TrialResult], dict[str, float] | None]:
+    """Run every planner in its own persistent `isolation.IsolatedWorker`.
+
+    Mazes and planners run in sequential order, one call at a time. Each
+    planner's whole per-maze task (every query, with warmup, repeats and
+    profiling calls) must
+    finish within `trial_timeout_ms` and `memory_limit_mb` of headroom over
+    the loaded worker. Otherwise the worker is killed and the trial is
+    recorded as failed with error `timeout`, `oom` or `crashed`, timed at the
+    wall-clock time it used. The planner's next trial runs in a fresh worker,
+    so a stateful planner starts from a cold cache there.
+
+    Returns the trials (empty unless `keep_trials`) and, with `hygiene`, the
+    cold call times measured in the workers.
+    """
+    timeout_s = trial_timeout_ms / 1000.0 if trial_timeout_ms is not None else None
+    memory_limit_bytes = int(memory_limit_mb * 1024 * 1024) if memory_limit_mb is not None else None
+    stateful = {name for name, fn in planner_items if getattr(fn, "reuses_state", False)}
+    workers = {
+        name: isolation.IsolatedWorker(
+            _init_isolated_worker,
+            ((name, spec), warmup, repeats, hygiene, completed, profile_memory, query_mix, queries_per_maze),
+            memory_limit_bytes=memory_limit_bytes,
+        )
+        for name, spec in _planner_specs(planner_items)
+    }
+    # Restart count at which each worker was last pre-warmed.
+    prewarmed: dict[str, int] = {}
+    cold_timings_ms: dict[str, float] = {}
+    trials: list[TrialResult] = []
+    spent: dict[str, float] = defaultdict(float)
+    try:
+        for maze_index in maze_indices:
+            active_items = _within_budget(planner_items, spent, time_budget_ms)
+            if not active_items:
+                break
+            maze_seed = seed + maze_index
+            offset = maze_index % len(active_items)
+            maze_trials: list[TrialResult] = []
+            for planner_name, _ in active_items[offset:] + active_items[:offset]:
+                done = (maze_index, planner_name) in completed
+                if done and planner_name not in stateful:
+                    continue
+                worker = workers[planner_name]
+                if hygiene and prewarmed.get(planner_name) != worker.restarts:
+                    warm = worker.call(_prewarm_isolated_worker, width, height, seed, algorithm, timeout_s=timeout_s)
+                    prewarmed[planner_name] = worker.restarts
+                    if warm.ok:
+                        for name, cold_ms in warm.value.items():
+                            cold_timings_ms.setdefault(name, cold_ms)
+                task = ((planner_name,), (maze_index,), seed, width, height, algorithm)
+                started = time.perf_counter()
+                outcome = worker.call(_run_isolated_chunk, task, timeout_s=timeout_s)
+                elapsed_ms = (time.perf_counter() - started) * 1000.0
+                if outcome.ok:
+                    maze_trials.extend(outcome.value)
+                elif not done:
+                    maze_trials.append(
+                        _isolation_failure_trial(
+                            planner_name,
+                            outcome,
+                            elapsed_ms,
+                            maze_index=maze_index,
+                            maze_seed=maze_seed,
+                            width=width,
+                            height=height,
+                            algorithm=algorithm,
+                        )
+                    )
+            if keep_trials:
+                trials.extend(maze_trials)
+            _charge_budget(spent, maze_trials)
+            if on_trial is not None:
+                for trial in maze_trials:
+                    on_trial(trial)
+    finally:
+        for worker in workers.values():
+            worker.close()
+    return trials, (cold_timings_ms if hygiene else None)
+
+
+def _within_budget(
+    planner_items: list[tuple[str, PlannerFn]],
+    spent: Mapping[str, float],
+    time_budget_ms: float | None,
+) -> list[tuple[str, PlannerFn]]:
+    if time_budget_ms is None:
+        return planner_items
+    return [item for item in planner_items if spent.get(item[0], 0.0) <= time_budget_ms]
+
+
+def _charge_budget(spent: dict[str, float], trials: Sequence[TrialResult]) -> None:
+    for trial in trials:
+        spent[trial.planner] += sum(trial.timings_ms) or trial.solve_time_ms
+
+
+def _run_trials_in_pool(
+    planner_items: list[tuple[str, PlannerFn]],
+    *,
+    maze_indices: Sequence[int],
+    width: int,
+    height: int,
+    seed: int,
+    algorithm: str,
+    jobs: int,
+    pin_cpus: bool,
+    warmup: int = 0,
+    repeats: int = 1,
+    hygiene: bool = False,
+    completed: frozenset[tuple[int, str]] = frozenset(),
+    on_trial: Callable[[TrialResult], None] | None = None,
+    time_budget_ms: float | None = None,
+    keep_trials: bool = True,
+    profile_memory: bool = False,
+    query_mix: str = "default",
+    queries_per_maze: int = 1,
+) -> list[TrialResult]:
+    """Distribute trials over `jobs` worker processes.
+
+    Trials come back in completion order (and are passed to `on_trial` as each
+    task finishes); `run_benchmark` restores sequential order. Stateless
+    planners are split into contiguous maze chunks. Planners marked
+    `reuses_state` (results depend on earlier calls, e.g. incremental LPA*)
+    run all mazes in order inside one task so their results match a
+    sequential run.
+    """
+    context = multiprocessing.get_context()
+    cpu_queue = None
+    if pin_cpus:
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(jobs))
+        cpu_queue = context.Queue()
+        for worker_index in range(jobs):
+            cpu_queue.put(cpus[worker_index % len(cpus)])
+
+    stateful = tuple(name for name, fn in planner_items if getattr(fn, "reuses_state", False))
+    stateless = tuple(name for name, _ in planner_items if name not in stateful)
+    maze_indices = tuple(maze_indices)
+    tasks = [((name,), maze_indices, seed, width, height, algorithm) for name in stateful]
+    if stateless:
+        chunk = max(1, math.ceil(len(maze_indices) / (jobs * 4)))
+        tasks.extend(
+            (stateless, maze_indices[first : first + chunk], seed, width, height, algorithm)
+            for first in range(0, len(maze_indices), chunk)
+        )
+
+    trials: list[TrialResult] = []
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=context,
+        initializer=_init_pool_worker,
+        initargs=(
+            _planner_specs(planner_items),
+            cpu_queue,
+            warmup,
+            repeats,
+            (width, height, seed, algorithm) if hygiene else None,
+            completed,
+            time_budget_ms,
+            profile_memory,
+            query_mix,
+            queries_per_maze,
+        ),
+    ) as pool:
+        futures = [pool.submit(_run_chunk_in_worker, task) for task in tasks]
+        for future in as_completed(futures):
+            for trial in future.result():
+                if keep_trials:
+                    trials.append(trial)
+                if on_trial is not None:
+                    on_trial(trial)
+    return trials
+
+
+def _ordered_trials(
+    trials: Sequence[TrialResult],
+    planner_items: list[tuple[str, PlannerFn]],
+    maze_count: int,
+) -> list[TrialResult]:
+    """Arrange trials in sequential-run order: maze by maze, rotated planners (queries in order), batched last."""
+    by_cell: dict[tuple[int, str], list[TrialResult]] = defaultdict(list)
+    for trial in trials:
+        by_cell[(trial.maze_index, trial.planner)].append(trial)
+    ordered: list[TrialResult] = []
+    for maze_index in range(maze_count):
+        offset = maze_index % len(planner_items)
+        for planner_name, _ in planner_items[offset:] + planner_items[:offset]:
+            ordered.extend(sorted(by_cell.get((maze_index, planner_name), ()), key=lambda t: t.query_index))
+    for maze_index in range(maze_count):
+        ordered.extend(by_cell.get((maze_index, BATCHED_PLANNER_NAME), ()))
+    return ordered
+
+
+def _check_completed_trials(
+    completed_trials: Sequence[TrialResult],
+    planner_names: set[str],
+    *,
+    maze_count: int,
+    width: int,
+    height: int,
+    seed: int,
+    algorithm: str,
+    queries_per_maze: int = 1,
+    shard: shard_mod.Shard | None = None,
+) -> list[TrialResult]:
+    """Validate resumed trials and keep only the (maze, planner) cells with every query.
+
+    A checkpoint cut off mid-cell holds some of a cell's queries; those cells
+    are dropped so the run repeats them whole.
+    """
+
+    queries_by_cell: dict[tuple[int, str], list[int]] = defaultdict(list)
+    for trial in completed_trials:
+        if (
+            trial.planner not in planner_names
+            or not 0 <= trial.maze_index < maze_count
+            or not 0 <= trial.query_index < queries_per_maze
+            or (shard is not None and not shard.owns(trial.maze_index))
+            or trial.maze_seed != seed + trial.maze_index
+            or (trial.width, trial.height, trial.algorithm) != (width, height, algorithm)
+        ):
+            raise ValueError(
+                f"Completed trial {trial.planner} on maze {trial.maze_index} "
+                "does not belong to this benchmark configuration; cannot resume."
+            )
+        queries_by_cell[(trial.maze_index, trial.planner)].append(trial.query_index)
+    incomplete = {
+        cell for cell, queries in queries_by_cell.items() if sorted(queries) != list(range(queries_per_maze))
+    }
+    if incomplete:
+        print(f"[INFO] Rerunning {len(incomplete)} partially checkpointed (maze, planner) cell(s).")
+    return [trial for trial in completed_trials if (trial.maze_index, trial.planner) not in incomplete]
+
+
+def run_benchmark(
+    planners: Mapping[str, PlannerFn] | None = None,
+    maze_count: int = 50,
+    width: int = 15,
+    height: int = 15,
+    seed: int = 7,
+    algorithm: str = "backtracker",
+    batched: bool = False,
+    jobs: int = 1,
+    pin_cpus: bool = False,
+    warmup: int = 0,
+    repeats: int = 1,
+    hygiene: bool = False,
+    cpu_affinity: int | None = None,
+    completed_trials: Sequence[TrialResult] = (),
+    on_trial: Callable[[TrialResult], None] | None = None,
+    time_budget_ms: float | None = None,
+    keep_trials: bool = True,
+    profile_memory: bool = False,
+    profiler: bench_profile.PlannerProfiler | None = None,
+    isolate: bool = False,
+    trial_timeout_ms: float | None = None,
+    memory_limit_mb: float | None = None,
+    query_mix: str = "default",
+    queries_per_maze: int = 1,
+    shard: shard_mod.Shard | None = None,
+    confidence: float = bench_stats.DEFAULT_CONFIDENCE,
+    first_maze: int = 0,
+) -> tuple[list[TrialResult], list[dict[str, Any]]]:
+    """Run every planner on every generated maze.
+
+    With `batched=True`, all mazes are additionally solved in one vectorized
+    wavefront pass and reported as the `batched_wavefront` planner, with its
+    wall-clock time amortized evenly across the mazes.
+
+    `jobs > 1` spreads mazes across a process pool (`jobs=0` uses every CPU);
+    each worker loads its own planners and trials are merged back in maze
+    order, so only timing columns differ from a sequential run. `pin_cpus`
+    binds each worker to one CPU where the OS supports it.
+
+    Each planner gets `warmup` untimed calls per maze before `repeats` timed
+    calls; a trial's `solve_time_ms` is the median of its repeats and the
+    summary ranks planners with a bootstrap CI seeded from `seed`.
+
+    `hygiene=True` pre-imports and pre-warms every planner on a maze outside
+    the benchmark set (reported per planner as `cold_solve_time_ms`), then
+    disables GC inside timed sections with an explicit collection before each
+    one. `cpu_affinity` pins a sequential run to one CPU for its duration.
+
+    `completed_trials` (e.g. read back from an interrupted run's CSV) are not
+    rerun; they are merged with the new trials before summarizing. Each new
+    trial is passed to `on_trial` as soon as it finishes.
+
+    `time_budget_ms` caps each planner's cumulative timed solve time: once a
+    planner exceeds it, its remaining mazes are not run (with `jobs > 1`,
+    each worker applies the cap to its own share of mazes).
+
+    `profile_memory=True` records each trial's tracemalloc peak and retained
+    blocks from one extra traced call (see `_run_maze_trials`), and the
+    summary ranks planners by median peak memory as well. A `profiler`
+    (`bench_profile.PlannerProfiler`) gets one extra call per planner and
+    maze; profiles live in this process, so it requires `jobs=1`.
+
+    `keep_trials=False` streams trials to `on_trial` only (e.g. a
+    `trial_store.ColumnarTrialWriter`) and returns an empty trial list; the
+    summary is built from compact in-memory columns instead.
+
+    `isolate=True` runs each planner in its own persistent worker subprocess
+    (see `_run_isolated_trials`), so planner state cannot leak between
+    planners and a runaway trial is killed after `trial_timeout_ms` or when
+    it allocates more than `memory_limit_mb`, and recorded as a failed
+    `timeout`/`oom` trial. Isolation runs sequentially (`jobs=1`).
+
+    Planners with a `reset_state` hook start every run from a cold cache.
+
+    `query_mix` picks each maze's queries (see `queries`): the default
+    corner-to-centre query, or `queries_per_maze` random, farthest or
+    dead-end-to-dead-end pairs. Indexed planners (a `preprocess` hook) build
+    their index once per maze; it is amortized over the maze's queries and
+    reported separately (see `summarize_trials`). Resumed runs skip whole
+    (maze, planner) cells; a cell missing some of its queries in
+    `completed_trials` (a checkpoint cut off mid-cell) is run again in full.
+
+    With a `shard` (`shards.Shard`), only the mazes that shard owns run and
+    the summary covers just those; `merge_shard_results` rebuilds the full
+    run from every shard's CSV. `confidence` sets the summary's CI level.
+
+    `first_maze` skips the mazes before it entirely (no untimed replays for
+    stateful planners); `completed_trials` for them still count in the
+    summary. This extends an earlier run by the mazes `first_maze` to
+    `maze_count - 1`, with stateful planners starting from a reset cache.
+    """
+    if maze_count < 1:
+        raise ValueError("maze_count must be >= 1.")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be within (0, 1).")
+    if jobs < 0:
+        raise ValueError("jobs must be >= 0.")
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if not 0 <= first_maze < maze_count:
+        raise ValueError("first_maze must be within [0, maze_count).")
+    maze_indices = shard.maze_indices(maze_count) if shard is not None else list(range(maze_count))
+    maze_indices = [index for index in maze_indices if index >= first_maze]
+    if not maze_indices:
+        raise ValueError(f"Shard {shard} owns none of mazes {first_maze}..{maze_count - 1}; use fewer shards.")
+    jobs = min(jobs, len(maze_indices))
+    if warmup < 0:
+        raise ValueError("warmup must be >= 0.")
+    if repeats < 1:
+        raise ValueError("repeats must be >= 1.")
+    if time_budget_ms is not None and time_budget_ms <= 0:
+        raise ValueError("time_budget_ms must be > 0.")
+    if cpu_affinity is not None and jobs > 1:
+        raise ValueError("cpu_affinity pins a sequential run; use pin_cpus with jobs > 1.")
+    if profiler is not None and jobs > 1:
+        raise ValueError("Profiling collects results in this process; run it with jobs=1.")
+    if isolate and (jobs != 1 or profiler is not None):
+        raise ValueError("isolate runs trials one at a time in worker processes; use jobs=1 without a profiler.")
+    if not isolate and (trial_timeout_ms is not None or memory_limit_mb is not None):
+        raise ValueError("trial_timeout_ms and memory_limit_mb require isolate=True.")
+    if trial_timeout_ms is not None and trial_timeout_ms <= 0:
+        raise ValueError("trial_timeout_ms must be > 0.")
+    if memory_limit_mb is not None and memory_limit_mb <= 0:
+        raise ValueError("memory_limit_mb must be > 0.")
+    if width < 2 or height < 2:
+        raise ValueError("Maze width and height must be >= 2.")
+    if query_mix not in query_mod.QUERY_MIXES:
+        raise ValueError(f"Unsupported query mix '{query_mix}'. Expected one of {list(query_mod.QUERY_MIXES)}.")
+    if queries_per_maze < 1:
+        raise ValueError("queries_per_maze must be >= 1.")
+    if query_mix == "default" and queries_per_maze != 1:
+        raise ValueError("The default query mix has one query per maze; pick another query_mix.")
+    if batched and query_mix != "default":
+        raise ValueError("The batched wavefront only solves the default query; use query_mix='default'.")
+
+    available = load_available_planners(include_alt=True)
+    if planners is None:
+        planners = _resolve_default_benchmark_planners(available)
+    planner_items = sorted(planners.items(), key=lambda item: item[0])
+    if not planner_items:
+        raise ValueError("At least one planner is required.")
+    if algorithm not in maze_mod.SUPPORTED_MAZE_ALGORITHMS:
+        raise ValueError(
+            f"Unsupported maze algorithm '{algorithm}'. "
+            f"Expected one of {sorted(maze_mod.SUPPORTED_MAZE_ALGORITHMS)}."
+        )
+    completed_trials = _check_completed_trials(
+        completed_trials,
+        {name for name, _ in planner_items} | ({BATCHED_PLANNER_NAME} if batched else set()),
+        maze_count=maze_count,
+        width=width,
+        height=height,
+        seed=seed,
+        algorithm=algorithm,
+        queries_per_maze=queries_per_maze,
+        shard=shard,
+    )
+    completed = frozenset((trial.maze_index, trial.planner) for trial in completed_trials)
+    summary_columns: trial_store.TrialColumnBuffer | None = None
+    if not keep_trials:
+        summary_columns = trial_store.TrialColumnBuffer()
+        for trial in completed_trials:
+            summary_columns.append(trial)
+        trial_sink = on_trial
+
+        def on_trial(trial: TrialResult) -> None:
+            summary_columns.append(trial)
+            if trial_sink is not None:
+                trial_sink(trial)
+
+    previous_affinity: set[int] | None = None
+    if cpu_affinity is not None:
+        previous_affinity = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+        _pin_current_process(cpu_affinity)
+
+    cold_timings_ms: dict[str, float] | None = None
+    # One reusable search workspace for every planner that accepts it; all
+    # benchmark mazes share a shape, so it is allocated once per run.
+    workspace = PlannerWorkspace()
+    planner_kwargs = _planner_call_kwargs(planner_items, workspace)
+    if hygiene and not isolate:
+        cold_timings_ms = _prewarm_planners(planner_items, planner_kwargs, width, height, seed, algorithm)
+    _reset_planner_state(planner_items)
+
+    if isolate:
+        try:
+            trials, cold_timings_ms = _run_isolated_trials(
+                planner_items,
+                maze_indices=maze_indices,
+                width=width,
+                height=height,
+                seed=seed,
+                algorithm=algorithm,
+                warmup=warmup,
+                repeats=repeats,
+                hygiene=hygiene,
+                completed=completed,
+                on_trial=on_trial,
+                time_budget_ms=time_budget_ms,
+                keep_trials=keep_trials,
+                profile_memory=profile_memory,
+                trial_timeout_ms=trial_timeout_ms,
+                memory_limit_mb=memory_limit_mb,
+                query_mix=query_mix,
+                queries_per_maze=queries_per_maze,
+            )
+        finally:
+            if previous_affinity is not None:
+                os.sched_setaffinity(0, previous_affinity)
+    elif jobs == 1:
+        trials: list[TrialResult] = []
+        spent: dict[str, float] = defaultdict(float)
+        try:
+            for maze_index in maze_indices:
+                active_items = _within_budget(planner_items, spent, time_budget_ms)
+                if not active_items:
+                    break
+                maze_trials = _run_maze_trials(
+                    active_items,
+                    planner_kwargs,
+                    maze_index,
+                    seed + maze_index,
+                    width,
+                    height,
+                    algorithm,
+                    warmup=warmup,
+                    repeats=repeats,
+                    hygiene=hygiene,
+                    skip_planners={name for name, _ in planner_items if (maze_index, name) in completed},
+                    profile_memory=profile_memory,
+                    profiler=profiler,
+                    query_mix=query_mix,
+                    queries_per_maze=queries_per_maze,
+                )
+                if keep_trials:
+                    trials.extend(maze_trials)
+                _charge_budget(spent, maze_trials)
+                if on_trial is not None:
+                    for trial in maze_trials:
+                        on_trial(trial)
+        finally:
+            if previous_affinity is not None:
+                os.sched_setaffinity(0, previous_affinity)
+    else:
+        trials = _run_trials_in_pool(
+            planner_items,
+            maze_indices=maze_indices,
+            width=width,
+            height=height,
+            seed=seed,
+            algorithm=algorithm,
+            jobs=jobs,
+            pin_cpus=pin_cpus,
+            warmup=warmup,
+            repeats=repeats,
+            hygiene=hygiene,
+            completed=completed,
+            on_trial=on_trial,
+            time_budget_ms=time_budget_ms,
+            keep_trials=keep_trials,
+            profile_memory=profile_memory,
+            query_mix=query_mix,
+            queries_per_maze=queries_per_maze,
+        )
+
+    batch_indices = [index for index in maze_indices if (index, BATCHED_PLANNER_NAME) not in completed]
+    if batched and batch_indices:
+        batch_mazes = [
+            (maze_index, seed + maze_index)
+            + generate_benchmark_maze(width=width, height=height, seed=seed + maze_index, algorithm=algorithm)
+            for maze_index in batch_indices
+        ]
+        batch_trials = _run_batched_trials(batch_mazes, width, height, algorithm)
+        if keep_trials:
+            trials.extend(batch_trials)
+        if on_trial is not None:
+            for trial in batch_trials:
+                on_trial(trial)
+
+    if summary_columns is not None:
+        return [], summarize_trials(
+            summary_columns.columns(), seed=seed, confidence=confidence, cold_timings_ms=cold_timings_ms
+        )
+    trials = _ordered_trials([*completed_trials, *trials], planner_items, maze_count)
+    return trials, summarize_trials(trials, seed=seed, confidence=confidence, cold_timings_ms=cold_timings_ms)
+
+
+# Where `run_benchmark_and_write_reports` puts trials: the checkpointed CSV or the columnar npz store.
+RESULT_SINKS: tuple[str, ...] = ("csv", "npz")
+
+
+# Fixed workload timed by `calibrate_machine` to normalize baselines per machine.
+CALIBRATION_MAZE: tuple[int, int, int] = (31, 31, 0)
+BASELINE_EXTRA_COLUMNS: tuple[str, ...] = ("calibration_ms", "normalized_time", "machine")
+
+
+def calibrate_machine(repeats: int = 7) -> float:
+    """Median time (ms) of A* on a fixed maze: this machine's speed unit for baselines."""
+    width, height, maze_seed = CALIBRATION_MAZE
+    grid, start, goal = generate_benchmark_maze(width=width, height=height, seed=maze_seed)
+    baseline_planners.astar(_copy_grid(grid), start, goal)
+    timings: list[float] = []
+    for _ in range(repeats):
+        trial_grid = _copy_grid(grid)
+        with _timed_section(True):
+            started = time.perf_counter()
+            baseline_planners.astar(trial_grid, start, goal)
+            timings.append((time.perf_counter() - started) * 1000.0)
+    return bench_stats.percentile(timings, 50.0)
+
+
+def save_baseline(trials: Sequence[TrialResult], output_path: Path, calibration_ms: float) -> Path:
+    """Write trials as a baseline CSV with times normalized by `calibration_ms`."""
+    if calibration_ms <= 0:
+        raise ValueError("calibration_ms must be > 0.")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    machine = " ".join(
+        (platform.node(), platform.machine(), platform.python_implementation(), platform.python_version())
+    )
+    with output_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow((*RESULTS_CSV_COLUMNS, *BASELINE_EXTRA_COLUMNS))
+        for trial in trials:
+            normalized = trial.solve_time_ms / calibration_ms
+            writer.writerow([*_trial_csv_row(trial), f"{calibration_ms:.6f}", f"{normalized:.6f}", machine])
+    return output_path
+
+
+def load_baseline(input_path: Path) -> tuple[list[TrialResult], float | None]:
+    """Read a baseline (or plain results) CSV and its calibration time, if recorded."""
+    trials = read_results_csv(input_path)
+    calibration_ms: float | None = None
+    with input_path.open(newline="", encoding="utf-8") as handle:
+        first = next(csv.DictReader(handle), None)
+    if first is not None and first.get("calibration_ms"):
+        calibration_ms = float(first["calibration_ms"])
+    return trials, calibration_ms
+
+
+def _baseline_key(trial: TrialResult) -> tuple[int, int, int, str, int]:
+    return (trial.maze_seed, trial.width, trial.height, trial.algorithm, trial.query_index)
+
+
+def compare_to_baseline(
+    trials: Sequence[TrialResult],
+    baseline_trials: Sequence[TrialResult],
+    *,
+    calibration_ms: float | None = None,
+    baseline_calibration_ms: float | None = None,
+    alpha: float = 0.01,
+    time_tolerance: float = 0.10,
+    expansion_tolerance: float = 0.0,
+) -> list[dict[str, Any]]:
+    """Compare per-planner results with a baseline run.
+
+    Solve times of successful trials are divided by each run's calibration
+    time (when both are known) and compared with one-sided Mann-Whitney U
+    tests. A timing regression needs `p < alpha` *and* a median slowdown
+    beyond `time_tolerance` (0.10 = 10%); improvements mirror that.
+    Expansions and successes are compared on mazes present in both runs; any
+    expansion growth beyond `expansion_tolerance` or lost success counts as a
+    regression.
+    """
+    if not 0.0 < alpha < 1.0:
+        raise ValueError("alpha must be within (0, 1).")
+    if time_tolerance < 0 or expansion_tolerance < 0:
+        raise ValueError("tolerances must be >= 0.")
+    normalize = calibration_ms is not None and baseline_calibration_ms is not None
+    current_unit = calibration_ms if normalize else 1.0
+    baseline_unit = baseline_calibration_ms if normalize else 1.0
+
+    current_by_planner: dict[str, list[TrialResult]] = defaultdict(list)
+    baseline_by_planner: dict[str, list[TrialResult]] = defaultdict(list)
+    for trial in trials:
+        current_by_planner[trial.planner].append(trial)
+    for trial in baseline_trials:
+        baseline_by_planner[trial.planner].append(trial)
+
+    rows: list[dict[str, Any]] = []
+    for planner_name in sorted(set(current_by_planner) & set(baseline_by_planner)):
+        current = current_by_planner[planner_name]
+        baseline = baseline_by_planner[planner_name]
+        current_times = [t.solve_time_ms / current_unit for t in current if t.success]
+        baseline_times = [t.solve_time_ms / baseline_unit for t in baseline if t.success]
+        current_median = bench_stats.percentile(current_times, 50.0)
+        baseline_median = bench_stats.percentile(baseline_times, 50.0)
+        ratio = current_median / baseline_median if baseline_median > 0 else math.nan
+        _, p_slower = bench_stats.mann_whitney_u(current_times, baseline_times, alternative="greater")
+        _, p_faster = bench_stats.mann_whitney_u(current_times, baseline_times, alternative="less")
+        if not current_times or not baseline_times:
+            time_verdict = "n/a"
+        elif p_slower < alpha and ratio > 1.0 + time_tolerance:
+            time_verdict = "regression"
+        elif p_faster < alpha and ratio < 1.0 / (1.0 + time_tolerance):
+            time_verdict = "improvement"
+        else:
+            time_verdict = "unchanged"
+
+        baseline_by_key = {_baseline_key(t): t for t in baseline}
+        pairs = [(t, baseline_by_key[_baseline_key(t)]) for t in current if _baseline_key(t) in baseline_by_key]
+        expansion_pairs = [
+            (cur.expansions, base.expansions)
+            for cur, base in pairs
+            if cur.success and base.success and cur.expansions is not None and base.expansions is not None
+        ]
+        base_expansions = sum(base for _, base in expansion_pairs)
+        expansion_ratio = (
+            sum(cur for cur, _ in expansion_pairs) / base_expansions if base_expansions > 0 else math.nan
+        )
+        if math.isnan(expansion_ratio):
+            expansion_verdict = "n/a"
+        elif expansion_ratio > 1.0 + expansion_tolerance:
+            expansion_verdict = "regression"
+        elif expansion_ratio < 1.0 / (1.0 + expansion_tolerance):
+            expansion_verdict = "improvement"
+        else:
+            expansion_verdict = "unchanged"
+
+        current_successes = sum(cur.success for cur, _ in pairs)
+        baseline_successes = sum(base.success for _, base in pairs)
+        success_verdict = "regression" if current_successes < baseline_successes else "ok"
+
+        verdicts = (time_verdict, expansion_verdict, success_verdict)
+        rows.append(
+            {
+                "planner": planner_name,
+                # Baseline median expressed in this machine's time units.
+                "baseline_median_ms": baseline_median * current_unit,
+                "current_median_ms": current_median * current_unit,
+                "time_ratio": ratio,
+                "p_slower": p_slower,
+                "p_faster": p_faster,
+                "time_verdict": time_verdict,
+                "expansion_ratio": expansion_ratio,
+                "expansion_verdict": expansion_verdict,
+                "shared_mazes": len(pairs),
+                "current_successes": current_successes,
+                "baseline_successes": baseline_successes,
+                "success_verdict": success_verdict,
+                "verdict": (
+                    "regression"
+                    if "regression" in verdicts
+                    else "improvement" if "improvement" in verdicts else "unchanged"
+                ),
+                "normalized": normalize,
+            }
+        )
+    return rows
+
+
+def render_console_comparison_table(comparison_rows: list[dict[str, Any]]) -> str:
+    if not comparison_rows:
+        return "No planners in common with the baseline."
+    headers = [
+        ("Planner", "left"),
+        ("Baseline Median (ms)", "right"),
+        ("Current Median (ms)", "right"),
+        ("Ratio", "right"),
+        ("p (slower)", "right"),
+        ("Time", "left"),
+        ("Expansion Ratio", "right"),
+        ("Expansions", "left"),
+        ("Successes", "right"),
+        ("Verdict", "left"),
+    ]
+    body = [
+        [
+            str(row["planner"]),
+            _fmt_metric(row["baseline_median_ms"]),
+            _fmt_metric(row["current_median_ms"]),
+            _fmt_metric(row["time_ratio"]),
+            f"{row['p_slower']:.4f}",
+            str(row["time_verdict"]),
+            _fmt_metric(row["expansion_ratio"]),
+            str(row["expansion_verdict"]),
+            f"{row['current_successes']}/{row['baseline_successes']}",
+            str(row["verdict"]).upper() if row["verdict"] == "regression" else str(row["verdict"]),
+        ]
+        for row in comparison_rows
+    ]
+    return _render_text_table(headers, body)
+
+
+DEFAULT_SWEEP_SIZES: tuple[int, ...] = (15, 31, 63, 127, 255, 511)
+# Per-planner, per-size cap used by sweeps when no budget is given.
+DEFAULT_SWEEP_TIME_BUDGET_MS = 60_000.0
+
+
+def _predicted_trial_ms(history: list[tuple[int, float]], cells: int) -> float:
+    """Extrapolate a planner's per-maze time to `cells` from its previous sizes."""
+    if not history:
+        return 0.0
+    last_cells, last_ms = history[-1]
+    slope = bench_stats.loglog_slope([c for c, _ in history[-2:]], [ms for _, ms in history[-2:]])
+    # Assume at least linear growth until two sizes give a measured slope.
+    exponent = max(slope, 1.0) if not math.isnan(slope) else 1.0
+    return last_ms * (cells / last_cells) ** exponent
+
+
+def summarize_scaling(
+    trials: Sequence[TrialResult],
+    sizes: Sequence[int],
+    maze_count: int,
+) -> list[dict[str, Any]]:
+    """Per-planner medians by maze size and log-log fits against maze cell count.
+
+    `cut_off_at` is the first sweep size where a planner ran fewer than
+    `maze_count` distinct mazes (time budget exhausted or skipped), else
+    None; a maze with several queries counts once.
+    """
+    grouped: dict[str, dict[int, list[TrialResult]]] = defaultdict(lambda: defaultdict(list))
+    for trial in trials:
+        if trial.width == trial.height:
+            grouped[trial.planner][trial.width].append(trial)
+
+    rows: list[dict[str, Any]] = []
+    for planner_name in sorted(grouped):
+        by_size = grouped[planner_name]
+        planner_sizes = sorted(by_size)
+        medians: dict[int, float] = {}
+        expansions: dict[int, float] = {}
+        for size in planner_sizes:
+            medians[size] = bench_stats.percentile([t.solve_time_ms for t in by_size[size]], 50.0)
+            valid = [t.expansions for t in by_size[size] if t.success and t.expansions is not None]
+            expansions[size] = mean(valid) if valid else math.nan
+        cells = [size * size for size in planner_sizes]
+        rows.append(
+            {
+                "planner": planner_name,
+                "median_solve_time_ms": medians,
+                "mean_expansions": expansions,
+                "runs": {size: len(by_size[size]) for size in planner_sizes},
+                "time_slope": bench_stats.loglog_slope(cells, [medians[size] for size in planner_sizes]),
+                "expansion_slope": bench_stats.loglog_slope(cells, [expansions[size] for size in planner_sizes]),
+                "cut_off_at": next(
+                    (
+                        size
+                        for size in sorted(sizes)
+                        if len({t.maze_index for t in by_size.get(size, ())}) < maze_count
+                    ),
+                    None,
+                ),
+            }
+        )
+    return rows
+
+
+def run_size_sweep(
+    planners: Mapping[str, PlannerFn] | None = None,
+    sizes: Sequence[int] = DEFAULT_SWEEP_SIZES,
+    maze_count: int = 50,
+    seed: int = 7,
+    algorithm: str = "backtracker",
+    time_budget_ms: float | None = DEFAULT_SWEEP_TIME_BUDGET_MS,
+    completed_trials: Sequence[TrialResult] = (),
+    on_trial: Callable[[TrialResult], None] | None = None,
+    confidence: float = bench_stats.DEFAULT_CONFIDENCE,
+    **run_options: Any,
+) -> tuple[list[TrialResult], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Run the planner matrix on square mazes of each size in `sizes`.
+
+    A planner is cut off at the first size where it exhausts `time_budget_ms`
+    (cumulative solve time at that size) or where extrapolating its previous
+    sizes predicts a single maze would exceed the budget; it is not run on
+    larger sizes. Remaining keyword arguments go to `run_benchmark`.
+
+    Returns all trials, the combined summary and `summarize_scaling` rows.
+    """
+    sizes = sorted(set(sizes))
+    if not sizes or sizes[0] < 2:
+        raise ValueError("sizes must contain maze sizes >= 2.")
+    stray = [t for t in completed_trials if t.width != t.height or t.width not in sizes]
+    if stray:
+        raise ValueError(
+            f"Completed trial {stray[0].planner} at {stray[0].width}x{stray[0].height} "
+            "is not part of this sweep; cannot resume."
+        )
+    if planners is None:
+        planners = _resolve_default_benchmark_planners(load_available_planners(include_alt=True))
+    active = dict(planners)
+    shard: shard_mod.Shard | None = run_options.get("shard")
+    size_maze_count = len(shard.maze_indices(maze_count)) if shard is not None else maze_count
+    history: dict[str, list[tuple[int, float]]] = defaultdict(list)
+    cold_timings_ms: dict[str, float] = {}
+    trials: list[TrialResult] = []
+    for size in sizes:
+        cells = size * size
+        if time_budget_ms is not None:
+            for name in list(active):
+                if _predicted_trial_ms(history[name], cells) > time_budget_ms:
+                    del active[name]
+        if not active:
+            break
+        size_trials, size_rows = run_benchmark(
+            planners=active,
+            maze_count=maze_count,
+            width=size,
+            height=size,
+            seed=seed,
+            algorithm=algorithm,
+            time_budget_ms=time_budget_ms,
+            completed_trials=[
+                t
+                for t in completed_trials
+                if t.width == size and (t.planner in active or t.planner == BATCHED_PLANNER_NAME)
+            ],
+            on_trial=on_trial,
+            confidence=confidence,
+            **run_options,
+        )
+        trials.extend(size_trials)
+        for row in size_rows:
+            cold_timings_ms.setdefault(str(row["planner"]), float(row.get("cold_solve_time_ms", math.nan)))
+        for name in list(active):
+            planner_times = [t.solve_time_ms for t in size_trials if t.planner == name]
+            if planner_times:
+                history[name].append((cells, bench_stats.percentile(planner_times, 50.0)))
+            ran_mazes = {t.maze_index for t in size_trials if t.planner == name}
+            if time_budget_ms is not None and len(ran_mazes) < size_maze_count:
+                del active[name]
+
+    cold = {name: ms for name, ms in cold_timings_ms.items() if not math.isnan(ms)}
+    summary_rows = summarize_trials(trials, seed=seed, confidence=confidence, cold_timings_ms=cold or None)
+    return trials, summary_rows, summarize_scaling(trials, sizes, size_maze_count)
+
+
+def run_benchmark_and_write_reports(
+    planners: Mapping[str, PlannerFn] | None = None,
+    maze_count: int = 50,
+    width: int = 15,
+    height: int = 15,
+    seed: int = 7,
+    algorithm: str = "backtracker",
+    output_dir: Path | str | None = None,
+    batched: bool = False,
+    jobs: int = 1,
+    pin_cpus: bool = False,
+    warmup: int = 0,
+    repeats: int = 1,
+    hygiene: bool = False,
+    cpu_affinity: int | None = None,
+    resume: bool = False,
+    fsync_every: int = 25,
+    sizes: Sequence[int] | None = None,
+    time_budget_ms: float | None = None,
+    sink: str = "csv",
+    export_csv: bool = False,
+    progress_every_s: float | None = None,
+    profile_memory: bool = False,
+    profiler: bench_profile.PlannerProfiler | None = None,
+    isolate: bool = False,
+    trial_timeout_ms: float | None = None,
+    memory_limit_mb: float | None = None,
+    query_mix: str = "default",
+    queries_per_maze: int = 1,
+    shard: shard_mod.Shard | None = None,
+    adaptive_batch_mazes: int | None = None,
+    adaptive_time_budget_s: float | None = None,
+    confidence: float = bench_stats.DEFAULT_CONFIDENCE,
+) -> tuple[list[TrialResult], list[dict[str, Any]], Path, Path]:
+    """Run the benchmark and write the results, Markdown summary and `benchmark_metadata.json`.
+
+    Trials are appended to `benchmark_results.csv` as they finish (fsync'ed
+    every `fsync_every` rows), so an interrupted run keeps its progress. With
+    `resume=True`, trials already in that CSV are skipped and merged into the
+    summary. The finished CSV is rewritten in sequential-run order.
+
+    With `sizes`, `run_size_sweep` runs every size (ignoring `width`/`height`)
+    and the summary gains a scaling table.
+
+    `sink="npz"` streams trials into the columnar `benchmark_results.npz`
+    instead (see `trial_store`) without keeping them in memory, so the
+    returned trial list is empty; `export_csv=True` also writes the CSV from
+    that store. The npz sink supports neither `resume` nor `sizes`.
+
+    `progress_every_s` prints a live `OnlineTrialSummary` status line at most
+    that often while trials arrive. `profile_memory` adds per-trial peak
+    memory and retained blocks to the results and a memory ranking to the
+    summary. A `profiler` profiles every planner separately; its `.pstats`
+    and collapsed-stack files go to `profiles/` in the output directory.
+    `isolate`, `trial_timeout_ms`, `memory_limit_mb`, `query_mix` and
+    `queries_per_maze` go to `run_benchmark`.
+
+    A `shard` runs only that shard's mazes and writes to
+    `shards/<i>-of-<N>/` under `output_dir`, where `merge_shard_results`
+    finds it.
+
+    `adaptive_batch_mazes` switches to `bench_adaptive.run_adaptive_benchmark`:
+    mazes are added in batches of that size, up to `maze_count`, until the
+    ranking is settled at `confidence` or `adaptive_time_budget_s` runs out.
+    The summary and metadata record the mazes used and why the run stopped.
+    """
+    if sink not in RESULT_SINKS:
+        raise ValueError(f"Unsupported sink '{sink}'. Expected one of {list(RESULT_SINKS)}.")
+    if sink == "npz" and (resume or sizes):
+        raise ValueError("The npz sink does not support resume or size sweeps; use sink='csv'.")
+    if adaptive_batch_mazes is None and adaptive_time_budget_s is not None:
+        raise ValueError("adaptive_time_budget_s needs adaptive_batch_mazes.")
+    if adaptive_batch_mazes is not None and (sink != "csv" or sizes or shard is not None):
+        raise ValueError("Adaptive runs support neither the npz sink, size sweeps nor shards.")
+    output_dir = (
+        Path(output_dir)
+        if output_dir is not None
+        else Path(__file__).resolve().parents[1] / "results"
+    )
+    if shard is not None:
+        output_dir = shard_output_dir(output_dir, shard)
+    results_path = output_dir / "benchmark_results.csv"
+    completed_trials = read_results_csv(results_path) if resume and results_path.exists() else []
+    run_options: dict[str, Any] = {
+        "batched": batched,
+        "jobs": jobs,
+        "pin_cpus": pin_cpus,
+        "warmup": warmup,
+        "repeats": repeats,
+        "hygiene": hygiene,
+        "cpu_affinity": cpu_affinity,
+        "profile_memory": profile_memory,
+        "profiler": profiler,
+        "isolate": isolate,
+        "trial_timeout_ms": trial_timeout_ms,
+        "memory_limit_mb": memory_limit_mb,
+        "query_mix": query_mix,
+        "queries_per_maze": queries_per_maze,
+        "shard": shard,
+        "confidence": confidence,
+    }
+    run_maze_count = len(shard.maze_indices(maze_count)) if shard is not None else maze_count
+    progress: _ProgressPrinter | None = None
+    if progress_every_s is not None:
+        if planners is None:
+            planners = _resolve_default_benchmark_planners(load_available_planners(include_alt=True))
+        planner_names = [*planners, *([BATCHED_PLANNER_NAME] if batched else [])]
+        progress = _ProgressPrinter(
+            OnlineTrialSummary(planner_names, confidence=confidence),
+            run_maze_count * queries_per_maze * len(planner_names) * max(1, len(set(sizes or ()))),
+            progress_every_s,
+        )
+        for trial in completed_trials:
+            progress.summary.add(trial)
+    extra_sinks = (progress,) if progress is not None else ()
+    scaling_rows: list[dict[str, Any]] | None = None
+    adaptive: bench_adaptive.AdaptiveOutcome | None = None
+    if sink == "npz":
+        store_path = output_dir / "benchmark_results.npz"
+        with trial_store.ColumnarTrialWriter(store_path) as store:
+            trials, summary_rows = run_benchmark(
+                planners=planners,
+                maze_count=maze_count,
+                width=width,
+                height=height,
+                seed=seed,
+                algorithm=algorithm,
+                on_trial=_fan_out(store.write, *extra_sinks),
+                time_budget_ms=time_budget_ms,
+                keep_trials=False,
+                **run_options,
+            )
+        results_file = store_path
+        if export_csv:
+            write_results_csv(trial_store.iter_trials(store_path), results_path)
+    else:
+        with TrialCsvWriter(results_path, append=resume, fsync_every=fsync_every) as checkpoint:
+            if sizes:
+                trials, summary_rows, scaling_rows = run_size_sweep(
+                    planners=planners,
+                    sizes=sizes,
+                    maze_count=maze_count,
+                    seed=seed,
+                    algorithm=algorithm,
+                    time_budget_ms=time_budget_ms if time_budget_ms is not None else DEFAULT_SWEEP_TIME_BUDGET_MS,
+                    completed_trials=completed_trials,
+                    on_trial=_fan_out(checkpoint.write, *extra_sinks),
+                    **run_options,
+                )
+            elif adaptive_batch_mazes is not None:
+                # Imported here: bench_adaptive builds on this module.
+                import bench_adaptive
+
+                trials, summary_rows, adaptive = bench_adaptive.run_adaptive_benchmark(
+                    planners=planners,
+                    batch_mazes=adaptive_batch_mazes,
+                    max_mazes=maze_count,
+                    time_budget_s=adaptive_time_budget_s,
+                    completed_trials=completed_trials,
+                    width=width,
+                    height=height,
+                    seed=seed,
+                    algorithm=algorithm,
+                    on_trial=_fan_out(checkpoint.write, *extra_sinks),
+                    time_budget_ms=time_budget_ms,
+                    **run_options,
+                )
+            else:
+                trials, summary_rows = run_benchmark(
+                    planners=planners,
+                    maze_count=maze_count,
+                    width=width,
+                    height=height,
+                    seed=seed,
+                    algorithm=algorithm,
+                    completed_trials=completed_trials,
+                    on_trial=_fan_out(checkpoint.write, *extra_sinks),
+                    time_budget_ms=time_budget_ms,
+                    **run_options,
+                )
+        results_file = write_results_csv(trials, results_path)
+    if progress is not None:
+        print(f"[INFO] Progress: {progress.summary.progress_line(progress.total_trials)}", flush=True)
+    if adaptive is not None:
+        print(f"[INFO] Adaptive sampling: {adaptive.describe()}", flush=True)
+    if profiler is not None:
+        profiler.write(output_dir / "profiles")
+    summary_path = write_summary_markdown(
+        summary_rows=summary_rows,
+        output_path=output_dir / "benchmark_summary.md",
+        maze_count=adaptive.maze_count if adaptive is not None else maze_count,
+        width=width,
+        height=height,
+        seed=seed,
+        algorithm=algorithm,
+        warmup=warmup,
+        repeats=repeats,
+        hygiene=hygiene,
+        scaling_rows=scaling_rows,
+        query_mix=query_mix,
+        queries_per_maze=queries_per_maze,
+        adaptive=adaptive,
+        shard_text=(
+            f"shard {shard} (round-robin); this run covers {run_maze_count} of {maze_count} mazes"
+            if shard is not None
+            else None
+        ),
+    )
+    write_run_metadata(
+        build_run_metadata(
+            summary_rows,
+            maze_count=adaptive.maze_count if adaptive is not None else maze_count,
+            width=width,
+            height=height,
+            seed=seed,
+            algorithm=algorithm,
+            batched=batched,
+            jobs=jobs,
+            pin_cpus=pin_cpus,
+            warmup=warmup,
+            repeats=repeats,
+            hygiene=hygiene,
+            cpu_affinity=cpu_affinity,
+            sizes=sorted(set(sizes)) if sizes else None,
+            time_budget_ms=time_budget_ms,
+            profile_memory=profile_memory,
+            profile=profiler.mode if profiler is not None else None,
+            isolate=isolate,
+            trial_timeout_ms=trial_timeout_ms,
+            memory_limit_mb=memory_limit_mb,
+            query_mix=query_mix,
+            queries_per_maze=queries_per_maze,
+            shard=shard,
+            confidence=confidence,
+            adaptive=(
+                {
+                    "batch_mazes": adaptive_batch_mazes,
+                    "max_mazes": maze_count,
+                    "time_budget_s": adaptive_time_budget_s,
+                    **asdict(adaptive),
+                }
+                if adaptive is not None
+                else None
+            ),
+        ),
+        output_dir / "benchmark_metadata.json",
+    )
+    return trials, summary_rows, results_file, summary_path
+
+
+def shard_output_dir(output_dir: Path | str, shard: shard_mod.Shard) -> Path:
+    """Where a sharded run under `output_dir` writes its results."""
+    return Path(output_dir) / "shards" / shard.label
+
+
+# Settings every shard of one run must agree on (`benchmark_metadata.json`).
+_SHARD_CONFIG_KEYS = (
+    "maze_count",
+    "width",
+    "height",
+    "seed",
+    "algorithm",
+    "batched",
+    "sizes",
+    "time_budget_ms",
+    "queries",
+    "confidence",
+)
+_SHARD_TIMING_KEYS = ("warmup", "repeats")
+
+
+def _shard_results_path(path: Path | str) -> Path:
+    path = Path(path)
+    return path / "benchmark_results.csv" if path.is_dir() else path
+
+
+def _shard_config(metadata: Mapping[str, Any]) -> dict[str, Any]:
+    config = {key: metadata["benchmark"].get(key) for key in _SHARD_CONFIG_KEYS}
+    config.update({key: metadata["timing"].get(key) for key in _SHARD_TIMING_KEYS})
+    config["hygiene"] = bool(metadata["timing"].get("hygiene", {}).get("enabled", False))
+    return config
+
+
+def merge_shard_results(
+    inputs: Sequence[Path | str],
+    output_dir: Path | str,
+    *,
+    allow_partial: bool = False,
+) -> tuple[list[TrialResult], list[dict[str, Any]], Path, Path]:
+    """Combine sharded runs into one run's CSV, Markdown summary and metadata.
+
+    Each input is a shard's results CSV or its output directory; the shard's
+    `benchmark_metadata.json` must sit next to the CSV. Raises ValueError if
+    the shards were run with different settings, if a trial appears twice or
+    lies outside its shard, or (unless `allow_partial`) if a shard is missing.
+    Planners missing some (maze, query) cells, e.g. cut off by a time budget,
+    only get a warning.
+    """
+    if not inputs:
+        raise ValueError("No shard results to merge.")
+    shards_seen: dict[shard_mod.Shard, Path] = {}
+    config: dict[str, Any] | None = None
+    cold_by_planner: dict[str, list[float]] = defaultdict(list)
+    trials: list[TrialResult] = []
+    owner: dict[tuple[str, TrialKey], shard_mod.Shard] = {}
+    for item in inputs:
+        results_path = _shard_results_path(item)
+        metadata_path = results_path.with_name("benchmark_metadata.json")
+        if not results_path.exists() or not metadata_path.exists():
+            raise ValueError(f"{results_path.parent} has no benchmark_results.csv with benchmark_metadata.json.")
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+        shard_info = metadata["benchmark"].get("shard")
+        if not shard_info:
+            raise ValueError(f"{results_path} is not from a sharded run (no shard in its metadata).")
+        shard = shard_mod.Shard(int(shard_info["index"]), int(shard_info["count"]))
+        if shard in shards_seen:
+            raise ValueError(f"Shard {shard} appears twice: {shards_seen[shard]} and {results_path}.")
+        shards_seen[shard] = results_path
+        shard_config = _shard_config(metadata)
+        if config is None:
+            config = shard_config
+        elif shard_config != config:
+            differing = sorted(key for key in config if config[key] != shard_config[key])
+            raise ValueError(f"Shard {shard} was run with different settings ({', '.join(differing)}).")
+        for planner_name, ms in metadata.get("cold_timings_ms", {}).items():
+            cold_by_planner[planner_name].append(float(ms))
+        for trial in read_results_csv(results_path):
+            if not shard.owns(trial.maze_index):
+                raise ValueError(f"Shard {shard} has a trial on maze {trial.maze_index}, which it does not own.")
+            key = (trial.planner, _trial_key(trial))
+            if key in owner:
+                raise ValueError(
+                    f"Duplicate trial: {trial.planner} on maze {trial.maze_index} (query {trial.query_index}, "
+                    f"{trial.width}x{trial.height}) in shards {owner[key]} and {shard}."
+                )
+            owner[key] = shard
+            trials.append(trial)
+    assert config is not None
+
+    counts = {shard.count for shard in shards_seen}
+    if len(counts) != 1:
+        raise ValueError(f"Shards come from runs split different ways: {sorted(str(s) for s in shards_seen)}.")
+    shard_count = counts.pop()
+    missing_shards = [str(shard) for shard in shard_mod.all_shards(shard_count) if shard not in shards_seen]
+    if missing_shards and not allow_partial:
+        raise ValueError(
+            f"Missing shard(s) {', '.join(missing_shards)}; use --allow-partial (allow_partial=True) to merge anyway."
+        )
+    if missing_shards:
+        print(f"[WARN] Merging without shard(s) {', '.join(missing_shards)}; the summary covers fewer mazes.")
+
+    maze_count = int(config["maze_count"])
+    sizes = config["sizes"]
+    queries_per_maze = int(config["queries"]["per_maze"])
+    owned_mazes = sorted(index for shard in shards_seen for index in shard.maze_indices(maze_count))
+    dimensions = [(size, size) for size in sizes] if sizes else [(int(config["width"]), int(config["height"]))]
+    cells_by_planner: dict[str, set[tuple[int, int, int, int]]] = defaultdict(set)
+    for trial in trials:
+        cells_by_planner[trial.planner].add((trial.width, trial.height, trial.maze_index, trial.query_index))
+    for planner_name in sorted(cells_by_planner):
+        queries = 1 if planner_name == BATCHED_PLANNER_NAME else queries_per_maze
+        expected = len(dimensions) * len(owned_mazes) * queries
+        if len(cells_by_planner[planner_name]) < expected:
+            print(
+                f"[WARN] {planner_name} has {len(cells_by_planner[planner_name])} of {expected} "
+                "(size, maze, query) trials; the rest were cut off or never run."
+            )
+
+    trials.sort(
+        key=lambda t: (t.width, t.height, t.maze_index, t.planner == BATCHED_PLANNER_NAME, t.planner, t.query_index)
+    )
+    cold = {name: bench_stats.percentile(values, 50.0) for name, values in cold_by_planner.items()}
+    seed = int(config["seed"])
+    # Shards from before confidence was recorded used the default.
+    confidence = float(config["confidence"] or bench_stats.DEFAULT_CONFIDENCE)
+    summary_rows = summarize_trials(trials, seed=seed, confidence=confidence, cold_timings_ms=cold or None)
+    scaling_rows = summarize_scaling(trials, sizes, len(owned_mazes)) if sizes else None
+
+    output_dir = Path(output_dir)
+    results_path = write_results_csv(trials, output_dir / "benchmark_results.csv")
+    summary_path = write_summary_markdown(
+        summary_rows=summary_rows,
+        output_path=output_dir / "benchmark_summary.md",
+        maze_count=len(owned_mazes),
+        width=int(config["width"]),
+        height=int(config["height"]),
+        seed=seed,
+        algorithm=str(config["algorithm"]),
+        warmup=int(config["warmup"]),
+        repeats=int(config["repeats"]),
+        hygiene=bool(config["hygiene"]),
+        scaling_rows=scaling_rows,
+        query_mix=str(config["queries"]["mix"]),
+        queries_per_maze=queries_per_maze,
+        shard_text=f"merged from {len(shards_seen)} of {shard_count} shard(s)"
+        + (f", without {', '.join(missing_shards)}" if missing_shards else ""),
+    )
+    metadata = build_run_metadata(
+        summary_rows,
+        maze_count=maze_count,
+        width=int(config["width"]),
+        height=int(config["height"]),
+        seed=seed,
+        algorithm=str(config["algorithm"]),
+        batched=bool(config["batched"]),
+        warmup=int(config["warmup"]),
+        repeats=int(config["repeats"]),
+        hygiene=bool(config["hygiene"]),
+        sizes=sizes,
+        time_budget_ms=config["time_budget_ms"],
+        query_mix=str(config["queries"]["mix"]),
+        queries_per_maze=queries_per_maze,
+        confidence=confidence,
+    )
+    metadata["merged_from"] = {str(shard): str(path) for shard, path in sorted(shards_seen.items())}
+    write_run_metadata(metadata, output_dir / "benchmark_metadata.json")
+    return trials, summary_rows, results_path, summary_path
+
+
+def _parse_sizes(text: str) -> tuple[int, ...]:
+    try:
+        sizes = tuple(int(part) for part in text.split(",") if part.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got '{text}'") from None
+    if not sizes or min(sizes) < 2:
+        raise argparse.ArgumentTypeError("sizes must be integers >= 2")
+    return sizes
+
+
+def _parse_scenario_kinds(text: str) -> tuple[str, ...]:
+    kinds = tuple(part.strip() for part in text.split(",") if part.strip())
+    unknown = [kind for kind in kinds if kind not in scenario_mod.SCENARIO_KINDS]
+    if not kinds or unknown:
+        raise argparse.ArgumentTypeError(
+            f"expected comma-separated kinds from {', '.join(scenario_mod.SCENARIO_KINDS)}, got '{text}'"
+        )
+    return kinds
+
+
+def _parse_param_grid(text: str) -> tuple[str, sweep_mod.ParamGrid]:
+    try:
+        return sweep_mod.parse_param_grid(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _parse_shard(text: str) -> shard_mod.Shard:
+    try:
+        return shard_mod.parse_shard(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _build_cli_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark maze planners over many generated mazes."
+    )
+    parser.add_argument(
+        "--mazes",
+        type=int,
+        default=None,
+        help="Number of mazes to evaluate (default 50); with --adaptive, the most mazes to use (default 1000).",
+    )
+    parser.add_argument("--width", type=int, default=15, help="Maze width in cells.")
+    parser.add_argument("--height", type=int, default=15, help="Maze height in cells.")
+    parser.add_argument("--seed", type=int, default=7, help="Benchmark seed.")
+    parser.add_argument(
+        "--algorithm",
+        choices=sorted(maze_mod.SUPPORTED_MAZE_ALGORITHMS),
+        default="backtracker",
+        help="Maze generation algorithm.",
     )
     parser.add_argument(
         "--planner",
@@ -707,6 +3242,264 @@ def _build_cli_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Only benchmark baseline planners from src/planners.py.",
     )
+    parser.add_argument(
+        "--batched",
+        action="store_true",
+        help=(
+            f"Also solve all mazes in one vectorized wavefront pass, reported as "
+            f"'{BATCHED_PLANNER_NAME}' with time amortized per maze."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=(
+            "Worker processes for trials (0 = all CPUs; default 1, or all CPUs with --sweep). "
+            "Results are merged in maze order."
+        ),
+    )
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each --jobs worker process to its own CPU (Linux).",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=0,
+        help="Untimed planner calls per maze before timing.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=1,
+        help="Timed planner calls per maze; the trial time is their median.",
+    )
+    parser.add_argument(
+        "--hygiene",
+        action="store_true",
+        help="Pre-warm planners, disable GC while timing and collect between trials; records cold timings.",
+    )
+    parser.add_argument(
+        "--cpu-affinity",
+        type=int,
+        default=None,
+        metavar="CPU",
+        help="Pin a sequential run (--jobs 1) to this CPU (Linux).",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        default=None,
+        metavar="N,N,...",
+        help=(
+            "Sweep square maze sizes (e.g. 15,31,63,127,255,511) instead of --width/--height "
+            "and report log-log scaling fits."
+        ),
+    )
+    parser.add_argument(
+        "--time-budget-ms",
+        type=float,
+        default=None,
+        help=(
+            "Cumulative solve-time cap per planner (per size in a sweep); planners past it are cut off. "
+            f"Sweeps default to {DEFAULT_SWEEP_TIME_BUDGET_MS:.0f} ms."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run: keep trials already in the output CSV and run only the rest.",
+    )
+    parser.add_argument(
+        "--fsync-every",
+        type=int,
+        default=25,
+        metavar="N",
+        help="Fsync the incrementally written results CSV every N trials.",
+    )
+    parser.add_argument(
+        "--sink",
+        choices=RESULT_SINKS,
+        default="csv",
+        help=(
+            "Where trials go: the checkpointed CSV, or a columnar benchmark_results.npz streamed in chunks "
+            "(not with --resume/--sizes)."
+        ),
+    )
+    parser.add_argument(
+        "--export-csv",
+        action="store_true",
+        help="With --sink npz, also export benchmark_results.csv from the columnar store.",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help=(
+            "Trace one extra call per trial with tracemalloc and report peak bytes and retained blocks; "
+            "planners are also ranked by median peak memory."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        choices=bench_profile.PROFILE_MODES,
+        default=None,
+        help=(
+            "Profile each planner on one extra call per maze (cProfile or a stack sampler); writes .pstats and "
+            "flamegraph collapsed stacks to <output-dir>/profiles and prints the hottest functions. Needs --jobs 1."
+        ),
+    )
+    parser.add_argument(
+        "--progress",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Print a live summary line (trials done, shared mazes, current leader) at most every SECONDS.",
+    )
+    parser.add_argument(
+        "--query-mix",
+        choices=query_mod.QUERY_MIXES,
+        default="default",
+        help=(
+            "Queries per maze: the corner-to-centre default, or --queries random, farthest or "
+            "dead-end-to-dead-end pairs. Indexed planners (e.g. astar_alt) amortize preprocessing over them."
+        ),
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=None,
+        metavar="K",
+        help="Queries per maze for a non-default --query-mix (default 8).",
+    )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help=(
+            "Run each planner in its own persistent worker process; trials past --trial-timeout-ms or "
+            "--memory-limit-mb kill and respawn the worker and are recorded as timeout/oom failures."
+        ),
+    )
+    parser.add_argument(
+        "--trial-timeout-ms",
+        type=float,
+        default=None,
+        help="With --isolate, wall-clock limit for one planner's trial on one maze (warmup and repeats included).",
+    )
+    parser.add_argument(
+        "--memory-limit-mb",
+        type=float,
+        default=None,
+        help="With --isolate, address space a worker may allocate beyond its loaded size (Linux/Unix RLIMIT_AS).",
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=_parse_scenario_kinds,
+        default=None,
+        metavar="KIND,...",
+        help=(
+            "Instead of the static benchmark, replay dynamic-map scenarios (doors, blockages, robots) on --mazes "
+            "base mazes and report per-update replanning latency, reused vs full-reset counts and cumulative time."
+        ),
+    )
+    parser.add_argument(
+        "--scenario-steps",
+        type=int,
+        default=20,
+        metavar="N",
+        help="Occupancy updates per --scenarios scenario.",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="append",
+        type=_parse_param_grid,
+        default=None,
+        metavar="PLANNER:PARAM=V1,V2[;PARAM=...]",
+        help=(
+            "Benchmark every combination of a planner's parameter values as its own planner variant "
+            "(e.g. 'r7_beam_search:beam_width=4,8,16'); repeatable. --planner adds unswept references. "
+            "Reports the Pareto front of time, path length and success rate in sweep_summary.md."
+        ),
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help=(
+            "Add mazes in batches until every adjacent pair in the ranking is separated at --confidence and the "
+            "order is stable, or --mazes / --adaptive-budget-s run out."
+        ),
+    )
+    parser.add_argument(
+        "--batch-mazes",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Mazes added per --adaptive batch.",
+    )
+    parser.add_argument(
+        "--adaptive-budget-s",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Wall-clock budget of an --adaptive run; it stops before a batch that would exceed it.",
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=bench_stats.DEFAULT_CONFIDENCE,
+        help="Confidence level of the ranking's bootstrap CIs (and of --adaptive's stopping rule).",
+    )
+    parser.add_argument(
+        "--shard",
+        type=_parse_shard,
+        default=None,
+        metavar="I/N",
+        help=(
+            "Run only shard I of N (0-based; mazes whose index is I modulo N) into <output-dir>/shards/I-of-N; "
+            "combine shards with the 'merge' subcommand."
+        ),
+    )
+    parser.add_argument(
+        "--shard-queue",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Split the run into N shards and keep claiming unfinished ones through lock files in "
+            "<output-dir>/shards, so hosts sharing that directory split the work."
+        ),
+    )
+    parser.add_argument(
+        "--save-baseline",
+        default=None,
+        metavar="CSV",
+        help="Write this run as a baseline with times normalized by a machine calibration workload.",
+    )
+    parser.add_argument(
+        "--compare-to",
+        default=None,
+        metavar="CSV",
+        help="Compare against a saved baseline and exit with status 1 on significant regressions.",
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.01,
+        help="Significance level of the Mann-Whitney U timing tests for --compare-to.",
+    )
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.10,
+        help="Median slowdown (fraction) tolerated before a significant difference counts as a regression.",
+    )
+    parser.add_argument(
+        "--expansion-tolerance",
+        type=float,
+        default=0.0,
+        help="Growth in total expansions (fraction) tolerated on mazes shared with the baseline.",
+    )
     parser.add_argument(
         "--output-dir",
         default=str(Path(__file__).resolve().parents[1] / "results"),
@@ -715,14 +3508,130 @@ def _build_cli_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> None:
+def _build_merge_parser() -> argparse.ArgumentParser:
+    default_output_dir = Path(__file__).resolve().parents[1] / "results"
+    parser = argparse.ArgumentParser(
+        prog="benchmark.py merge",
+        description="Merge sharded benchmark runs and regenerate the summary from their union.",
+    )
+    parser.add_argument(
+        "shards",
+        nargs="*",
+        help="Shard result CSVs or directories (default: every <output-dir>/shards/*/benchmark_results.csv).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=str(default_output_dir),
+        help="Directory where the merged CSV + Markdown outputs are written.",
+    )
+    parser.add_argument(
+        "--allow-partial",
+        action="store_true",
+        help="Merge even if some shards are missing.",
+    )
+    return parser
+
+
+def _merge_main(argv: Sequence[str]) -> None:
+    parser = _build_merge_parser()
+    args = parser.parse_args(argv)
+    inputs = args.shards or sorted(str(path) for path in Path(args.output_dir).glob("shards/*/benchmark_results.csv"))
+    if not inputs:
+        parser.error(f"No shard results found under {Path(args.output_dir) / 'shards'}.")
+    try:
+        trials, summary_rows, results_path, summary_path = merge_shard_results(
+            inputs, args.output_dir, allow_partial=args.allow_partial
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(f"Wrote: {results_path}")
+    print(f"Wrote: {summary_path}")
+    print(f"Planner comparison ({len(inputs)} merged shard(s), {len(trials)} trials):")
+    print(render_console_summary_table(summary_rows))
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["merge"]:
+        _merge_main(argv[1:])
+        return
     parser = _build_cli_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.mazes is None:
+        args.mazes = 1000 if args.adaptive else 50
+    if args.jobs is None:
+        args.jobs = 0 if args.sweep and not (args.isolate or args.profile or args.scenarios) else 1
+
+    if not 0.0 < args.alpha < 1.0:
+        parser.error("--alpha must be within (0, 1).")
+    if args.time_tolerance < 0 or args.expansion_tolerance < 0:
+        parser.error("--time-tolerance and --expansion-tolerance must be >= 0.")
+    if args.sink == "npz" and (args.resume or args.sizes):
+        parser.error("--sink npz cannot be combined with --resume or --sizes.")
+    if args.profile and args.jobs != 1:
+        parser.error("--profile collects profiles in one process; use --jobs 1.")
+    if args.progress is not None and args.progress < 0:
+        parser.error("--progress must be >= 0.")
+    if args.export_csv and args.sink != "npz":
+        parser.error("--export-csv only applies to --sink npz.")
+    if (args.trial_timeout_ms is not None or args.memory_limit_mb is not None) and not args.isolate:
+        parser.error("--trial-timeout-ms and --memory-limit-mb only apply to --isolate.")
+    if any(value is not None and value <= 0 for value in (args.trial_timeout_ms, args.memory_limit_mb)):
+        parser.error("--trial-timeout-ms and --memory-limit-mb must be > 0.")
+    if args.isolate and (args.jobs != 1 or args.profile):
+        parser.error("--isolate runs trials one at a time; use --jobs 1 without --profile.")
+    if args.memory_limit_mb is not None and not isolation.memory_limit_supported():
+        print("[WARN] --memory-limit-mb is not supported on this platform; only the time limit applies.")
+    if args.query_mix == "default" and args.queries is not None:
+        parser.error("--queries needs a non-default --query-mix.")
+    queries_per_maze = 1 if args.query_mix == "default" else (args.queries if args.queries is not None else 8)
+    if queries_per_maze < 1:
+        parser.error("--queries must be >= 1.")
+    if args.query_mix != "default" and args.batched:
+        parser.error("--batched only solves the default query; drop --query-mix.")
+    if not 0.0 < args.confidence < 1.0:
+        parser.error("--confidence must be within (0, 1).")
+    if args.adaptive:
+        if args.batch_mazes < 1:
+            parser.error("--batch-mazes must be >= 1.")
+        if args.adaptive_budget_s is not None and args.adaptive_budget_s <= 0:
+            parser.error("--adaptive-budget-s must be > 0.")
+        if args.sizes or args.sink != "csv" or args.scenarios or args.shard is not None or args.shard_queue:
+            parser.error("--adaptive cannot be combined with --sizes, --sink npz, --scenarios or sharding.")
+    elif args.adaptive_budget_s is not None:
+        parser.error("--adaptive-budget-s only applies to --adaptive.")
+    if args.sweep and (args.scenarios or args.shard is not None or args.shard_queue is not None):
+        parser.error("--sweep cannot be combined with --scenarios or sharding.")
+    if args.shard is not None or args.shard_queue is not None:
+        if args.shard is not None and args.shard_queue is not None:
+            parser.error("--shard and --shard-queue are mutually exclusive.")
+        if args.shard_queue is not None and args.shard_queue < 1:
+            parser.error("--shard-queue must be >= 1.")
+        if args.scenarios or args.sink != "csv" or args.save_baseline or args.compare_to:
+            parser.error("Sharded runs write CSVs for 'merge'; drop --scenarios, --sink npz and baselines.")
+    if args.scenarios:
+        if args.isolate:
+            parser.error("--scenarios cannot be combined with --isolate.")
+        if args.sizes or args.resume or args.save_baseline or args.compare_to or args.sink != "csv":
+            parser.error("--scenarios cannot be combined with --sizes, --resume, --sink npz or baselines.")
+        if args.jobs != 1 or args.profile or args.profile_memory:
+            parser.error("--scenarios replays queries in order in one process; use --jobs 1 without profiling.")
+        if args.scenario_steps < 1:
+            parser.error("--scenario-steps must be >= 1.")
 
     available = load_available_planners(include_alt=not args.no_alt)
     if not available:
         parser.error("No planners were discovered.")
 
+    if args.sweep:
+        # Imported here: bench_sweeps builds on this module.
+        import bench_sweeps
+
+        try:
+            sweep_variants = bench_sweeps.build_sweep_variants(args.sweep, load_available_planners(include_alt=True))
+        except ValueError as exc:
+            parser.error(str(exc))
+
     if args.planner:
         missing = [name for name in args.planner if name not in available]
         if missing:
@@ -731,6 +3640,8 @@ def main() -> None:
                 f"Available: {', '.join(sorted(available))}"
             )
         selected = {name: available[name] for name in args.planner}
+    elif args.sweep:
+        selected = {}
     elif args.no_alt:
         selected = {name: available[name] for name in sorted(available)}
     else:
@@ -739,7 +3650,43 @@ def main() -> None:
         except ValueError as exc:
             parser.error(str(exc))
 
-    _, summary_rows, csv_path, summary_path = run_benchmark_and_write_reports(
+    if args.sweep:
+        selected.update(sweep_variants)
+
+    if args.scenarios:
+        # Imported here: bench_scenarios builds on this module.
+        import bench_scenarios
+
+        _, scenario_rows, results_path, summary_path = bench_scenarios.run_scenarios_and_write_reports(
+            planners=selected,
+            kinds=args.scenarios,
+            scenario_count=args.mazes,
+            width=args.width,
+            height=args.height,
+            seed=args.seed,
+            algorithm=args.algorithm,
+            steps=args.scenario_steps,
+            output_dir=args.output_dir,
+        )
+        print(f"Wrote: {results_path}")
+        print(f"Wrote: {summary_path}")
+        print(
+            f"Dynamic scenarios ({args.mazes} per kind, {args.scenario_steps} updates, {args.width}x{args.height}, "
+            f"algorithm={args.algorithm}, seed={args.seed}):"
+        )
+        print(bench_scenarios.render_console_scenario_table(scenario_rows))
+        return
+
+    if args.profile or (args.profile_memory and not hasattr(os, "fork")):
+        stateful = sorted(name for name, fn in selected.items() if getattr(fn, "reuses_state", False))
+        if stateful:
+            print(
+                f"[WARN] Profiling traces the only timed call of {', '.join(stateful)}; "
+                "their times include profiler overhead."
+            )
+    profiler = bench_profile.PlannerProfiler(args.profile) if args.profile else None
+
+    report_options: dict[str, Any] = dict(
         planners=selected,
         maze_count=args.mazes,
         width=args.width,
@@ -747,15 +3694,130 @@ def main() -> None:
         seed=args.seed,
         algorithm=args.algorithm,
         output_dir=args.output_dir,
+        batched=args.batched,
+        jobs=args.jobs,
+        pin_cpus=args.pin_cpus,
+        warmup=args.warmup,
+        repeats=args.repeats,
+        hygiene=args.hygiene,
+        cpu_affinity=args.cpu_affinity,
+        resume=args.resume,
+        fsync_every=args.fsync_every,
+        sizes=args.sizes,
+        time_budget_ms=args.time_budget_ms,
+        sink=args.sink,
+        export_csv=args.export_csv,
+        progress_every_s=args.progress,
+        profile_memory=args.profile_memory,
+        profiler=profiler,
+        isolate=args.isolate,
+        trial_timeout_ms=args.trial_timeout_ms,
+        memory_limit_mb=args.memory_limit_mb,
+        query_mix=args.query_mix,
+        queries_per_maze=queries_per_maze,
+        confidence=args.confidence,
     )
+    if args.adaptive:
+        report_options.update(adaptive_batch_mazes=args.batch_mazes, adaptive_time_budget_s=args.adaptive_budget_s)
+    if args.shard_queue is not None:
+        queue = shard_mod.ShardQueue(Path(args.output_dir) / "shards", args.shard_queue)
+        while (shard := queue.claim()) is not None:
+            print(f"[INFO] Claimed shard {shard}.", flush=True)
+            shard_results = shard_output_dir(args.output_dir, shard) / "benchmark_results.csv"
+            try:
+                _, _, results_path, _ = run_benchmark_and_write_reports(
+                    **{**report_options, "resume": args.resume or shard_results.exists()},
+                    shard=shard,
+                )
+            except BaseException:
+                queue.release(shard)
+                raise
+            queue.complete(shard)
+            print(f"Wrote: {results_path}")
+        unfinished = [shard for shard in queue.shards() if not queue.is_done(shard)]
+        if unfinished:
+            print(f"[INFO] No unclaimed shards left; still running elsewhere: {', '.join(map(str, unfinished))}.")
+        else:
+            print(
+                f"[INFO] All {args.shard_queue} shards are done; "
+                f"run 'benchmark.py merge --output-dir {args.output_dir}'."
+            )
+        return
 
-    print(f"Wrote: {csv_path}")
+    trials, summary_rows, results_path, summary_path = run_benchmark_and_write_reports(
+        **report_options, shard=args.shard
+    )
+
+    print(f"Wrote: {results_path}")
     print(f"Wrote: {summary_path}")
+    size_text = (
+        ", ".join(f"{size}x{size}" for size in sorted(set(args.sizes)))
+        if args.sizes
+        else f"{args.width}x{args.height}"
+    )
+    query_text = "" if args.query_mix == "default" else f", {queries_per_maze} {args.query_mix} queries/maze"
+    shard_text = f", shard {args.shard}" if args.shard is not None else ""
+    maze_total = len({t.maze_index for t in trials}) if args.adaptive else args.mazes
     print(
-        f"Planner comparison ({args.mazes} mazes, {args.width}x{args.height}, "
+        f"Planner comparison ({maze_total} mazes{shard_text}, {size_text}{query_text}, "
         f"algorithm={args.algorithm}, seed={args.seed}):"
     )
     print(render_console_summary_table(summary_rows))
+    if args.sizes:
+        print()
+        print("Scaling vs maze cell count:")
+        run_mazes = len(args.shard.maze_indices(args.mazes)) if args.shard is not None else args.mazes
+        print(render_console_scaling_table(summarize_scaling(trials, args.sizes, run_mazes)))
+    if args.sweep:
+        import bench_sweeps
+
+        sweep_rows = bench_sweeps.summarize_sweep(summary_rows)
+        sweep_path = bench_sweeps.write_sweep_markdown(
+            sweep_rows,
+            Path(args.output_dir) / "sweep_summary.md",
+            grids=args.sweep,
+            maze_count=maze_total,
+            width=args.width,
+            height=args.height,
+            seed=args.seed,
+            algorithm=args.algorithm,
+            sizes=args.sizes,
+        )
+        print()
+        print(f"Parameter sweep, Pareto front first (time, path length, success rate; {sweep_path}):")
+        print(bench_sweeps.render_console_sweep_table(sweep_rows))
+    if profiler is not None:
+        print()
+        print(f"Hot functions per planner ({profiler.mode}; profiles in {Path(args.output_dir) / 'profiles'}):")
+        print(render_console_profile_table(profiler))
+
+    if args.save_baseline or args.compare_to:
+        if args.sink == "npz":
+            trials = list(trial_store.iter_trials(results_path))
+        calibration_ms = calibrate_machine()
+        print(f"[INFO] Machine calibration: {calibration_ms:.3f} ms (A* on a fixed benchmark maze)")
+    if args.save_baseline:
+        print(f"Wrote: {save_baseline(trials, Path(args.save_baseline), calibration_ms)}")
+    if args.compare_to:
+        baseline_trials, baseline_calibration_ms = load_baseline(Path(args.compare_to))
+        if baseline_calibration_ms is None:
+            print("[WARN] Baseline has no calibration; comparing raw times.")
+        comparison = compare_to_baseline(
+            trials,
+            baseline_trials,
+            calibration_ms=calibration_ms,
+            baseline_calibration_ms=baseline_calibration_ms,
+            alpha=args.alpha,
+            time_tolerance=args.time_tolerance,
+            expansion_tolerance=args.expansion_tolerance,
+        )
+        print()
+        print(f"Comparison with baseline {args.compare_to}:")
+        print(render_console_comparison_table(comparison))
+        regressions = [row["planner"] for row in comparison if row["verdict"] == "regression"]
+        if regressions:
+            print(f"[REGRESSION] {', '.join(regressions)}")
+            raise SystemExit(1)
 
 
 if __name__ == "__main__":
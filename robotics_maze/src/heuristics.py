@@ -1,14 +1,38 @@
-"""Heuristic helpers for grid-based planning."""
+"""Heuristic helpers for grid-based planning.
+
+Besides per-call heuristic functions, the module builds flat per-goal lookup
+tables (`heuristic_table`) so planners can replace a Python call per pushed
+node with a list index (`table[row * cols + col]`). Tables are cached per
+`(grid shape, goal, heuristic name)`; unregistered heuristics that build their
+own tables (e.g. ALT indexes from `landmarks`) are cached per object.
+"""
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import itertools
 from math import sqrt
-from typing import Callable, Dict, Tuple
+from typing import Any, Callable, Dict, List, Tuple
+import weakref
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - tables fall back to pure Python.
+    np = None  # type: ignore[assignment]
 
 Point = Tuple[int, int]
 HeuristicFn = Callable[[Point, Point], float]
+HeuristicTable = List[float]
+_TableKey = Tuple[int, int, Point, str]
 
 _HEURISTICS: Dict[str, HeuristicFn] = {}
+_TABLES: "OrderedDict[_TableKey, HeuristicTable]" = OrderedDict()
+# Bound the table cache by total cells (~32 bytes per cached float entry).
+_TABLE_CACHE_MAX_CELLS = 4_000_000
+_table_cache_cells = 0
+# Cache names for unregistered heuristics with `build_table`, dropped with them.
+_OBJECT_NAMES: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+_object_ids = itertools.count()
 
 
 def register_heuristic(
@@ -27,6 +51,7 @@ def register_heuristic(
         if key in _HEURISTICS and not overwrite:
             raise ValueError(f"Heuristic '{key}' is already registered.")
         _HEURISTICS[key] = fn
+        clear_heuristic_tables(key)
         return fn
 
     if heuristic is None:
@@ -61,6 +86,105 @@ def resolve_heuristic(heuristic: str | HeuristicFn | None) -> HeuristicFn:
     return get_heuristic(heuristic)
 
 
+def _table_name(heuristic: str | HeuristicFn | None) -> str | None:
+    """Return the registry name a table can be cached under, if any."""
+
+    if heuristic is None:
+        return "manhattan"
+    if isinstance(heuristic, str):
+        key = heuristic.strip().lower()
+        get_heuristic(key)
+        return key
+    for name, fn in _HEURISTICS.items():
+        if fn is heuristic:
+            return name
+    return None
+
+
+def _object_table_name(heuristic: Any) -> str | None:
+    """Cache name for an unregistered heuristic that builds its own tables."""
+
+    if not callable(getattr(heuristic, "build_table", None)):
+        return None
+    try:
+        name = _OBJECT_NAMES.get(heuristic)
+        if name is None:
+            name = f"<unregistered {next(_object_ids)}>"
+            _OBJECT_NAMES[heuristic] = name
+            weakref.finalize(heuristic, clear_heuristic_tables, name)
+    except TypeError:  # Unhashable or not weakly referenceable: build uncached.
+        return None
+    return name
+
+
+def _vectorized_table(name: str, rows: int, cols: int, goal: Point) -> HeuristicTable | None:
+    if np is None or name not in {"manhattan", "euclidean", "chebyshev"}:
+        return None
+    dr = np.abs(np.arange(rows, dtype=np.float64) - goal[0])[:, None]
+    dc = np.abs(np.arange(cols, dtype=np.float64) - goal[1])[None, :]
+    if name == "manhattan":
+        values = dr + dc
+    elif name == "euclidean":
+        values = np.sqrt(dr * dr + dc * dc)
+    else:
+        values = np.maximum(dr, dc)
+    return values.ravel().tolist()
+
+
+def _store_table(key: _TableKey, table: HeuristicTable) -> None:
+    global _table_cache_cells
+    _TABLES[key] = table
+    _table_cache_cells += len(table)
+    while _table_cache_cells > _TABLE_CACHE_MAX_CELLS and len(_TABLES) > 1:
+        _, evicted = _TABLES.popitem(last=False)
+        _table_cache_cells -= len(evicted)
+
+
+def heuristic_table(
+    heuristic: str | HeuristicFn | None,
+    shape: Tuple[int, int],
+    goal: Point,
+) -> HeuristicTable | None:
+    """Return `h(cell, goal)` for every cell as a flat row-major list.
+
+    Named (or registered) heuristics are cached per `(rows, cols, goal, name)`
+    and the built-in metrics are vectorized with NumPy when available. A
+    callable may also provide `build_table(rows, cols, goal)` to fill the
+    table itself; such callables are cached per object even when they are
+    not registered. Returns None for other unregistered callables, which
+    callers evaluate per node instead.
+    """
+
+    rows, cols = shape
+    name = _table_name(heuristic)
+    if name is None:
+        name = _object_table_name(heuristic)
+    if name is None:
+        builder = getattr(heuristic, "build_table", None)
+        return builder(rows, cols, goal) if callable(builder) else None
+    key: _TableKey = (rows, cols, (goal[0], goal[1]), name)
+    table = _TABLES.get(key)
+    if table is not None:
+        _TABLES.move_to_end(key)
+        return table
+
+    fn = _HEURISTICS[name] if name in _HEURISTICS else heuristic
+    builder = getattr(fn, "build_table", None)
+    table = builder(rows, cols, goal) if callable(builder) else _vectorized_table(name, rows, cols, goal)
+    if table is None:
+        table = [float(fn((r, c), goal)) for r in range(rows) for c in range(cols)]
+    _store_table(key, table)
+    return table
+
+
+def clear_heuristic_tables(name: str | None = None) -> None:
+    """Drop cached tables, either all of them or those for one heuristic."""
+
+    global _table_cache_cells
+    for key in [key for key in _TABLES if name is None or key[3] == name]:
+        _table_cache_cells -= len(_TABLES.pop(key))
+
+
 @register_heuristic("manhattan")
 def manhattan_distance(a: Point, b: Point) -> float:
     """L1 distance."""
@@ -84,10 +208,13 @@ def chebyshev_distance(a: Point, b: Point) -> float:
 
 __all__ = [
     "HeuristicFn",
+    "HeuristicTable",
     "Point",
     "chebyshev_distance",
+    "clear_heuristic_tables",
     "euclidean_distance",
     "get_heuristic",
+    "heuristic_table",
     "list_heuristics",
     "manhattan_distance",
     "register_heuristic",
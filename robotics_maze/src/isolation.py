@@ -0,0 +1,202 @@
+"""Persistent worker subprocesses with hard per-call time and memory limits.
+
+`IsolatedWorker` runs calls in a long-lived child process, so module-level
+state stays inside that process and a runaway call cannot block the caller:
+
+- Wall-clock limit: the caller waits at most `timeout_s` for a reply, then
+  kills the worker (`timeout`).
+- Memory limit: after its initializer runs, the worker caps its address
+  space (`RLIMIT_AS`) at its current size plus `memory_limit_bytes`. An
+  allocation past the cap raises `MemoryError` in the worker (`oom`). A
+  worker killed by SIGKILL, e.g. by the kernel OOM killer, also counts as
+  `oom`.
+- Any other death of the worker is reported as `crashed`. Exceptions the
+  call raises are returned as `error` and the worker keeps running.
+
+After `timeout`, `oom` or `crashed` the worker is gone. The next call
+respawns it (reinitialized, without the state the old process held), and
+`restarts` counts these respawns.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import multiprocessing
+import os
+import signal
+from typing import Any, Callable, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+ISOLATION_STATUSES: Tuple[str, ...] = ("ok", "error", "timeout", "oom", "crashed")
+
+
+@dataclass(frozen=True)
+class IsolatedResult:
+    status: str
+    value: Any = None
+    detail: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def memory_limit_supported() -> bool:
+    return resource is not None and hasattr(resource, "RLIMIT_AS")
+
+
+def _address_space_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            pages = int(handle.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _apply_memory_limit(limit_bytes: int) -> None:
+    if not memory_limit_supported():
+        return
+    current = _address_space_bytes()
+    if current is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    soft = current + limit_bytes
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _worker_main(
+    conn: Any,
+    initializer: Optional[Callable[..., None]],
+    initargs: Tuple[Any, ...],
+    memory_limit_bytes: Optional[int],
+) -> None:
+    # Leave interrupts to the parent; it kills workers it no longer needs.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if initializer is not None:
+        initializer(*initargs)
+    if memory_limit_bytes is not None:
+        _apply_memory_limit(memory_limit_bytes)
+    conn.send(("ready", None, None))
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        fn, args = message
+        try:
+            value = fn(*args)
+        except MemoryError as exc:
+            # The heap may be half-updated; report and let the parent respawn.
+            conn.send(("oom", None, f"MemoryError: {exc}"))
+            return
+        except Exception as exc:
+            conn.send(("error", None, f"{type(exc).__name__}: {exc}"))
+        else:
+            conn.send(("ok", value, None))
+
+
+class IsolatedWorker:
+    """Run calls one at a time in a persistent, respawning subprocess."""
+
+    def __init__(
+        self,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple[Any, ...] = (),
+        *,
+        memory_limit_bytes: Optional[int] = None,
+        context: Any = None,
+    ) -> None:
+        if memory_limit_bytes is not None and memory_limit_bytes <= 0:
+            raise ValueError("memory_limit_bytes must be > 0.")
+        self.initializer = initializer
+        self.initargs = initargs
+        self.memory_limit_bytes = memory_limit_bytes
+        self.restarts = 0
+        self._context = context or multiprocessing.get_context()
+        self._process: Any = None
+        self._conn: Any = None
+
+    def _spawn(self) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.initializer, self.initargs, self.memory_limit_bytes),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process, self._conn = process, parent_conn
+        try:
+            status, _, _ = parent_conn.recv()
+        except EOFError:
+            exitcode = self._discard()
+            raise RuntimeError(f"Isolated worker failed to start (exit code {exitcode}).") from None
+        assert status == "ready"
+
+    def _discard(self) -> Optional[int]:
+        """Kill the worker if it is still alive and forget it; return its exit code."""
+
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if process is None:
+            return None
+        if process.is_alive():
+            process.kill()
+        process.join()
+        conn.close()
+        return process.exitcode
+
+    def call(self, fn: Callable[..., Any], *args: Any, timeout_s: Optional[float] = None) -> IsolatedResult:
+        """Run `fn(*args)` in the worker; `fn`, `args` and the result must pickle."""
+
+        if self._process is None:
+            self._spawn()
+        self._conn.send((fn, args))
+        if not self._conn.poll(timeout_s):
+            self._discard()
+            self.restarts += 1
+            return IsolatedResult("timeout", detail=f"no result within {timeout_s:g} s")
+        try:
+            status, value, detail = self._conn.recv()
+        except EOFError:
+            exitcode = self._discard()
+            self.restarts += 1
+            if exitcode == -signal.SIGKILL:
+                return IsolatedResult("oom", detail="worker was killed (SIGKILL)")
+            return IsolatedResult("crashed", detail=f"worker exited with code {exitcode}")
+        if status == "oom":
+            self._discard()
+            self.restarts += 1
+        return IsolatedResult(status, value, detail)
+
+    def close(self) -> None:
+        if self._process is not None and self._process.is_alive():
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self._process.join(timeout=1.0)
+        self._discard()
+
+    def __enter__(self) -> "IsolatedWorker":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+__all__ = [
+    "ISOLATION_STATUSES",
+    "IsolatedResult",
+    "IsolatedWorker",
+    "memory_limit_supported",
+]
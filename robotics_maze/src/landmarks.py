@@ -0,0 +1,267 @@
+"""ALT (A*, landmarks, triangle inequality) heuristics for occupancy grids.
+
+For a landmark `L` with exact distances `d_L`, the triangle inequality gives
+the admissible bound `h(a, b) = |d_L(a) - d_L(b)|`; the heuristic takes the max
+over all landmarks. Landmark distance maps come from the vectorized wavefront,
+so they count hops. Unit step costs (or diagonal steps of cost >= 1) keep the
+bound admissible.
+
+Typical use registers the heuristic for one grid under a name so any planner
+that accepts `heuristic=` can use it:
+
+    build_alt_heuristic(grid, landmarks=8)       # registers "alt"
+    astar(grid, start, goal, heuristic="alt")
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import random
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .heuristics import Point, register_heuristic
+    from .wavefront import occupancy_mask, wavefront
+except ImportError:  # pragma: no cover - allows running as a standalone module
+    from heuristics import Point, register_heuristic
+    from wavefront import occupancy_mask, wavefront
+
+GridLike = Sequence[Sequence[Any]]
+LANDMARK_STRATEGIES = frozenset({"farthest", "avoid"})
+
+
+@dataclass(frozen=True, eq=False)
+class LandmarkHeuristic:
+    """Callable ALT heuristic bound to one grid's landmark distance maps.
+
+    Instances compare and hash by identity (the arrays are not hashable), so
+    planners can key heuristic lookups on them.
+    """
+
+    landmarks: Tuple[Point, ...]
+    distances: np.ndarray
+    strategy: str
+    allow_diagonal: bool
+    preprocessing_ms: float
+    _tables: Tuple[List[int], ...] = field(repr=False, compare=False)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.distances.shape[1], self.distances.shape[2]
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by the int32 landmark distance arrays."""
+
+        return int(self.distances.nbytes)
+
+    def __call__(self, a: Point, b: Point) -> float:
+        cols = self.distances.shape[2]
+        ia = a[0] * cols + a[1]
+        ib = b[0] * cols + b[1]
+        best = 0
+        for table in self._tables:
+            da = table[ia]
+            db = table[ib]
+            if da >= 0 and db >= 0:
+                gap = da - db if da > db else db - da
+                if gap > best:
+                    best = gap
+        return float(best)
+
+    def build_table(self, rows: int, cols: int, goal: Point) -> List[float]:
+        """Vectorized `h(cell, goal)` for every cell (used by `heuristic_table`)."""
+
+        if (rows, cols) != self.shape:
+            raise ValueError(f"ALT heuristic was built for shape {self.shape}, got {(rows, cols)}")
+        dist = self.distances.reshape(len(self.landmarks), -1)
+        goal_dist = dist[:, goal[0] * cols + goal[1]][:, None]
+        valid = (dist >= 0) & (goal_dist >= 0)
+        gaps = np.where(valid, np.abs(dist - goal_dist), 0)
+        return gaps.max(axis=0).astype(np.float64).tolist()
+
+    def stats(self) -> Dict[str, Any]:
+        """Preprocessing cost and memory footprint for reports."""
+
+        return {
+            "strategy": self.strategy,
+            "landmarks": len(self.landmarks),
+            "preprocessing_ms": self.preprocessing_ms,
+            "memory_bytes": self.memory_bytes,
+        }
+
+    def quality(self, grid: GridLike | np.ndarray, goal: Point) -> float:
+        """Mean `h / true distance` over cells reachable from `goal` (1.0 is perfect)."""
+
+        rows, cols = self.shape
+        exact = wavefront(grid, goal, allow_diagonal=self.allow_diagonal).distances
+        estimate = np.asarray(self.build_table(rows, cols, goal)).reshape(rows, cols)
+        reachable = exact > 0
+        if not reachable.any():
+            return 1.0
+        return float((estimate[reachable] / exact[reachable]).mean())
+
+
+def _farthest_cell(score: np.ndarray, eligible: np.ndarray, chosen: List[Point]) -> Point | None:
+    scores = np.where(eligible, score, -1)
+    for landmark in chosen:
+        scores[landmark] = -1
+    flat = int(np.argmax(scores))
+    if scores.flat[flat] < 0:
+        return None
+    return divmod(flat, scores.shape[1])
+
+
+def _select_farthest(
+    blocked: np.ndarray,
+    count: int,
+    rng: random.Random,
+    allow_diagonal: bool,
+) -> Tuple[List[Point], List[np.ndarray]]:
+    """Farthest-point selection: each landmark maximizes its min distance to the rest."""
+
+    free_cells = np.argwhere(~blocked)
+    seed_cell = tuple(int(v) for v in free_cells[rng.randrange(len(free_cells))])
+    seed_dist = wavefront(blocked, seed_cell, allow_diagonal=allow_diagonal).distances
+
+    landmarks: List[Point] = []
+    maps: List[np.ndarray] = []
+    nearest = seed_dist.astype(np.int64)
+    while len(landmarks) < count:
+        candidate = _farthest_cell(nearest, nearest >= 0, landmarks)
+        if candidate is None:
+            break
+        landmarks.append(candidate)
+        dist = wavefront(blocked, candidate, allow_diagonal=allow_diagonal).distances
+        maps.append(dist)
+        nearest = np.where(dist >= 0, np.minimum(nearest, dist), nearest)
+    return landmarks, maps
+
+
+def _select_avoid(
+    blocked: np.ndarray,
+    count: int,
+    rng: random.Random,
+    allow_diagonal: bool,
+) -> Tuple[List[Point], List[np.ndarray]]:
+    """Simplified "avoid" selection (Goldberg & Harrelson).
+
+    From a random root, pick the cell where the current landmark bound is
+    loosest (`d(root, v) - h(root, v)` largest), so new landmarks cover regions
+    that the existing ones estimate poorly.
+    """
+
+    free_cells = np.argwhere(~blocked)
+    landmarks: List[Point] = []
+    maps: List[np.ndarray] = []
+    attempts = 0
+    while len(landmarks) < count and attempts < 4 * count:
+        attempts += 1
+        root = tuple(int(v) for v in free_cells[rng.randrange(len(free_cells))])
+        root_dist = wavefront(blocked, root, allow_diagonal=allow_diagonal).distances
+        bound = np.zeros(blocked.shape, dtype=np.int64)
+        for dist in maps:
+            root_to_landmark = dist[root]
+            if root_to_landmark >= 0:
+                bound = np.maximum(bound, np.where(dist >= 0, np.abs(dist - root_to_landmark), 0))
+        slack = np.where(root_dist >= 0, root_dist - bound, -1)
+        candidate = _farthest_cell(slack, root_dist >= 0, landmarks)
+        if candidate is None:
+            continue
+        landmarks.append(candidate)
+        maps.append(wavefront(blocked, candidate, allow_diagonal=allow_diagonal).distances)
+    return landmarks, maps
+
+
+def build_alt_heuristic(
+    grid: GridLike | np.ndarray,
+    *,
+    landmarks: int = 8,
+    strategy: str = "farthest",
+    seed: int = 0,
+    allow_diagonal: bool = False,
+    name: str | None = "alt",
+) -> LandmarkHeuristic:
+    """Select landmarks, precompute their distance maps and register the heuristic.
+
+    Args:
+        grid: Occupancy grid the heuristic is valid for.
+        landmarks: Number of landmarks; more landmarks tighten the bound at the
+            cost of one `rows * cols` int32 map each.
+        strategy: `farthest` (farthest-point) or `avoid`.
+        seed: Seed for the random root cell(s) used by both strategies.
+        allow_diagonal: Build 8-connected hop maps for diagonal planners.
+        name: Heuristic registry name (overwrites any previous grid's entry).
+            Pass None to skip registration.
+    """
+
+    key = strategy.strip().lower()
+    if key not in LANDMARK_STRATEGIES:
+        raise ValueError(f"strategy must be one of {sorted(LANDMARK_STRATEGIES)}")
+    if landmarks < 1:
+        raise ValueError("landmarks must be >= 1")
+
+    started = time.perf_counter()
+    blocked = occupancy_mask(grid)
+    if blocked.all():
+        raise ValueError("grid has no free cells")
+    rng = random.Random(seed)
+    select = _select_farthest if key == "farthest" else _select_avoid
+    chosen, maps = select(blocked, landmarks, rng, allow_diagonal)
+    distances = np.stack(maps).astype(np.int32)
+    heuristic = LandmarkHeuristic(
+        landmarks=tuple(chosen),
+        distances=distances,
+        strategy=key,
+        allow_diagonal=allow_diagonal,
+        preprocessing_ms=(time.perf_counter() - started) * 1000.0,
+        _tables=tuple(dist.ravel().tolist() for dist in distances),
+    )
+    if name is not None:
+        register_heuristic(name, heuristic, overwrite=True)
+    return heuristic
+
+
+def landmark_tradeoff(
+    grid: GridLike | np.ndarray,
+    goal: Point,
+    *,
+    counts: Sequence[int] = (1, 2, 4, 8, 16),
+    strategy: str = "farthest",
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """Report preprocessing time, memory and heuristic quality per landmark count."""
+
+    rows: List[Dict[str, Any]] = []
+    for count in counts:
+        heuristic = build_alt_heuristic(grid, landmarks=count, strategy=strategy, seed=seed, name=None)
+        rows.append({**heuristic.stats(), "quality": heuristic.quality(grid, goal)})
+    return rows
+
+
+if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import benchmark
+
+    demo_grid, demo_start, demo_goal = benchmark.generate_benchmark_maze(31, 31, seed=7)
+    print(f"{'strategy':>8} {'L':>3} {'prep_ms':>8} {'mem_kib':>8} {'h/d':>6}")
+    for demo_strategy in sorted(LANDMARK_STRATEGIES):
+        for row in landmark_tradeoff(demo_grid, demo_goal, strategy=demo_strategy):
+            print(
+                f"{row['strategy']:>8} {row['landmarks']:>3} {row['preprocessing_ms']:>8.2f} "
+                f"{row['memory_bytes'] / 1024:>8.1f} {row['quality']:>6.3f}"
+            )
+
+
+__all__ = [
+    "LANDMARK_STRATEGIES",
+    "LandmarkHeuristic",
+    "build_alt_heuristic",
+    "landmark_tradeoff",
+]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib
+import inspect
 import random
 import sys
 from dataclasses import dataclass
@@ -10,6 +12,7 @@ from typing import Any, Protocol, Sequence
 
 MazeSize = tuple[int, int]
 BACKEND_CHOICES = ("auto", "pybullet", "mujoco")
+SHORTCUT_CHOICES = ("none", "greedy", "optimal")
 
 SRC_DIR = Path(__file__).resolve().parent
 if str(SRC_DIR) not in sys.path:
@@ -29,6 +32,10 @@ class RunConfig:
     robot_urdf: str | None = None
     gui_hold_seconds: float = 8.0
     physics_backend: str = "auto"
+    plan_cache: bool = False
+    plan_cache_db: str | None = None
+    shortcut: str = "none"
+    robot_radius: float = 0.0
 
 
 @dataclass(frozen=True)
@@ -78,9 +85,29 @@ class StubPlanner:
         return {"planner": self.name, "seed": seed, "maze": maze}
 
 
+def _accepts_workspace(planner_fn: Any) -> bool:
+    try:
+        return "workspace" in inspect.signature(planner_fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _create_workspace() -> Any | None:
+    try:
+        from workspace import PlannerWorkspace
+    except Exception:
+        return None
+    return PlannerWorkspace()
+
+
 class FunctionPlannerAdapter:
-    def __init__(self, name: str, planner_fn: Any) -> None:
+    def __init__(self, name: str, planner_fn: Any, cache: Any | None = None) -> None:
         self.name = name
+        self._cache = cache
+        # Episodes replan on same-sized mazes, so one workspace serves them all.
+        workspace = _create_workspace() if _accepts_workspace(planner_fn) else None
+        if workspace is not None:
+            planner_fn = functools.partial(planner_fn, workspace=workspace)
         self._planner_fn = planner_fn
 
     def plan(self, maze: Any, *, seed: int | None) -> dict[str, Any]:
@@ -93,6 +120,8 @@ class FunctionPlannerAdapter:
                 except Exception:
                     return {"path": []}
             return {"path": []}
+        if self._cache is not None:
+            return self._cache.get_or_plan(self.name, self._planner_fn, grid, start, goal)
         return self._planner_fn(grid, start, goal)
 
 
@@ -123,6 +152,13 @@ def positive_int(raw_value: str) -> int:
     return value
 
 
+def non_negative_float(raw_value: str) -> float:
+    value = float(raw_value)
+    if value < 0:
+        raise argparse.ArgumentTypeError("must be >= 0")
+    return value
+
+
 def parse_maze_size(raw_value: str) -> MazeSize:
     value = raw_value.strip().lower()
     if "x" in value:
@@ -222,6 +258,21 @@ def build_parser() -> argparse.ArgumentParser:
         default=8.0,
         help="How long to keep GUI open after each episode finishes.",
     )
+    parser.add_argument(
+        "--shortcut",
+        choices=SHORTCUT_CHOICES,
+        default="none",
+        help=(
+            "Replace lattice paths with line-of-sight shortcuts before driving them "
+            "(fewer waypoints, shorter episodes). Pair with --robot-radius."
+        ),
+    )
+    parser.add_argument(
+        "--robot-radius",
+        type=non_negative_float,
+        default=0.0,
+        help="Clearance (world units) shortcuts keep from walls.",
+    )
     gui_setup_group = parser.add_mutually_exclusive_group()
     gui_setup_group.add_argument(
         "--gui-setup",
@@ -236,6 +287,17 @@ def build_parser() -> argparse.ArgumentParser:
         help="Skip the setup dialog and run directly with CLI arguments.",
     )
     parser.set_defaults(gui_setup=False)
+    parser.add_argument(
+        "--plan-cache",
+        action="store_true",
+        help="Reuse planner results for repeated (maze, start, goal) queries.",
+    )
+    parser.add_argument(
+        "--plan-cache-db",
+        default=None,
+        metavar="PATH",
+        help="Optional sqlite file that persists the plan cache across runs (implies --plan-cache).",
+    )
     return parser
 
 
@@ -251,6 +313,10 @@ def parse_args(argv: Sequence[str] | None = None) -> RunConfig:
         robot_urdf=validate_robot_urdf(args.robot_urdf),
         gui_hold_seconds=max(args.gui_hold_seconds, 0.0),
         physics_backend=args.physics_backend,
+        plan_cache=args.plan_cache or args.plan_cache_db is not None,
+        plan_cache_db=args.plan_cache_db,
+        shortcut=args.shortcut,
+        robot_radius=args.robot_radius,
     )
 
 
@@ -329,6 +395,10 @@ def apply_gui_setup(config: RunConfig) -> tuple[RunConfig, bool]:
             robot_urdf=validate_robot_urdf(selected.robot_urdf),
             gui_hold_seconds=max(selected.gui_hold_seconds, 0.0),
             physics_backend=backend,
+            plan_cache=config.plan_cache,
+            plan_cache_db=config.plan_cache_db,
+            shortcut=config.shortcut,
+            robot_radius=config.robot_radius,
         ),
         True,
     )
@@ -355,9 +425,9 @@ def _maze_to_grid_triplet(maze: Any) -> tuple[Any, Any, Any]:
             return grid, start, goal
 
     try:
-        import benchmark as bench_mod
+        from maze import maze_to_occupancy_grid
 
-        return bench_mod.maze_to_occupancy_grid(maze)
+        return maze_to_occupancy_grid(maze)
     except Exception:
         return None, None, None
 
@@ -373,15 +443,17 @@ def _load_module_symbol(module_name: str, symbol_name: str) -> Any | None:
     return getattr(module, symbol_name, None)
 
 
-def _instantiate(candidate: Any, *args: Any) -> Any | None:
+def _instantiate(candidate: Any, *args: Any, **kwargs: Any) -> Any | None:
     if candidate is None:
         return None
     if not callable(candidate):
         return candidate
-    for call_args in (args, tuple()):
+    for call_args, call_kwargs in ((args, kwargs), ((), {})):
         try:
-            return candidate(*call_args)
+            return candidate(*call_args, **call_kwargs)
         except TypeError:
+            if call_kwargs:
+                print(f"[WARN] '{candidate}' does not accept options {sorted(call_kwargs)}; ignoring them.")
             continue
         except Exception as exc:
             print(f"[WARN] Failed to initialize component '{candidate}': {exc}")
@@ -404,14 +476,16 @@ def load_maze_generator() -> MazeGenerator:
     return StubMazeGenerator()
 
 
-def load_simulator() -> Simulator:
+def load_simulator(**options: Any) -> Simulator:
+    """Load the first available simulator factory, passing it `options`."""
+
     candidates = [
         ("sim", "create_simulator"),
         ("simulation", "create_simulator"),
         ("simulator", "create_simulator"),
     ]
     for module_name, symbol_name in candidates:
-        loaded = _instantiate(_load_module_symbol(module_name, symbol_name))
+        loaded = _instantiate(_load_module_symbol(module_name, symbol_name), **options)
         if loaded is not None:
             print(f"[INFO] Simulator loaded from {module_name}.{symbol_name}")
             return loaded
@@ -419,7 +493,7 @@ def load_simulator() -> Simulator:
     return StubSimulator()
 
 
-def load_planner(name: str) -> Planner:
+def load_planner(name: str, cache: Any | None = None) -> Planner:
     if name in {"stub", "default"}:
         return StubPlanner(name="stub")
 
@@ -452,7 +526,7 @@ def load_planner(name: str) -> Planner:
         planner_fn = planners_mod.get_planner(name)
         if callable(planner_fn):
             print(f"[INFO] Planner loaded from planners registry: {name}")
-            return FunctionPlannerAdapter(name=name, planner_fn=planner_fn)
+            return FunctionPlannerAdapter(name=name, planner_fn=planner_fn, cache=cache)
     except Exception:
         pass
 
@@ -481,21 +555,34 @@ def load_planner(name: str) -> Planner:
         planner_fn = _load_module_symbol(module_name, symbol_name)
         if callable(planner_fn):
             print(f"[INFO] Planner loaded from alt planner module: {module_name}.{symbol_name}")
-            return FunctionPlannerAdapter(name=name, planner_fn=planner_fn)
+            return FunctionPlannerAdapter(name=name, planner_fn=planner_fn, cache=cache)
 
     print(f"[INFO] Planner '{name}' not found; using stub planner.")
     return StubPlanner(name=name)
 
 
+def _create_plan_cache(config: RunConfig) -> Any | None:
+    if not config.plan_cache:
+        return None
+    try:
+        from plan_cache import PlanCache
+
+        return PlanCache(path=config.plan_cache_db)
+    except Exception as exc:
+        print(f"[WARN] Plan cache unavailable ({exc}); planning without cache.")
+        return None
+
+
 def run(config: RunConfig) -> int:
     maze_generator = load_maze_generator()
-    planner = load_planner(config.planner)
-    simulator = load_simulator()
+    plan_cache = _create_plan_cache(config)
+    planner = load_planner(config.planner, cache=plan_cache)
+    simulator = load_simulator(shortcut=config.shortcut, robot_radius=config.robot_radius)
 
     print(
         (
             "[START] planner={planner} episodes={episodes} maze_size={maze_size} seed={seed} "
-            "gui={gui} backend={backend} urdf={urdf} gui_hold_s={gui_hold_s}"
+            "gui={gui} backend={backend} urdf={urdf} gui_hold_s={gui_hold_s} shortcut={shortcut}"
         ).format(
             planner=getattr(planner, "name", config.planner),
             episodes=config.episodes,
@@ -505,6 +592,7 @@ def run(config: RunConfig) -> int:
             backend=config.physics_backend,
             urdf=config.robot_urdf or f"default({DEFAULT_ROBOT_URDF})",
             gui_hold_s=f"{config.gui_hold_seconds:.1f}",
+            shortcut=config.shortcut,
         )
     )
 
@@ -555,6 +643,14 @@ def run(config: RunConfig) -> int:
             avg_elapsed=average_elapsed_s,
         )
     )
+    if plan_cache is not None:
+        cache_stats = plan_cache.stats_dict()
+        plan_cache.close()
+        print(
+            "[CACHE] hits={hits} misses={misses} disk_hits={disk_hits} evictions={evictions}".format(
+                **cache_stats
+            )
+        )
 
     return 0 if successes == config.episodes else 1
 
@@ -271,6 +271,32 @@ def generate_maze(
     return maze
 
 
+def maze_to_occupancy_grid(maze: Maze) -> tuple[list[list[int]], Coordinate, Coordinate]:
+    """Convert wall-based maze representation to occupancy grid expected by planners."""
+    width = int(maze.width)
+    height = int(maze.height)
+    grid_rows = 2 * height + 1
+    grid_cols = 2 * width + 1
+    grid = [[1 for _ in range(grid_cols)] for _ in range(grid_rows)]
+
+    for y in range(height):
+        for x in range(width):
+            row = 2 * y + 1
+            col = 2 * x + 1
+            grid[row][col] = 0
+
+            if x < width - 1 and not maze.has_wall_between((x, y), (x + 1, y)):
+                grid[row][col + 1] = 0
+            if y < height - 1 and not maze.has_wall_between((x, y), (x, y + 1)):
+                grid[row + 1][col] = 0
+
+    start = (2 * int(maze.start[1]) + 1, 2 * int(maze.start[0]) + 1)
+    goal = (2 * int(maze.goal[1]) + 1, 2 * int(maze.goal[0]) + 1)
+    grid[start[0]][start[1]] = 0
+    grid[goal[0]][goal[1]] = 0
+    return grid, start, goal
+
+
 def _carve_backtracker(
     maze: Maze, rng: random.Random, start_cell: Coordinate
 ) -> None:
@@ -0,0 +1,181 @@
+"""Line-of-sight shortcutting for grid paths.
+
+Planners return cell-by-cell paths, and a robot following every cell slows
+down at each waypoint. `shortcut_path` drops intermediate cells whenever two
+path cells see each other on the occupancy grid:
+
+- `greedy`: from each anchor, jump to the farthest consecutive path cell that
+  is still visible (one linear pass of visibility checks).
+- `optimal`: shortest Euclidean polyline through a subsequence of the path
+  cells (dynamic programming over all visible pairs, `O(n^2)` checks).
+
+Visibility uses a supercover traversal: every cell the segment between two
+cell centres touches must be free, and a segment passing exactly through a
+cell corner needs both side cells free (no diagonal squeezing). A `clearance`
+radius in cells inflates obstacles first; consecutive path cells stay
+connected even when inflation would block them, so the result never loses
+the original path.
+"""
+
+from __future__ import annotations
+
+from math import hypot
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .wavefront import occupancy_mask
+except ImportError:  # pragma: no cover - allows running as a standalone module
+    from wavefront import occupancy_mask
+
+Point = Tuple[int, int]
+GridLike = Sequence[Sequence[Any]]
+SHORTCUT_METHODS = frozenset({"greedy", "optimal"})
+
+
+def inflate_obstacles(grid: GridLike | np.ndarray, clearance: float) -> np.ndarray:
+    """Blocked mask where every cell centre closer than `clearance` to an obstacle cell is blocked."""
+
+    blocked = occupancy_mask(grid)
+    if clearance <= 0.5:
+        # A free cell centre is at least 0.5 cells from any neighbouring obstacle.
+        return blocked
+
+    rows, cols = blocked.shape
+    reach = int(np.ceil(clearance + 0.5))
+    inflated = blocked.copy()
+    padded = np.zeros((rows + 2 * reach, cols + 2 * reach), dtype=bool)
+    padded[reach:-reach, reach:-reach] = blocked
+    for dr in range(-reach, reach + 1):
+        for dc in range(-reach, reach + 1):
+            # Distance from this cell's centre to the nearest point of the offset cell.
+            gap = hypot(max(abs(dr) - 0.5, 0.0), max(abs(dc) - 0.5, 0.0))
+            if (dr or dc) and gap < clearance:
+                inflated |= padded[reach + dr : reach + dr + rows, reach + dc : reach + dc + cols]
+    return inflated
+
+
+def line_of_sight(blocked: np.ndarray, a: Point, b: Point) -> bool:
+    """Return True when the segment between the centres of `a` and `b` only touches free cells."""
+
+    rows, cols = blocked.shape
+    r, c = a
+    dr = b[0] - r
+    dc = b[1] - c
+    step_r = 1 if dr > 0 else -1
+    step_c = 1 if dc > 0 else -1
+    n_r = abs(dr)
+    n_c = abs(dc)
+
+    def _free(row: int, col: int) -> bool:
+        return 0 <= row < rows and 0 <= col < cols and not blocked[row, col]
+
+    if not _free(r, c):
+        return False
+    i_r = i_c = 0
+    while i_r < n_r or i_c < n_c:
+        decision = (1 + 2 * i_c) * n_r - (1 + 2 * i_r) * n_c
+        if decision == 0:
+            if not (_free(r + step_r, c) and _free(r, c + step_c)):
+                return False
+            r += step_r
+            c += step_c
+            i_r += 1
+            i_c += 1
+        elif decision < 0:
+            c += step_c
+            i_c += 1
+        else:
+            r += step_r
+            i_r += 1
+        if not _free(r, c):
+            return False
+    return True
+
+
+def _distance(a: Point, b: Point) -> float:
+    return hypot(a[0] - b[0], a[1] - b[1])
+
+
+def _greedy(blocked: np.ndarray, path: List[Point]) -> List[Point]:
+    result = [path[0]]
+    anchor = 0
+    last = len(path) - 1
+    while anchor < last:
+        reach = anchor + 1
+        while reach < last and line_of_sight(blocked, path[anchor], path[reach + 1]):
+            reach += 1
+        result.append(path[reach])
+        anchor = reach
+    return result
+
+
+def _optimal(blocked: np.ndarray, path: List[Point]) -> List[Point]:
+    count = len(path)
+    cost = [0.0] * count
+    hops = [0] * count
+    previous = [-1] * count
+    for j in range(1, count):
+        # The consecutive step is always allowed, so every cell stays reachable.
+        cost[j] = cost[j - 1] + _distance(path[j - 1], path[j])
+        hops[j] = hops[j - 1] + 1
+        previous[j] = j - 1
+        for i in range(j - 1):
+            candidate = cost[i] + _distance(path[i], path[j])
+            # Prefer shorter polylines, then fewer waypoints on (near) ties.
+            if candidate > cost[j] + 1e-9 or (candidate > cost[j] - 1e-9 and hops[i] + 1 >= hops[j]):
+                continue
+            if line_of_sight(blocked, path[i], path[j]):
+                cost[j] = candidate
+                hops[j] = hops[i] + 1
+                previous[j] = i
+
+    result: List[Point] = []
+    index = count - 1
+    while index >= 0:
+        result.append(path[index])
+        index = previous[index]
+    result.reverse()
+    return result
+
+
+def shortcut_path(
+    grid: GridLike | np.ndarray,
+    path: Sequence[Point],
+    *,
+    clearance: float = 0.0,
+    method: str = "greedy",
+) -> List[Point]:
+    """Shortcut a `(row, col)` cell path with grid line-of-sight.
+
+    Args:
+        grid: Occupancy grid the path was planned on.
+        path: Cell path from start to goal.
+        clearance: Minimum distance, in cells, from a shortcut cell centre to
+            any obstacle cell. Values up to 0.5 do not inflate.
+        method: `greedy` or `optimal`.
+    """
+
+    key = method.strip().lower()
+    if key not in SHORTCUT_METHODS:
+        raise ValueError(f"method must be one of {sorted(SHORTCUT_METHODS)}")
+
+    cells: List[Point] = []
+    for point in path:
+        cell = (int(point[0]), int(point[1]))
+        if not cells or cells[-1] != cell:
+            cells.append(cell)
+    if len(cells) <= 2:
+        return cells
+
+    blocked = inflate_obstacles(grid, clearance)
+    return _greedy(blocked, cells) if key == "greedy" else _optimal(blocked, cells)
+
+
+__all__ = [
+    "SHORTCUT_METHODS",
+    "inflate_obstacles",
+    "line_of_sight",
+    "shortcut_path",
+]
@@ -0,0 +1,116 @@
+"""Compact array-backed grid paths.
+
+A `GridPath` stores a path as flat row-major cell indices (`row * cols + col`)
+in an `array('i')`, 4 bytes per cell instead of a list of `(row, col)` tuples.
+It is an immutable `Sequence[(row, col)]`: indexing and iteration build tuples
+lazily, so existing code that walks `path[i]` keeps working, while fast paths
+can read `flat_indices` directly.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, List, Tuple, overload
+
+Point = Tuple[int, int]
+
+
+class GridPath(Sequence):
+    """Immutable path of grid cells backed by flat `array('i')` indices."""
+
+    __slots__ = ("_indices", "cols")
+
+    def __init__(self, indices: Iterable[int], cols: int) -> None:
+        if cols <= 0:
+            raise ValueError("cols must be > 0")
+        self._indices = indices if isinstance(indices, array) and indices.typecode == "i" else array("i", indices)
+        self.cols = cols
+
+    @classmethod
+    def from_points(cls, points: Iterable[Sequence[int]], cols: int) -> "GridPath":
+        """Pack `(row, col)` points for a grid with `cols` columns."""
+
+        flat = array("i")
+        for point in points:
+            row, col = int(point[0]), int(point[1])
+            if not 0 <= col < cols:
+                raise ValueError(f"column {col} outside a {cols}-column grid")
+            flat.append(row * cols + col)
+        return cls(flat, cols)
+
+    @property
+    def flat_indices(self) -> memoryview:
+        """Read-only view of the flat cell indices."""
+
+        return memoryview(self._indices).toreadonly()
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._indices) * self._indices.itemsize
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> Point: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "GridPath": ...
+
+    def __getitem__(self, index: int | slice) -> Point | "GridPath":
+        if isinstance(index, slice):
+            return GridPath(self._indices[index], self.cols)
+        return divmod(self._indices[index], self.cols)
+
+    def __iter__(self) -> Iterator[Point]:
+        cols = self.cols
+        for flat in self._indices:
+            yield divmod(flat, cols)
+
+    def __reversed__(self) -> Iterator[Point]:
+        cols = self.cols
+        for flat in reversed(self._indices):
+            yield divmod(flat, cols)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, GridPath):
+            if len(self) != len(other):
+                return False
+            if self.cols == other.cols:
+                return self._indices == other._indices
+            return all(a == b for a, b in zip(self, other))
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes, bytearray)):
+            return len(self) == len(other) and all(
+                a == tuple(b) for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.cols, self._indices.tobytes()))
+
+    def __repr__(self) -> str:
+        preview = ", ".join(repr(point) for point in self[:3])
+        suffix = ", ..." if len(self) > 3 else ""
+        return f"GridPath([{preview}{suffix}], len={len(self)}, cols={self.cols})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (GridPath, (self._indices, self.cols))
+
+    def to_list(self) -> List[Point]:
+        """Materialize the path as a list of `(row, col)` tuples."""
+
+        return list(self)
+
+    def to_numpy(self) -> Any:
+        """Return an `(N, 2)` int32 array of `(row, col)` rows."""
+
+        import numpy as np
+
+        flat = np.frombuffer(self._indices, dtype=np.int32) if len(self) else np.zeros(0, dtype=np.int32)
+        return np.stack(np.divmod(flat, self.cols), axis=1).astype(np.int32)
+
+
+__all__ = [
+    "GridPath",
+]
@@ -0,0 +1,261 @@
+"""Content-addressed cache for planner results.
+
+Keys hash the grid contents together with the query (start, goal), the planner
+name and its keyword arguments, so replanning an identical problem (episode
+resets, repeated seeds) returns the stored result instead of searching again.
+
+The in-memory tier is an LRU bounded by entry count and total stored path
+points. An optional sqlite file adds a persistent second tier shared across
+runs. Results come back as fresh copies with the path frozen to an immutable
+`GridPath` or tuple of `(row, col)` tuples, so callers cannot corrupt cached
+entries.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import copy
+from dataclasses import dataclass
+import hashlib
+from pathlib import Path
+import pickle
+import sqlite3
+from typing import Any, Callable, Dict, Mapping, Sequence, Tuple
+
+try:
+    from .paths import GridPath
+except ImportError:  # pragma: no cover - allows running as a standalone module
+    from paths import GridPath
+
+Point = Tuple[int, int]
+GridLike = Sequence[Sequence[Any]]
+
+
+@dataclass
+class PlanCacheStats:
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+    bypassed: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def grid_digest(grid: GridLike) -> str:
+    """Fast content hash of a 2D grid (row bytes when possible, else `repr`)."""
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(len(grid).to_bytes(8, "little"))
+    for row in grid:
+        try:
+            data = bytes(row)
+        except (TypeError, ValueError):
+            data = repr(list(row)).encode()
+        hasher.update(len(data).to_bytes(8, "little"))
+        hasher.update(data)
+    return hasher.hexdigest()
+
+
+def _stable_token(value: Any) -> str | None:
+    """Deterministic text for a kwarg value, or None if it has no stable identity."""
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    if isinstance(value, (tuple, list)):
+        parts = [_stable_token(item) for item in value]
+        return None if None in parts else f"({','.join(parts)})"  # type: ignore[arg-type]
+    if isinstance(value, Mapping):
+        parts = [(str(k), _stable_token(v)) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))]
+        if any(token is None for _, token in parts):
+            return None
+        return "{" + ",".join(f"{k}:{token}" for k, token in parts) + "}"
+    qualname = getattr(value, "__qualname__", None)
+    if qualname is not None and "<lambda>" not in qualname and "<locals>" not in qualname:
+        return f"{getattr(value, '__module__', '?')}:{qualname}"
+    return None
+
+
+def _freeze_path(path: Any) -> Tuple[Point, ...] | GridPath:
+    if isinstance(path, GridPath):
+        # Already immutable and compact; store it as-is.
+        return path
+    return tuple((int(point[0]), int(point[1])) for point in path)
+
+
+def _freeze(result: Any) -> Any:
+    """Normalize a planner result for storage: tuple paths, private metric copies."""
+
+    if isinstance(result, dict):
+        frozen = {key: copy.deepcopy(value) for key, value in result.items() if key != "path"}
+        frozen["path"] = _freeze_path(result.get("path") or ())
+        return frozen
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], (list, tuple, GridPath)):
+        return (_freeze_path(result[0]), copy.deepcopy(result[1]))
+    return copy.deepcopy(result)
+
+
+def _thaw(stored: Any) -> Any:
+    """Copy a stored result; the frozen path tuple is shared since it is immutable."""
+
+    if isinstance(stored, dict):
+        return {key: value if key == "path" else copy.deepcopy(value) for key, value in stored.items()}
+    if isinstance(stored, tuple) and len(stored) == 2 and isinstance(stored[0], (tuple, GridPath)):
+        return (stored[0], copy.deepcopy(stored[1]))
+    return copy.deepcopy(stored)
+
+
+def _path_points(stored: Any) -> int:
+    if isinstance(stored, dict):
+        return len(stored.get("path", ()))
+    if isinstance(stored, tuple) and len(stored) == 2 and isinstance(stored[0], (tuple, GridPath)):
+        return len(stored[0])
+    return 0
+
+
+class PlanCache:
+    """LRU plan-result cache with an optional sqlite persistence tier."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_path_points: int = 2_000_000,
+        path: str | Path | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.max_path_points = max_path_points
+        self.stats = PlanCacheStats()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._path_points = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(str(path))
+            self._db.execute("CREATE TABLE IF NOT EXISTS plans (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+            self._db.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def make_key(
+        self,
+        planner: str,
+        grid: GridLike,
+        start: Point,
+        goal: Point,
+        kwargs: Mapping[str, Any] | None = None,
+    ) -> str | None:
+        """Build the cache key, or None when a kwarg has no stable identity."""
+
+        kwargs_token = _stable_token(dict(kwargs or {}))
+        if kwargs_token is None:
+            return None
+        rows = len(grid)
+        cols = len(grid[0]) if rows else 0
+        query = (
+            f"{planner.strip().lower()}|{rows}x{cols}|{tuple(start)}|{tuple(goal)}|{kwargs_token}"
+        )
+        return f"{grid_digest(grid)}:{hashlib.blake2b(query.encode(), digest_size=16).hexdigest()}"
+
+    def get(self, key: str) -> Any | None:
+        stored = self._entries.get(key)
+        if stored is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return _thaw(stored)
+        if self._db is not None:
+            row = self._db.execute("SELECT value FROM plans WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                stored = pickle.loads(row[0])
+                self._remember(key, stored)
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+                return _thaw(stored)
+        self.stats.misses += 1
+        return None
+
+    def put(self, key: str, result: Any) -> None:
+        stored = _freeze(result)
+        self._remember(key, stored)
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO plans (key, value) VALUES (?, ?)",
+                (key, pickle.dumps(stored, protocol=pickle.HIGHEST_PROTOCOL)),
+            )
+            self._db.commit()
+
+    def get_or_plan(
+        self,
+        planner_name: str,
+        planner_fn: Callable[..., Any],
+        grid: GridLike,
+        start: Point,
+        goal: Point,
+        **kwargs: Any,
+    ) -> Any:
+        """Return a cached result for this query, running `planner_fn` on a miss."""
+
+        key = self.make_key(planner_name, grid, start, goal, kwargs)
+        if key is None:
+            self.stats.bypassed += 1
+            return planner_fn(grid, start, goal, **kwargs)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        self.put(key, planner_fn(grid, start, goal, **kwargs))
+        return self.get_stored(key)
+
+    def get_stored(self, key: str) -> Any | None:
+        """Copy of the in-memory entry without touching hit/miss statistics."""
+
+        stored = self._entries.get(key)
+        return None if stored is None else _thaw(stored)
+
+    def clear(self, *, disk: bool = False) -> None:
+        self._entries.clear()
+        self._path_points = 0
+        if disk and self._db is not None:
+            self._db.execute("DELETE FROM plans")
+            self._db.commit()
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def stats_dict(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "path_points": self._path_points,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "disk_hits": self.stats.disk_hits,
+            "evictions": self.stats.evictions,
+            "bypassed": self.stats.bypassed,
+            "hit_rate": self.stats.hit_rate,
+        }
+
+    def _remember(self, key: str, stored: Any) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._path_points -= _path_points(previous)
+        self._entries[key] = stored
+        self._path_points += _path_points(stored)
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._path_points > self.max_path_points
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._path_points -= _path_points(evicted)
+            self.stats.evictions += 1
+
+
+__all__ = [
+    "PlanCache",
+    "PlanCacheStats",
+    "grid_digest",
+]
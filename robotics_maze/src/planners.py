@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
-from collections import deque
+from contextlib import nullcontext
 import heapq
 import time
 from itertools import count
 from math import sqrt
-from typing import Any, Callable, Dict, Iterable, List, Literal, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Literal, Sequence, Tuple
 
 try:
-    from .heuristics import HeuristicFn, Point, resolve_heuristic
+    from .heuristics import HeuristicFn, Point, heuristic_table, resolve_heuristic
+    from .workspace import NO_PARENT, PlannerWorkspace, scratch_workspace
 except ImportError:  # pragma: no cover - allows running as a standalone module
-    from heuristics import HeuristicFn, Point, resolve_heuristic
+    from heuristics import HeuristicFn, Point, heuristic_table, resolve_heuristic
+    from workspace import NO_PARENT, PlannerWorkspace, scratch_workspace
 
+if TYPE_CHECKING:  # pragma: no cover
+    from plan_cache import PlanCache
 
 GridLike = Sequence[Sequence[Any]]
-Path = List[Point]
+# Baseline planners return a compact `GridPath`; plain point lists are also accepted.
+Path = Sequence[Point]
 PlannerResult = Dict[str, Any]
 PlannerFn = Callable[..., PlannerResult]
 AStarTieBreak = Literal["fifo", "low_h", "high_g"]
+SearchBackend = Literal["queue", "wavefront"]
 
 _PLANNERS: Dict[str, PlannerFn] = {}
 
@@ -82,11 +88,15 @@ def plan_path(
     grid: GridLike,
     start: Point,
     goal: Point,
+    *,
+    cache: "PlanCache | None" = None,
     **kwargs: Any,
 ) -> PlannerResult:
-    """Run a planner by registry name."""
+    """Run a planner by registry name, optionally through a `PlanCache`."""
 
     planner = get_planner(planner_name)
+    if cache is not None:
+        return cache.get_or_plan(planner_name, planner, grid, start, goal, **kwargs)
     return planner(grid, start, goal, **kwargs)
 
 
@@ -126,16 +136,6 @@ def _step_cost(current: Point, nxt: Point) -> float:
     return sqrt(2.0) if current[0] != nxt[0] and current[1] != nxt[1] else 1.0
 
 
-def _reconstruct_path(came_from: Dict[Point, Point], goal: Point) -> Path:
-    path: Path = [goal]
-    node = goal
-    while node in came_from:
-        node = came_from[node]
-        path.append(node)
-    path.reverse()
-    return path
-
-
 def _result(path: Path, expanded_nodes: int, started_at: float) -> PlannerResult:
     elapsed = time.perf_counter() - started_at
     return {
@@ -146,6 +146,42 @@ def _result(path: Path, expanded_nodes: int, started_at: float) -> PlannerResult
     }
 
 
+def _plan_with_wavefront(
+    grid: GridLike,
+    start: Point,
+    goal: Point,
+    *,
+    allow_diagonal: bool,
+) -> PlannerResult:
+    try:
+        from .wavefront import plan_wavefront
+    except ImportError:
+        from wavefront import plan_wavefront
+
+    started_at = time.perf_counter()
+    rows, cols = _grid_shape(grid)
+    if rows == 0 or cols == 0:
+        return _result([], 0, started_at)
+    if not _in_bounds(start, rows, cols) or not _in_bounds(goal, rows, cols):
+        return _result([], 0, started_at)
+    if not _is_passable(grid, start) or not _is_passable(grid, goal):
+        return _result([], 0, started_at)
+    return plan_wavefront(grid, start, goal, allow_diagonal=allow_diagonal)
+
+
+def _search_workspace(rows: int, cols: int, workspace: PlannerWorkspace | None):
+    """Use the caller's workspace, else borrow the per-thread scratch one."""
+
+    if workspace is not None:
+        return nullcontext(workspace)
+    return scratch_workspace(rows, cols)
+
+
+def _check_backend(backend: str) -> None:
+    if backend not in {"queue", "wavefront"}:
+        raise ValueError(f"Unsupported search backend '{backend}'.")
+
+
 def _astar_tie_priority(g_cost: float, h_cost: float, tie_break: AStarTieBreak) -> float:
     if tie_break == "low_h":
         return h_cost
@@ -164,6 +200,7 @@ def _best_first_search(
     allow_diagonal: bool = False,
     heuristic_weight: float = 1.0,
     astar_tie_break: AStarTieBreak = "fifo",
+    workspace: PlannerWorkspace | None = None,
 ) -> PlannerResult:
     started_at = time.perf_counter()
     rows, cols = _grid_shape(grid)
@@ -181,67 +218,92 @@ def _best_first_search(
             raise ValueError(f"Unsupported A* tie break mode '{astar_tie_break}'.")
 
     heuristic_fn = resolve_heuristic(heuristic)
-    frontier: List[Tuple[float, float, int, Point]] = []
-    tie_breaker = count()
-    came_from: Dict[Point, Point] = {}
-    g_score: Dict[Point, float] = {start: 0.0}
-    closed: set[Point] = set()
-    expanded_nodes = 0
-
-    initial_h = 0.0 if mode == "dijkstra" else heuristic_fn(start, goal)
-    if mode == "astar":
-        initial_priority = heuristic_weight * initial_h
-        initial_tie = _astar_tie_priority(0.0, initial_h, astar_tie_break)
-    elif mode == "dijkstra":
-        initial_priority = 0.0
-        initial_tie = 0.0
-    elif mode == "greedy_best_first":
-        initial_priority = initial_h
-        initial_tie = 0.0
-    else:
-        raise ValueError(f"Unsupported search mode '{mode}'.")
-    heapq.heappush(frontier, (initial_priority, initial_tie, next(tie_breaker), start))
-
-    while frontier:
-        _, _, _, current = heapq.heappop(frontier)
-        if current in closed:
-            continue
-        closed.add(current)
-        expanded_nodes += 1
-
-        if current == goal:
-            return _result(_reconstruct_path(came_from, goal), expanded_nodes, started_at)
-
-        current_cost = g_score.get(current, float("inf"))
-        for nxt in _neighbors(current, rows, cols, allow_diagonal):
-            if not _is_passable(grid, nxt):
+    # Dijkstra ignores the heuristic; the others read a cached per-goal table
+    # and only fall back to per-node calls for unregistered callables.
+    h_table = None if mode == "dijkstra" else heuristic_table(heuristic_fn, (rows, cols), goal)
+    # Search state lives in flat row-major workspace arrays, reset between
+    # queries by bumping the generation stamp instead of reallocating.
+    with _search_workspace(rows, cols, workspace) as ws:
+        generation = ws.begin(rows, cols)
+        g_score = ws.g
+        parent = ws.parent
+        seen = ws.seen
+        closed = ws.closed
+        frontier: List[Tuple[float, float, int, int]] = ws.heap
+        tie_breaker = count()
+        start_index = start[0] * cols + start[1]
+        goal_index = goal[0] * cols + goal[1]
+        g_score[start_index] = 0.0
+        parent[start_index] = NO_PARENT
+        seen[start_index] = generation
+        expanded_nodes = 0
+
+        if mode == "dijkstra":
+            initial_h = 0.0
+        elif h_table is not None:
+            initial_h = h_table[start[0] * cols + start[1]]
+        else:
+            initial_h = heuristic_fn(start, goal)
+        if mode == "astar":
+            initial_priority = heuristic_weight * initial_h
+            initial_tie = _astar_tie_priority(0.0, initial_h, astar_tie_break)
+        elif mode == "dijkstra":
+            initial_priority = 0.0
+            initial_tie = 0.0
+        elif mode == "greedy_best_first":
+            initial_priority = initial_h
+            initial_tie = 0.0
+        else:
+            raise ValueError(f"Unsupported search mode '{mode}'.")
+        heapq.heappush(frontier, (initial_priority, initial_tie, next(tie_breaker), start_index))
+
+        while frontier:
+            _, _, _, index = heapq.heappop(frontier)
+            if closed[index] == generation:
                 continue
-
-            step = _step_cost(current, nxt)
-            tentative_cost = current_cost + step
-            known_cost = g_score.get(nxt, float("inf"))
-            if tentative_cost >= known_cost:
-                continue
-
-            came_from[nxt] = current
-            g_score[nxt] = tentative_cost
-            heuristic_cost = heuristic_fn(nxt, goal)
-
-            if mode == "astar":
-                priority = tentative_cost + (heuristic_weight * heuristic_cost)
-                tie_priority = _astar_tie_priority(tentative_cost, heuristic_cost, astar_tie_break)
-            elif mode == "dijkstra":
-                priority = tentative_cost
-                tie_priority = 0.0
-            elif mode == "greedy_best_first":
-                priority = heuristic_cost
-                tie_priority = 0.0
-            else:
-                raise ValueError(f"Unsupported search mode '{mode}'.")
-
-            heapq.heappush(frontier, (priority, tie_priority, next(tie_breaker), nxt))
-
-    return _result([], expanded_nodes, started_at)
+            closed[index] = generation
+            expanded_nodes += 1
+
+            if index == goal_index:
+                return _result(ws.path_to(goal_index), expanded_nodes, started_at)
+
+            current = divmod(index, cols)
+            current_cost = g_score[index]
+            for nxt in _neighbors(current, rows, cols, allow_diagonal):
+                if not _is_passable(grid, nxt):
+                    continue
+
+                next_index = nxt[0] * cols + nxt[1]
+                step = _step_cost(current, nxt)
+                tentative_cost = current_cost + step
+                if seen[next_index] == generation and tentative_cost >= g_score[next_index]:
+                    continue
+
+                parent[next_index] = index
+                g_score[next_index] = tentative_cost
+                seen[next_index] = generation
+                if mode == "dijkstra":
+                    heuristic_cost = 0.0
+                elif h_table is not None:
+                    heuristic_cost = h_table[nxt[0] * cols + nxt[1]]
+                else:
+                    heuristic_cost = heuristic_fn(nxt, goal)
+
+                if mode == "astar":
+                    priority = tentative_cost + (heuristic_weight * heuristic_cost)
+                    tie_priority = _astar_tie_priority(tentative_cost, heuristic_cost, astar_tie_break)
+                elif mode == "dijkstra":
+                    priority = tentative_cost
+                    tie_priority = 0.0
+                elif mode == "greedy_best_first":
+                    priority = heuristic_cost
+                    tie_priority = 0.0
+                else:
+                    raise ValueError(f"Unsupported search mode '{mode}'.")
+
+                heapq.heappush(frontier, (priority, tie_priority, next(tie_breaker), next_index))
+
+        return _result([], expanded_nodes, started_at)
 
 
 @register_planner("astar")
@@ -254,6 +316,7 @@ def astar(
     allow_diagonal: bool = False,
     heuristic_weight: float = 1.0,
     tie_break: AStarTieBreak = "low_h",
+    workspace: PlannerWorkspace | None = None,
 ) -> PlannerResult:
     """A* baseline on a grid maze.
 
@@ -270,9 +333,51 @@ def astar(
         allow_diagonal=allow_diagonal,
         heuristic_weight=heuristic_weight,
         astar_tie_break=tie_break,
+        workspace=workspace,
     )
 
 
+ALT_INDEX_LANDMARKS = 8
+
+
+def build_alt_index(grid: GridLike, *, allow_diagonal: bool = False):
+    """Landmark heuristic (see `landmarks`) for `astar_alt` queries on `grid`."""
+
+    try:
+        from .landmarks import build_alt_heuristic
+    except ImportError:
+        from landmarks import build_alt_heuristic
+
+    return build_alt_heuristic(grid, landmarks=ALT_INDEX_LANDMARKS, allow_diagonal=allow_diagonal, name=None)
+
+
+@register_planner("astar_alt")
+def astar_alt(
+    grid: GridLike,
+    start: Point,
+    goal: Point,
+    *,
+    index: Any = None,
+    allow_diagonal: bool = False,
+    workspace: PlannerWorkspace | None = None,
+) -> PlannerResult:
+    """A* with an ALT landmark heuristic for `grid`.
+
+    `index` is the heuristic from `build_alt_index(grid)`; reusing it for many
+    queries on one grid amortizes the landmark preprocessing, which otherwise
+    runs on every call.
+    """
+
+    if index is None:
+        index = build_alt_index(grid, allow_diagonal=allow_diagonal)
+    return astar(grid, start, goal, heuristic=index, allow_diagonal=allow_diagonal, workspace=workspace)
+
+
+# Per-grid preprocessing hook: the benchmark builds the index once per maze and
+# passes it to every query on that maze as `index=`.
+astar_alt.preprocess = build_alt_index  # type: ignore[attr-defined]
+
+
 @register_planner("dijkstra")
 def dijkstra(
     grid: GridLike,
@@ -281,8 +386,20 @@ def dijkstra(
     *,
     heuristic: str | HeuristicFn | None = "manhattan",
     allow_diagonal: bool = False,
+    backend: SearchBackend = "queue",
+    workspace: PlannerWorkspace | None = None,
 ) -> PlannerResult:
-    """Dijkstra baseline on a grid maze."""
+    """Dijkstra baseline on a grid maze.
+
+    `backend="wavefront"` runs a vectorized NumPy BFS wavefront instead of a
+    heap; with unit 4-connected steps it yields the same optimal costs.
+    """
+
+    _check_backend(backend)
+    if backend == "wavefront":
+        if allow_diagonal:
+            raise ValueError("The wavefront backend counts hops; diagonal Dijkstra needs the queue backend.")
+        return _plan_with_wavefront(grid, start, goal, allow_diagonal=False)
 
     return _best_first_search(
         grid,
@@ -291,6 +408,7 @@ def dijkstra(
         mode="dijkstra",
         heuristic=heuristic,
         allow_diagonal=allow_diagonal,
+        workspace=workspace,
     )
 
 
@@ -301,12 +419,19 @@ def bfs(
     goal: Point,
     *,
     allow_diagonal: bool = False,
+    backend: SearchBackend = "queue",
+    workspace: PlannerWorkspace | None = None,
 ) -> PlannerResult:
     """Breadth-first search baseline on a grid maze.
 
-    BFS minimizes hop count on an unweighted occupancy grid.
+    BFS minimizes hop count on an unweighted occupancy grid. Use
+    `backend="wavefront"` for the vectorized NumPy engine on large grids.
     """
 
+    _check_backend(backend)
+    if backend == "wavefront":
+        return _plan_with_wavefront(grid, start, goal, allow_diagonal=allow_diagonal)
+
     started_at = time.perf_counter()
     rows, cols = _grid_shape(grid)
     if rows == 0 or cols == 0:
@@ -316,26 +441,34 @@ def bfs(
     if not _is_passable(grid, start) or not _is_passable(grid, goal):
         return _result([], 0, started_at)
 
-    frontier = deque([start])
-    visited: set[Point] = {start}
-    came_from: Dict[Point, Point] = {}
-    expanded_nodes = 0
+    with _search_workspace(rows, cols, workspace) as ws:
+        generation = ws.begin(rows, cols)
+        parent = ws.parent
+        seen = ws.seen
+        frontier = ws.queue
+        start_index = start[0] * cols + start[1]
+        goal_index = goal[0] * cols + goal[1]
+        parent[start_index] = NO_PARENT
+        seen[start_index] = generation
+        frontier.append(start_index)
+        expanded_nodes = 0
 
-    while frontier:
-        current = frontier.popleft()
-        expanded_nodes += 1
+        while frontier:
+            index = frontier.popleft()
+            expanded_nodes += 1
 
-        if current == goal:
-            return _result(_reconstruct_path(came_from, goal), expanded_nodes, started_at)
+            if index == goal_index:
+                return _result(ws.path_to(goal_index), expanded_nodes, started_at)
 
-        for nxt in _neighbors(current, rows, cols, allow_diagonal):
-            if nxt in visited or not _is_passable(grid, nxt):
-                continue
-            visited.add(nxt)
-            came_from[nxt] = current
-            frontier.append(nxt)
+            for nxt in _neighbors(divmod(index, cols), rows, cols, allow_diagonal):
+                next_index = nxt[0] * cols + nxt[1]
+                if seen[next_index] == generation or not _is_passable(grid, nxt):
+                    continue
+                seen[next_index] = generation
+                parent[next_index] = index
+                frontier.append(next_index)
 
-    return _result([], expanded_nodes, started_at)
+        return _result([], expanded_nodes, started_at)
 
 
 @register_planner("greedy_best_first")
@@ -346,6 +479,7 @@ def greedy_best_first(
     *,
     heuristic: str | HeuristicFn | None = "manhattan",
     allow_diagonal: bool = False,
+    workspace: PlannerWorkspace | None = None,
 ) -> PlannerResult:
     """Greedy Best-First Search baseline on a grid maze."""
 
@@ -356,6 +490,7 @@ def greedy_best_first(
         mode="greedy_best_first",
         heuristic=heuristic,
         allow_diagonal=allow_diagonal,
+        workspace=workspace,
     )
 
 
@@ -408,8 +543,11 @@ __all__ = [
     "Path",
     "PlannerFn",
     "PlannerResult",
+    "SearchBackend",
     "astar",
+    "astar_alt",
     "bfs",
+    "build_alt_index",
     "dijkstra",
     "get_planner",
     "greedy_best_first",
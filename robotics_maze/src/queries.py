@@ -0,0 +1,98 @@
+"""Query mixes: which start/goal pairs a benchmark asks on each maze.
+
+The benchmark's default workload is one query per maze, from the maze start
+(a corner) to its goal (the centre). The other mixes give `count` queries per
+maze, chosen among free lattice cell centres (odd row and column):
+
+- `random`: uniformly random pairs of distinct cells.
+- `farthest`: a random source paired with the cell farthest from it. The first
+  pair comes from a double sweep, so it spans (about) the maze's diameter.
+- `dead_ends`: random pairs of distinct dead ends (cells with one free
+  neighbour), which force searches into the maze's blind alleys. Falls back to
+  random cells when a maze has fewer than two dead ends.
+
+Pairs are deterministic for a seed and always mutually reachable.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .wavefront import occupancy_mask, wavefront
+except ImportError:  # pragma: no cover - allows running as a standalone module
+    from wavefront import occupancy_mask, wavefront
+
+Cell = Tuple[int, int]
+Query = Tuple[Cell, Cell]
+
+QUERY_MIXES: Tuple[str, ...] = ("default", "random", "farthest", "dead_ends")
+
+
+def _cell_centres(blocked: np.ndarray) -> List[Cell]:
+    centres = np.argwhere(~blocked)
+    centres = centres[(centres[:, 0] % 2 == 1) & (centres[:, 1] % 2 == 1)]
+    if not len(centres):
+        centres = np.argwhere(~blocked)
+    return [(int(row), int(col)) for row, col in centres]
+
+
+def _dead_ends(blocked: np.ndarray, cells: Sequence[Cell]) -> List[Cell]:
+    free = np.pad(~blocked, 1, constant_values=False)
+    degree = free[:-2, 1:-1].astype(np.int8) + free[2:, 1:-1] + free[1:-1, :-2] + free[1:-1, 2:]
+    return [cell for cell in cells if degree[cell] == 1]
+
+
+def _farthest_from(blocked: np.ndarray, source: Cell, cells: Sequence[Cell]) -> Cell:
+    distances = wavefront(blocked, source).distances
+    return max(cells, key=lambda cell: (int(distances[cell]), cell))
+
+
+def generate_queries(
+    grid: Sequence[Sequence[Any]] | np.ndarray,
+    start: Cell,
+    goal: Cell,
+    mix: str = "default",
+    count: int = 1,
+    *,
+    seed: int = 0,
+) -> List[Query]:
+    """Return the `mix` queries for one maze (`[(start, goal)]` for `default`)."""
+
+    if mix not in QUERY_MIXES:
+        raise ValueError(f"Unsupported query mix '{mix}'. Expected one of {list(QUERY_MIXES)}.")
+    if count < 1:
+        raise ValueError("count must be >= 1.")
+    if mix == "default":
+        return [(start, goal)]
+
+    blocked = occupancy_mask(grid)
+    # Benchmark mazes are perfect (one component), but keep to start's
+    # component so every pair is solvable on any grid.
+    reachable = wavefront(blocked, start).distances >= 0
+    cells = [cell for cell in _cell_centres(blocked) if reachable[cell]]
+    if len(cells) < 2:
+        return [(start, goal)] * count
+    rng = random.Random(f"{mix}:{seed}")
+
+    if mix == "farthest":
+        source = _farthest_from(blocked, rng.choice(cells), cells)
+        queries: List[Query] = [(source, _farthest_from(blocked, source, cells))]
+        while len(queries) < count:
+            source = rng.choice(cells)
+            queries.append((source, _farthest_from(blocked, source, cells)))
+        return queries
+
+    pool = _dead_ends(blocked, cells) if mix == "dead_ends" else cells
+    if len(pool) < 2:
+        pool = cells
+    return [tuple(rng.sample(pool, 2)) for _ in range(count)]  # type: ignore[misc]
+
+
+__all__ = [
+    "QUERY_MIXES",
+    "generate_queries",
+]
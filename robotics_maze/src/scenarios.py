@@ -0,0 +1,235 @@
+"""Dynamic-map scenarios: occupancy deltas replayed as successive planning queries.
+
+A `Scenario` is a base occupancy grid with a fixed start and goal plus a
+sequence of `OccupancyUpdate`s. Updates apply cumulatively; the base grid and
+the grid after each update are the scenario's queries. This is the workload
+incremental planners (r6 LPA*) are built for, unlike the benchmark's fresh
+maze per trial.
+
+Scenario kinds:
+- `doors`: one wall slot of the maze lattice toggles per step, opening a new
+  passage or closing an open one.
+- `blockages`: random free cells become blocked; each blockage clears again
+  after `lifetime` steps.
+- `robots`: a few robots random-walk over free cells; every step frees their
+  old cells and blocks the new ones.
+
+Generation is deterministic for a seed, and start and goal are never blocked.
+Closing passages can disconnect the goal, so each query records whether it is
+solvable (via `wavefront`), and "no path" answers can be scored.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import random
+from typing import Any, Iterator, List, Sequence, Tuple
+
+try:
+    from .wavefront import wavefront
+except ImportError:  # pragma: no cover - allows running as a standalone module
+    from wavefront import wavefront
+
+Cell = Tuple[int, int]
+Grid = List[List[int]]
+
+SCENARIO_KINDS: Tuple[str, ...] = ("doors", "blockages", "robots")
+
+
+@dataclass(frozen=True)
+class OccupancyUpdate:
+    """Cells that become blocked and free between two consecutive queries."""
+
+    step: int
+    blocked: Tuple[Cell, ...] = ()
+    freed: Tuple[Cell, ...] = ()
+
+    @property
+    def changed_cells(self) -> int:
+        return len(self.blocked) + len(self.freed)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    kind: str
+    base_grid: Tuple[Tuple[int, ...], ...]
+    start: Cell
+    goal: Cell
+    updates: Tuple[OccupancyUpdate, ...]
+    # One entry per query: the base grid, then the grid after each update.
+    solvable: Tuple[bool, ...]
+
+    @property
+    def query_count(self) -> int:
+        return len(self.updates) + 1
+
+    def queries(self) -> Iterator[Grid]:
+        """Yield a fresh grid per query: the base grid, then after each update."""
+
+        grid = [list(row) for row in self.base_grid]
+        yield [row[:] for row in grid]
+        for update in self.updates:
+            apply_update(grid, update)
+            yield [row[:] for row in grid]
+
+
+def apply_update(grid: Grid, update: OccupancyUpdate) -> None:
+    """Apply `update` to `grid` in place (1 = blocked, 0 = free)."""
+
+    for row, col in update.freed:
+        grid[row][col] = 0
+    for row, col in update.blocked:
+        grid[row][col] = 1
+
+
+def _is_free(grid: Grid, cell: Cell) -> bool:
+    return not grid[cell[0]][cell[1]]
+
+
+def _interior_cells(grid: Grid) -> List[Cell]:
+    return [(row, col) for row in range(1, len(grid) - 1) for col in range(1, len(grid[0]) - 1)]
+
+
+def _door_updates(grid: Grid, start: Cell, goal: Cell, steps: int, rng: random.Random) -> List[OccupancyUpdate]:
+    # Wall slots of the (2H+1)x(2W+1) lattice sit between two cell centres.
+    doors = [cell for cell in _interior_cells(grid) if cell[0] % 2 != cell[1] % 2 and cell not in (start, goal)]
+    updates: List[OccupancyUpdate] = []
+    for step in range(1, steps + 1):
+        door = rng.choice(doors)
+        if _is_free(grid, door):
+            update = OccupancyUpdate(step, blocked=(door,))
+        else:
+            update = OccupancyUpdate(step, freed=(door,))
+        apply_update(grid, update)
+        updates.append(update)
+    return updates
+
+
+def _blockage_updates(
+    grid: Grid,
+    start: Cell,
+    goal: Cell,
+    steps: int,
+    rng: random.Random,
+    *,
+    per_step: int = 1,
+    lifetime: int = 5,
+) -> List[OccupancyUpdate]:
+    candidates = [cell for cell in _interior_cells(grid) if _is_free(grid, cell) and cell not in (start, goal)]
+    active: List[Tuple[int, Cell]] = []
+    updates: List[OccupancyUpdate] = []
+    for step in range(1, steps + 1):
+        freed = tuple(cell for placed, cell in active if step - placed >= lifetime)
+        active = [(placed, cell) for placed, cell in active if step - placed < lifetime]
+        occupied = {cell for _, cell in active}
+        free_now = [cell for cell in candidates if cell not in occupied and cell not in freed]
+        blocked = tuple(rng.sample(free_now, min(per_step, len(free_now))))
+        active.extend((step, cell) for cell in blocked)
+        update = OccupancyUpdate(step, blocked=blocked, freed=freed)
+        apply_update(grid, update)
+        updates.append(update)
+    return updates
+
+
+def _place_robots(grid: Grid, start: Cell, goal: Cell, rng: random.Random, robots: int) -> List[Cell]:
+    candidates = [cell for cell in _interior_cells(grid) if _is_free(grid, cell) and cell not in (start, goal)]
+    positions = rng.sample(candidates, min(robots, len(candidates)))
+    for row, col in positions:
+        grid[row][col] = 1
+    return positions
+
+
+def _robot_updates(
+    grid: Grid,
+    start: Cell,
+    goal: Cell,
+    steps: int,
+    rng: random.Random,
+    positions: List[Cell],
+) -> List[OccupancyUpdate]:
+    updates: List[OccupancyUpdate] = []
+    for step in range(1, steps + 1):
+        blocked: List[Cell] = []
+        freed: List[Cell] = []
+        for index, (row, col) in enumerate(positions):
+            moves = [
+                (row + dr, col + dc)
+                for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                if _is_free(grid, (row + dr, col + dc)) and (row + dr, col + dc) not in (start, goal)
+            ]
+            if not moves:
+                continue
+            target = rng.choice(moves)
+            grid[row][col] = 0
+            grid[target[0]][target[1]] = 1
+            positions[index] = target
+            freed.append((row, col))
+            blocked.append(target)
+        # A cell vacated by one robot and entered by another stays blocked.
+        update = OccupancyUpdate(
+            step,
+            blocked=tuple(cell for cell in blocked if cell not in freed),
+            freed=tuple(cell for cell in freed if cell not in blocked),
+        )
+        updates.append(update)
+    return updates
+
+
+def _solvable(grid: Grid, start: Cell, goal: Cell) -> bool:
+    return wavefront(grid, start, goal=goal).distance_to(goal) >= 0
+
+
+def generate_scenario(
+    kind: str,
+    grid: Sequence[Sequence[Any]],
+    start: Cell,
+    goal: Cell,
+    *,
+    steps: int = 20,
+    seed: int = 0,
+) -> Scenario:
+    """Build a `kind` scenario of `steps` updates on `grid` (which is not modified)."""
+
+    if kind not in SCENARIO_KINDS:
+        raise ValueError(f"Unsupported scenario kind '{kind}'. Expected one of {list(SCENARIO_KINDS)}.")
+    if steps < 1:
+        raise ValueError("steps must be >= 1.")
+    working = [[1 if value else 0 for value in row] for row in grid]
+    if not (_is_free(working, start) and _is_free(working, goal)):
+        raise ValueError("start and goal must be free cells.")
+    rng = random.Random(f"{kind}:{seed}")
+    if kind == "doors":
+        base = [row[:] for row in working]
+        updates = _door_updates(working, start, goal, steps, rng)
+    elif kind == "blockages":
+        base = [row[:] for row in working]
+        updates = _blockage_updates(working, start, goal, steps, rng)
+    else:
+        # Robots are obstacles from the first query on.
+        positions = _place_robots(working, start, goal, rng, robots=3)
+        base = [row[:] for row in working]
+        updates = _robot_updates(working, start, goal, steps, rng, positions)
+
+    solvable = []
+    replay_grid = [row[:] for row in base]
+    solvable.append(_solvable(replay_grid, start, goal))
+    for update in updates:
+        apply_update(replay_grid, update)
+        solvable.append(_solvable(replay_grid, start, goal))
+    return Scenario(
+        kind=kind,
+        base_grid=tuple(tuple(row) for row in base),
+        start=start,
+        goal=goal,
+        updates=tuple(updates),
+        solvable=tuple(solvable),
+    )
+
+
+__all__ = [
+    "OccupancyUpdate",
+    "SCENARIO_KINDS",
+    "Scenario",
+    "apply_update",
+    "generate_scenario",
+]
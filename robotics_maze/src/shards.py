@@ -0,0 +1,201 @@
+"""Shard a benchmark's mazes across hosts, with a lock-file work queue.
+
+`Shard(index, count)` owns the mazes whose index is `index` modulo `count`.
+Every shard runs the same planners and settings, and round-robin assignment
+keeps shards balanced in a size sweep too. The union of all shards' trials is
+the unsharded run's. The one exception is a planner that reuses state across
+mazes (r6 LPA*): it sees only its own shard's mazes in order, so its reuse
+counts and timings differ.
+
+`ShardQueue` lets hosts on a shared filesystem claim shards from a
+directory:
+
+- Claiming creates `<i>-of-<N>.lock` atomically (`O_CREAT | O_EXCL`),
+  holding the host, pid and claim time.
+- A finished shard gets a `<i>-of-<N>.done` marker and its lock is removed.
+- `release` removes the lock of a shard that failed, so another host can
+  take it.
+
+A lock left by a dead process on the same host is reclaimed automatically,
+as is an empty or unparsable lock (a claimer that died mid-write) older
+than `lock_grace_s`. Reclaiming first renames the lock to a name unique to
+the reclaimer and re-reads it there, so two hosts racing for the same
+stale lock cannot delete a fresh one. A lock left by another host must be
+deleted by hand, because liveness cannot be checked across hosts.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import socket
+import time
+from typing import List, Optional
+import uuid
+
+
+@dataclass(frozen=True, order=True)
+class Shard:
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"Invalid shard {self.index}/{self.count}: need 0 <= i < N.")
+
+    @property
+    def label(self) -> str:
+        return f"{self.index}-of-{self.count}"
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def owns(self, maze_index: int) -> bool:
+        return maze_index % self.count == self.index
+
+    def maze_indices(self, maze_count: int) -> List[int]:
+        return list(range(self.index, maze_count, self.count))
+
+
+def parse_shard(text: str) -> Shard:
+    """Parse `i/N` (0-based shard `i` of `N`)."""
+
+    index, sep, count = text.partition("/")
+    try:
+        if not sep:
+            raise ValueError
+        return Shard(int(index), int(count))
+    except ValueError:
+        raise ValueError(f"expected a shard as i/N with 0 <= i < N, got '{text}'") from None
+
+
+def all_shards(count: int) -> List[Shard]:
+    return [Shard(index, count) for index in range(count)]
+
+
+DEFAULT_LOCK_GRACE_S = 60.0
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ShardQueue:
+    """Claim the `count` shards of a run through lock files in `root`."""
+
+    def __init__(self, root: Path, count: int, *, lock_grace_s: float = DEFAULT_LOCK_GRACE_S) -> None:
+        if count < 1:
+            raise ValueError("count must be >= 1.")
+        if lock_grace_s < 0:
+            raise ValueError("lock_grace_s must be >= 0.")
+        self.root = Path(root)
+        self.count = count
+        self.lock_grace_s = lock_grace_s
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _lock_path(self, shard: Shard) -> Path:
+        return self.root / f"{shard.label}.lock"
+
+    def _done_path(self, shard: Shard) -> Path:
+        return self.root / f"{shard.label}.done"
+
+    def shards(self) -> List[Shard]:
+        return all_shards(self.count)
+
+    def is_done(self, shard: Shard) -> bool:
+        return self._done_path(shard).exists()
+
+    def pending(self) -> List[Shard]:
+        """Shards that are neither finished nor claimed."""
+
+        return [shard for shard in self.shards() if not self.is_done(shard) and not self._lock_path(shard).exists()]
+
+    def _is_stale(self, path: Path) -> bool:
+        try:
+            text = path.read_text(encoding="utf-8")
+            age_s = time.time() - path.stat().st_mtime
+        except OSError:
+            return False
+        try:
+            owner = json.loads(text)
+            host, pid = owner["host"], int(owner["pid"])
+        except (ValueError, KeyError, TypeError):
+            return age_s > self.lock_grace_s
+        return host == socket.gethostname() and not _pid_alive(pid)
+
+    def _reclaim_if_stale(self, shard: Shard) -> None:
+        lock = self._lock_path(shard)
+        if not self._is_stale(lock):
+            return
+        # Another host may reclaim and re-lock the shard between the check and
+        # here, so move the lock aside and check again before deleting it.
+        aside = lock.with_name(f"{lock.name}.{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex}")
+        try:
+            os.rename(lock, aside)
+        except OSError:
+            return
+        if not self._is_stale(aside):
+            # A fresh lock was moved: put it back unless the shard was locked again.
+            try:
+                os.link(aside, lock)
+            except OSError:
+                pass
+        aside.unlink(missing_ok=True)
+
+    def _try_lock(self, shard: Shard) -> bool:
+        try:
+            fd = os.open(self._lock_path(shard), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        owner = {
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "claimed_at": datetime.now(tz=timezone.utc).isoformat(timespec="seconds"),
+        }
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(owner, handle)
+        return True
+
+    def claim(self) -> Optional[Shard]:
+        """Lock and return the first unfinished, unclaimed shard, or None when none is left."""
+
+        for shard in self.shards():
+            if self.is_done(shard):
+                continue
+            if self._lock_path(shard).exists():
+                self._reclaim_if_stale(shard)
+            if not self._try_lock(shard):
+                continue
+            if self.is_done(shard):
+                # Another host finished it between the checks.
+                self.release(shard)
+                continue
+            return shard
+        return None
+
+    def complete(self, shard: Shard) -> None:
+        self._done_path(shard).write_text(
+            datetime.now(tz=timezone.utc).isoformat(timespec="seconds") + "\n", encoding="utf-8"
+        )
+        self._lock_path(shard).unlink(missing_ok=True)
+
+    def release(self, shard: Shard) -> None:
+        self._lock_path(shard).unlink(missing_ok=True)
+
+
+__all__ = [
+    "DEFAULT_LOCK_GRACE_S",
+    "Shard",
+    "ShardQueue",
+    "all_shards",
+    "parse_shard",
+]
@@ -608,7 +608,14 @@ def _warn(message: str) -> None:
 
 
 class MazeEpisodeSimulator:
-    """Adapter exposing `run_episode` for the project CLI."""
+    """Adapter exposing `run_episode` for the project CLI.
+
+    `shortcut` ("greedy" or "optimal") replaces lattice paths with
+    line-of-sight shortcuts that keep `robot_radius` (world units) clear of
+    walls. It is off by default: without a radius, shortcuts graze wall
+    corners, which a physical robot would clip. The CLI sets both through
+    `--shortcut` and `--robot-radius`.
+    """
 
     def __init__(
         self,
@@ -616,11 +623,18 @@ class MazeEpisodeSimulator:
         cell_size: float = 1.0,
         wall_thickness: float = 0.1,
         wall_height: float = 0.8,
+        robot_radius: float = 0.0,
+        shortcut: str = "none",
     ) -> None:
+        shortcut_key = shortcut.strip().lower()
+        if shortcut_key not in {"none", "greedy", "optimal"}:
+            raise ValueError("shortcut must be one of: none, greedy, optimal")
         self.max_steps = int(max_steps)
         self.cell_size = float(cell_size)
         self.wall_thickness = float(wall_thickness)
         self.wall_height = float(wall_height)
+        self.robot_radius = max(float(robot_radius), 0.0)
+        self.shortcut = shortcut_key
 
     def run_episode(
         self,
@@ -867,17 +881,32 @@ class MazeEpisodeSimulator:
 
     def _extract_waypoints(self, maze: Any, plan: Any) -> list[tuple[float, float]]:
         raw_path = self._extract_raw_path(maze, plan)
+        width = getattr(maze, "width", None)
+        if isinstance(width, int) and _grid_path_cols(raw_path) == 2 * width + 1:
+            # Compact `GridPath` on the occupancy lattice: its cells are already
+            # integer `(row, col)` pairs, so skip float coercion and shape sniffing.
+            shortcut = self._shortcut_lattice_path(maze, raw_path)
+            return self._lattice_to_world(raw_path if shortcut is None else shortcut)
+
         points = _coerce_path_points(raw_path, swap_xy=_plan_path_uses_row_col(plan))
         if not points:
             return []
 
         if _looks_like_grid_path(points, maze):
+            lattice = [(2 * int(round(y)) + 1, 2 * int(round(x)) + 1) for x, y in points]
+            shortcut = self._shortcut_lattice_path(maze, lattice)
+            if shortcut is not None:
+                return self._lattice_to_world(shortcut)
             points = [
                 ((point[0] + 0.5) * self.cell_size, (point[1] + 0.5) * self.cell_size)
                 for point in points
             ]
             return _compress_collinear_waypoints(points)
         elif _looks_like_occupancy_grid_path(points, maze):
+            lattice = [(int(round(y)), int(round(x))) for x, y in points]
+            shortcut = self._shortcut_lattice_path(maze, lattice)
+            if shortcut is not None:
+                return self._lattice_to_world(shortcut)
             # Occupancy-grid planners usually operate on a `(2W+1, 2H+1)` lattice.
             # Convert lattice coordinates into world meters at half-cell resolution.
             return [
@@ -886,6 +915,35 @@ class MazeEpisodeSimulator:
             ]
         return _compress_collinear_waypoints(points)
 
+    def _lattice_to_world(self, lattice_path: Sequence[tuple[int, int]]) -> list[tuple[float, float]]:
+        half_cell = 0.5 * self.cell_size
+        return [(col * half_cell, row * half_cell) for row, col in lattice_path]
+
+    def _shortcut_lattice_path(
+        self,
+        maze: Any,
+        lattice_path: Sequence[tuple[int, int]],
+    ) -> list[tuple[int, int]] | None:
+        """Line-of-sight shortcut a `(row, col)` occupancy-lattice path, or None if unavailable."""
+        if self.shortcut == "none" or len(lattice_path) <= 2:
+            return None
+        try:
+            from maze import maze_to_occupancy_grid
+            from path_smoothing import shortcut_path
+
+            grid, _, _ = maze_to_occupancy_grid(maze)
+        except Exception:
+            return None
+
+        rows = len(grid)
+        cols = len(grid[0]) if rows else 0
+        for row, col in lattice_path:
+            if not (0 <= row < rows and 0 <= col < cols) or grid[row][col]:
+                # Not a path on this maze's lattice; leave it untouched.
+                return None
+        clearance = self.robot_radius / (0.5 * self.cell_size)
+        return shortcut_path(grid, lattice_path, clearance=clearance, method=self.shortcut)
+
     def _extract_raw_path(self, maze: Any, plan: Any) -> Any:
         if isinstance(plan, Mapping):
             for key in ("path", "waypoints", "trajectory"):
@@ -926,6 +984,14 @@ class MazeEpisodeSimulator:
         return []
 
 
+def _grid_path_cols(raw_path: Any) -> int | None:
+    """Column count of a compact `paths.GridPath`, or None for other path types."""
+    cols = getattr(raw_path, "cols", None)
+    if isinstance(cols, int) and hasattr(raw_path, "flat_indices"):
+        return cols
+    return None
+
+
 def _coerce_path_points(raw_path: Any, *, swap_xy: bool = False) -> list[tuple[float, float]]:
     if not isinstance(raw_path, Sequence) or isinstance(raw_path, (str, bytes, bytearray)):
         return []
@@ -0,0 +1,122 @@
+"""Planner hyperparameter sweeps: parameter grids, planner variants and Pareto fronts.
+
+A grid spec names a planner and a list of values per keyword argument:
+
+    r7_beam_search:beam_width=4,8,16,32
+    astar:tie_break=fifo,low_h,high_g;heuristic_weight=1,1.5,2
+
+Values parse as int, float, `true`/`false`, `none` or else as strings. Every
+combination becomes a planner variant: the planner with those keyword
+arguments bound, named like `astar[heuristic_weight=1.5,tie_break=low_h]`.
+A variant keeps the planner's hooks (`reuses_state`, `preprocess`, ...) and
+pickles by reference, so it runs in worker processes like any planner.
+
+`pareto_front` marks the configurations no other one beats on every
+objective at once.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import itertools
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+ParamGrid = Dict[str, List[Any]]
+
+
+def _parse_value(text: str) -> Any:
+    lowered = text.strip().lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    if lowered == "none":
+        return None
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            continue
+    return text.strip()
+
+
+def parse_param_grid(text: str) -> Tuple[str, ParamGrid]:
+    """Parse `planner:name=v1,v2;name=v3` into the planner name and its grid."""
+
+    planner, sep, body = text.partition(":")
+    planner = planner.strip()
+    if not sep or not planner or not body.strip():
+        raise ValueError(f"expected planner:param=v1,v2[;param=...], got '{text}'")
+    grid: ParamGrid = {}
+    for entry in body.split(";"):
+        name, eq, values = entry.partition("=")
+        name = name.strip()
+        parsed = [_parse_value(value) for value in values.split(",") if value.strip()]
+        if not eq or not name.isidentifier() or not parsed:
+            raise ValueError(f"expected param=v1,v2 in '{text}', got '{entry.strip()}'")
+        if name in grid:
+            raise ValueError(f"Parameter '{name}' appears twice in '{text}'.")
+        grid[name] = parsed
+    return planner, grid
+
+
+def expand_grid(grid: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Every combination of the grid's values, parameters in name order."""
+
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def variant_name(planner: str, params: Mapping[str, Any]) -> str:
+    return f"{planner}[{','.join(f'{name}={params[name]}' for name in sorted(params))}]"
+
+
+def make_variant(planner_fn: Callable[..., Any], params: Mapping[str, Any]) -> Callable[..., Any]:
+    """Bind `params` to `planner_fn`; raises ValueError for keywords it does not take."""
+
+    try:
+        parameters = inspect.signature(planner_fn).parameters
+    except (TypeError, ValueError):
+        parameters = {}
+    takes_kwargs = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+    unknown = sorted(
+        name
+        for name in params
+        if not takes_kwargs
+        and (
+            name not in parameters
+            or parameters[name].kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.VAR_POSITIONAL)
+        )
+    )
+    if unknown:
+        raise ValueError(f"{getattr(planner_fn, '__name__', planner_fn)} has no parameter(s) {', '.join(unknown)}.")
+    variant = functools.partial(planner_fn, **params)
+    # Keep hooks and markers (`reuses_state`, `preprocess`, `reset_state`).
+    variant.__dict__.update({key: value for key, value in vars(planner_fn).items() if key != "__wrapped__"})
+    return variant
+
+
+def pareto_front(points: Sequence[Sequence[float]]) -> List[bool]:
+    """Flag the points no other point dominates (all objectives minimized).
+
+    A point dominates another when it is no worse on every objective and
+    strictly better on at least one. NaN objectives count as worst.
+    """
+
+    keys = [tuple(float("inf") if value != value else float(value) for value in point) for point in points]
+    return [
+        not any(
+            all(o <= p for o, p in zip(other, point)) and any(o < p for o, p in zip(other, point))
+            for other in keys
+        )
+        for point in keys
+    ]
+
+
+__all__ = [
+    "ParamGrid",
+    "expand_grid",
+    "make_variant",
+    "pareto_front",
+    "parse_param_grid",
+    "variant_name",
+]
@@ -0,0 +1,360 @@
+"""Benchmark trial records and a streaming columnar store for them.
+
+`TrialResult` is the per-(maze, query, planner) record produced by the benchmark
+harness. It is a slotted frozen dataclass, so each instance carries no
+per-object `__dict__`.
+
+For very large runs, `ColumnarTrialWriter` streams trials into a NumPy `.npz`
+archive in fixed-size chunks instead of holding them in memory. Each chunk is
+stored as a packed structured array (`TRIAL_DTYPE`, 81 bytes per trial) plus
+side arrays for the variable-length parts:
+
+- `trials_NNNNNN.npy`: fixed-width fields; planner and algorithm names are
+  small integer codes into `planners.npy` / `algorithms.npy`, and missing
+  `path_length`/`expansions`/memory figures are stored as -1 (a missing
+  `preprocess_ms` as NaN).
+- `timing_offsets_NNNNNN.npy` / `timings_NNNNNN.npy`: every timed repeat,
+  flattened, with per-trial offsets.
+- `error_rows_NNNNNN.npy` / `errors_NNNNNN.npy`: error text, only for the rows
+  that have one.
+
+The archive is a regular `.npz` (`numpy.load` opens it), but its zip directory
+is only written by `close()`: an interrupted run leaves an unreadable file, so
+use the CSV checkpoint when crash safety matters. Readers load one chunk, or
+only the requested columns, at a time. `TrialColumnBuffer` keeps the same
+fixed-width columns in memory for summarizing a run without the file.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+import zipfile
+
+import numpy as np
+
+TRIAL_DTYPE = np.dtype(
+    [
+        ("planner", "<u2"),
+        ("maze_index", "<i8"),
+        ("maze_seed", "<i8"),
+        ("width", "<i4"),
+        ("height", "<i4"),
+        ("algorithm", "<u2"),
+        ("success", "?"),
+        ("solve_time_ms", "<f8"),
+        ("path_length", "<i8"),
+        ("expansions", "<i8"),
+        ("peak_memory_bytes", "<i8"),
+        ("retained_blocks", "<i8"),
+        ("query_index", "<i4"),
+        ("preprocess_ms", "<f8"),
+    ]
+)
+MISSING = -1
+# Values for fields absent from stores written before they existed (default: MISSING).
+_FIELD_DEFAULTS: Dict[str, float] = {"query_index": 0, "preprocess_ms": float("nan")}
+DEFAULT_CHUNK_SIZE = 65_536
+
+
+@dataclass(frozen=True, slots=True)
+class TrialResult:
+    planner: str
+    maze_index: int
+    maze_seed: int
+    width: int
+    height: int
+    algorithm: str
+    success: bool
+    solve_time_ms: float
+    path_length: int | None
+    expansions: int | None
+    error: str | None = None
+    # Every timed repeat; `solve_time_ms` is their median.
+    timings_ms: tuple[float, ...] = ()
+    # Memory profile of one traced call (`--profile-memory`): tracemalloc peak
+    # above the pre-call level, and interpreter blocks still held afterwards.
+    peak_memory_bytes: int | None = None
+    retained_blocks: int | None = None
+    # Position of the query within the maze's query mix (0 for the default query).
+    query_index: int = 0
+    # Per-maze preprocessing of indexed planners, amortized over the maze's queries.
+    preprocess_ms: float | None = None
+
+
+@dataclass
+class TrialColumns:
+    """Whole-run columns of `TRIAL_DTYPE` fields, with name tables for the coded ones."""
+
+    columns: Dict[str, np.ndarray]
+    planners: Tuple[str, ...]
+    algorithms: Tuple[str, ...]
+    size: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.size = len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+
+def _chunk_name(kind: str, index: int) -> str:
+    return f"{kind}_{index:06d}.npy"
+
+
+class _RowPacker:
+    """Packs trials into a preallocated `TRIAL_DTYPE` chunk, coding the name fields."""
+
+    def __init__(self, chunk_size: int) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1.")
+        self.chunk_size = chunk_size
+        self._codes: Dict[str, Dict[str, int]] = {"planners": {}, "algorithms": {}}
+        self._rows = np.zeros(chunk_size, dtype=TRIAL_DTYPE)
+        self._fill = 0
+
+    def _code(self, table: str, name: str) -> int:
+        codes = self._codes[table]
+        if name not in codes:
+            if len(codes) > np.iinfo(np.uint16).max:
+                raise ValueError(f"too many distinct {table} for the columnar store")
+            codes[name] = len(codes)
+        return codes[name]
+
+    def _names(self, table: str) -> Tuple[str, ...]:
+        codes = self._codes[table]
+        return tuple(sorted(codes, key=codes.__getitem__))
+
+    def _pack(self, trial: TrialResult) -> int:
+        """Store `trial` in the current chunk and return its row position."""
+
+        position = self._fill
+        self._rows[position] = (
+            self._code("planners", trial.planner),
+            trial.maze_index,
+            trial.maze_seed,
+            trial.width,
+            trial.height,
+            self._code("algorithms", trial.algorithm),
+            trial.success,
+            trial.solve_time_ms,
+            MISSING if trial.path_length is None else trial.path_length,
+            MISSING if trial.expansions is None else trial.expansions,
+            MISSING if trial.peak_memory_bytes is None else trial.peak_memory_bytes,
+            MISSING if trial.retained_blocks is None else trial.retained_blocks,
+            trial.query_index,
+            math.nan if trial.preprocess_ms is None else trial.preprocess_ms,
+        )
+        self._fill += 1
+        return position
+
+
+class TrialColumnBuffer(_RowPacker):
+    """In-memory columns of the fixed-width trial fields, grown one chunk at a time.
+
+    Keeps about 81 bytes per trial (no timings or error text), so a long run
+    can be summarized without retaining its `TrialResult` objects.
+    """
+
+    def __init__(self, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        super().__init__(chunk_size)
+        self._chunks: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._chunks) + self._fill
+
+    def append(self, trial: TrialResult) -> None:
+        self._pack(trial)
+        if self._fill == self.chunk_size:
+            self._chunks.append(self._rows)
+            self._rows = np.zeros(self.chunk_size, dtype=TRIAL_DTYPE)
+            self._fill = 0
+
+    def columns(self) -> TrialColumns:
+        rows = np.concatenate([*self._chunks, self._rows[: self._fill]])
+        return TrialColumns(
+            {name: rows[name].copy() for name in TRIAL_DTYPE.names or ()},
+            self._names("planners"),
+            self._names("algorithms"),
+        )
+
+
+class ColumnarTrialWriter(_RowPacker):
+    """Stream `TrialResult`s into a chunked `.npz` archive."""
+
+    def __init__(self, output_path: Path, *, chunk_size: int = DEFAULT_CHUNK_SIZE, compress: bool = False) -> None:
+        super().__init__(chunk_size)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = output_path
+        self.written = 0
+        self._zip = zipfile.ZipFile(
+            output_path, "w", compression=zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        )
+        self._chunk_index = 0
+        self._timings: List[float] = []
+        self._timing_offsets: List[int] = [0]
+        self._error_rows: List[int] = []
+        self._errors: List[str] = []
+
+    def __enter__(self) -> "ColumnarTrialWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def write(self, trial: TrialResult) -> None:
+        position = self._pack(trial)
+        self._timings.extend(trial.timings_ms)
+        self._timing_offsets.append(len(self._timings))
+        if trial.error:
+            self._error_rows.append(position)
+            self._errors.append(trial.error)
+        self.written += 1
+        if self._fill == self.chunk_size:
+            self._flush_chunk()
+
+    def write_many(self, trials: Iterable[TrialResult]) -> None:
+        for trial in trials:
+            self.write(trial)
+
+    def _put(self, name: str, array: np.ndarray) -> None:
+        with self._zip.open(name, "w", force_zip64=True) as handle:
+            np.lib.format.write_array(handle, np.ascontiguousarray(array), allow_pickle=False)
+
+    def _flush_chunk(self) -> None:
+        if not self._fill:
+            return
+        index = self._chunk_index
+        self._put(_chunk_name("trials", index), self._rows[: self._fill])
+        self._put(_chunk_name("timing_offsets", index), np.asarray(self._timing_offsets, dtype=np.int64))
+        self._put(_chunk_name("timings", index), np.asarray(self._timings, dtype=np.float64))
+        self._put(_chunk_name("error_rows", index), np.asarray(self._error_rows, dtype=np.int32))
+        self._put(_chunk_name("errors", index), np.asarray(self._errors, dtype=np.str_))
+        self._chunk_index += 1
+        self._fill = 0
+        self._timings = []
+        self._timing_offsets = [0]
+        self._error_rows = []
+        self._errors = []
+
+    def close(self) -> None:
+        if self._zip.fp is None:
+            return
+        self._flush_chunk()
+        for table in self._codes:
+            self._put(f"{table}.npy", np.asarray(self._names(table), dtype=np.str_))
+        self._zip.close()
+
+
+def _chunk_indices(archive: "np.lib.npyio.NpzFile") -> List[int]:
+    # `NpzFile.files` lists member names without the `.npy` suffix.
+    return sorted(int(name[len("trials_") :]) for name in archive.files if name.startswith("trials_"))
+
+
+def _name_tables(archive: "np.lib.npyio.NpzFile") -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    return tuple(archive["planners.npy"].tolist()), tuple(archive["algorithms.npy"].tolist())
+
+
+def iter_trial_chunks(input_path: Path) -> Iterator[Tuple[np.ndarray, Tuple[str, ...], Tuple[str, ...]]]:
+    """Yield `(structured chunk, planner names, algorithm names)` one chunk at a time."""
+
+    with np.load(input_path, allow_pickle=False) as archive:
+        planners, algorithms = _name_tables(archive)
+        for index in _chunk_indices(archive):
+            yield archive[_chunk_name("trials", index)], planners, algorithms
+
+
+def _optional(value: int) -> int | None:
+    return None if value == MISSING else value
+
+
+def _optional_float(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def iter_trials(input_path: Path) -> Iterator[TrialResult]:
+    """Yield stored trials as `TrialResult`s, loading one chunk at a time."""
+
+    with np.load(input_path, allow_pickle=False) as archive:
+        planners, algorithms = _name_tables(archive)
+        for index in _chunk_indices(archive):
+            rows = archive[_chunk_name("trials", index)]
+            offsets = archive[_chunk_name("timing_offsets", index)].tolist()
+            timings = archive[_chunk_name("timings", index)].tolist()
+            errors = dict(
+                zip(
+                    archive[_chunk_name("error_rows", index)].tolist(),
+                    archive[_chunk_name("errors", index)].tolist(),
+                )
+            )
+            names = rows.dtype.names or ()
+            for position, values in enumerate(rows.tolist()):
+                row = dict(zip(names, values))
+                yield TrialResult(
+                    planner=planners[row["planner"]],
+                    maze_index=row["maze_index"],
+                    maze_seed=row["maze_seed"],
+                    width=row["width"],
+                    height=row["height"],
+                    algorithm=algorithms[row["algorithm"]],
+                    success=row["success"],
+                    solve_time_ms=row["solve_time_ms"],
+                    path_length=_optional(row["path_length"]),
+                    expansions=_optional(row["expansions"]),
+                    error=errors.get(position),
+                    timings_ms=tuple(timings[offsets[position] : offsets[position + 1]]),
+                    peak_memory_bytes=_optional(row.get("peak_memory_bytes", MISSING)),
+                    retained_blocks=_optional(row.get("retained_blocks", MISSING)),
+                    query_index=row.get("query_index", 0),
+                    preprocess_ms=_optional_float(row.get("preprocess_ms", math.nan)),
+                )
+
+
+def read_columns(input_path: Path, fields: Sequence[str] | None = None) -> TrialColumns:
+    """Load only `fields` (default: all fixed-width fields) chunk by chunk."""
+
+    names = list(fields) if fields is not None else list(TRIAL_DTYPE.names or ())
+    unknown = set(names) - set(TRIAL_DTYPE.names or ())
+    if unknown:
+        raise ValueError(f"unknown trial fields: {sorted(unknown)}")
+    parts: Dict[str, List[np.ndarray]] = {name: [] for name in names}
+    planners: Tuple[str, ...] = ()
+    algorithms: Tuple[str, ...] = ()
+    for rows, planners, algorithms in iter_trial_chunks(input_path):
+        for name in names:
+            if name in (rows.dtype.names or ()):
+                parts[name].append(rows[name].copy())
+            else:
+                # Stores written before the field existed: report it as missing.
+                parts[name].append(np.full(len(rows), _FIELD_DEFAULTS.get(name, MISSING), dtype=TRIAL_DTYPE[name]))
+    columns = {
+        name: np.concatenate(chunks) if chunks else np.zeros(0, dtype=TRIAL_DTYPE[name])
+        for name, chunks in parts.items()
+    }
+    return TrialColumns(columns, planners, algorithms)
+
+
+def columns_from_trials(trials: Iterable[TrialResult]) -> TrialColumns:
+    """Pack in-memory trials into the same columns `read_columns` returns."""
+
+    buffer = TrialColumnBuffer()
+    for trial in trials:
+        buffer.append(trial)
+    return buffer.columns()
+
+
+__all__ = [
+    "ColumnarTrialWriter",
+    "DEFAULT_CHUNK_SIZE",
+    "MISSING",
+    "TRIAL_DTYPE",
+    "TrialColumnBuffer",
+    "TrialColumns",
+    "TrialResult",
+    "columns_from_trials",
+    "iter_trial_chunks",
+    "iter_trials",
+    "read_columns",
+]
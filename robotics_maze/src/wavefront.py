@@ -0,0 +1,333 @@
+"""Vectorized wavefront (BFS distance transform) over occupancy grids.
+
+The grid is padded with a one-cell wall border and flattened, so neighbor
+lookups become constant index offsets and no bounds checks are needed. Each
+BFS layer is expanded with NumPy array operations over the current frontier,
+kept as flat indices so thin maze corridors do not rescan the whole grid.
+
+Outputs:
+- `distances`: int32 hop distance from the source, `-1` where unreachable.
+- `parents`: int8 index into `steps` of the move that reached each cell from
+  its parent, `-1` at the source and at unreachable cells.
+
+`batched_wavefront` runs one synchronized wavefront over a stack of same-sized
+grids shaped `(N, rows, cols)`, which amortizes Python per-call overhead across
+many small mazes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+Point = Tuple[int, int]
+GridLike = Sequence[Sequence[Any]]
+
+UNREACHABLE = -1
+NO_PARENT = -1
+
+CARDINAL_STEPS: Tuple[Point, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL_STEPS: Tuple[Point, ...] = ((-1, -1), (-1, 1), (1, 1), (1, -1))
+
+
+@dataclass(frozen=True)
+class WavefrontResult:
+    """Distance and parent-direction maps for one wavefront source."""
+
+    source: Point
+    distances: np.ndarray
+    parents: np.ndarray
+    steps: Tuple[Point, ...]
+    expanded_nodes: int
+
+    def distance_to(self, target: Point) -> int:
+        """Return the hop distance to `target`, or `-1` when unreachable."""
+
+        return int(self.distances[target[0], target[1]])
+
+    def path_to(self, target: Point) -> List[Point]:
+        """Rebuild the `(row, col)` path from the source to `target`."""
+
+        rows, cols = self.distances.shape
+        if not (0 <= target[0] < rows and 0 <= target[1] < cols):
+            return []
+        if self.distances[target[0], target[1]] < 0:
+            return []
+
+        path: List[Point] = [target]
+        r, c = target
+        parents = self.parents
+        steps = self.steps
+        while (r, c) != self.source:
+            dr, dc = steps[int(parents[r, c])]
+            r, c = r - dr, c - dc
+            path.append((r, c))
+        path.reverse()
+        return path
+
+
+def _is_blocked_cell(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "x", "#", "wall", "blocked", "true"}
+    return False
+
+
+def occupancy_mask(grid: GridLike | np.ndarray) -> np.ndarray:
+    """Return a `(rows, cols)` bool array that is True on blocked cells."""
+
+    array = np.asarray(grid)
+    if array.ndim != 2:
+        raise ValueError("grid must be a rectangular 2D structure")
+    if array.dtype.kind in "biuf":
+        return array != 0
+    return np.array([[_is_blocked_cell(cell) for cell in row] for row in grid], dtype=bool)
+
+
+def _padded_free(blocked: np.ndarray) -> np.ndarray:
+    """Return `~blocked` with a one-cell False border on the last two axes."""
+
+    padded = np.zeros(blocked.shape[:-2] + (blocked.shape[-2] + 2, blocked.shape[-1] + 2), dtype=bool)
+    padded[..., 1:-1, 1:-1] = ~blocked
+    return padded
+
+
+def _expand_flat(
+    free: np.ndarray,
+    sources: np.ndarray,
+    goals: np.ndarray,
+    offsets: np.ndarray,
+    slot_size: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Layered BFS over a flattened, padded stack of grids.
+
+    `sources`/`goals` hold one flat index per stacked grid (`-1` for none).
+    Padding walls keep neighbor offsets from leaking across grid boundaries, so
+    all grids advance together in one frontier array.
+    """
+
+    slots = len(sources)
+    dist = np.full(free.shape, UNREACHABLE, dtype=np.int32)
+    parent = np.full(free.shape, NO_PARENT, dtype=np.int8)
+    expanded = np.zeros(slots, dtype=np.int64)
+
+    frontier = sources[sources >= 0]
+    dist[frontier] = 0
+    tracked_goals = goals >= 0
+    depth = 0
+    while frontier.size:
+        if tracked_goals.any():
+            solved = np.zeros(slots, dtype=bool)
+            solved[tracked_goals] = dist[goals[tracked_goals]] >= 0
+            if solved.any():
+                frontier = frontier[~solved[frontier // slot_size]]
+                tracked_goals &= ~solved
+                if not frontier.size:
+                    break
+        expanded += np.bincount(frontier // slot_size, minlength=slots)
+        candidates = frontier[:, None] + offsets[None, :]
+        open_mask = free[candidates] & (dist[candidates] < 0)
+        cells = candidates[open_mask]
+        if not cells.size:
+            break
+        directions = np.nonzero(open_mask)[1]
+        # Several frontier cells can reach the same neighbor; keep the first.
+        frontier, first = np.unique(cells, return_index=True)
+        depth += 1
+        dist[frontier] = depth
+        parent[frontier] = directions[first]
+
+    return dist, parent, expanded
+
+
+def _walk_parents(parent: List[int], offsets: Sequence[int], index: int, source: int) -> List[int]:
+    chain = [index]
+    while index != source:
+        index -= offsets[parent[index]]
+        chain.append(index)
+    chain.reverse()
+    return chain
+
+
+def wavefront(
+    grid: GridLike | np.ndarray,
+    source: Point,
+    *,
+    goal: Point | None = None,
+    allow_diagonal: bool = False,
+) -> WavefrontResult:
+    """Expand a BFS wavefront from `source` over every reachable free cell.
+
+    When `goal` is given, expansion stops after the layer that reaches it; the
+    distance/parent maps are then complete only up to that depth.
+    """
+
+    result = batched_wavefront(
+        occupancy_mask(grid)[None, :, :],
+        [source],
+        None if goal is None else [goal],
+        allow_diagonal=allow_diagonal,
+    )
+    return result.result(0)
+
+
+@dataclass(frozen=True)
+class BatchedWavefrontResult:
+    """Stacked `(N, rows, cols)` distance/parent maps from `batched_wavefront`."""
+
+    sources: Tuple[Point, ...]
+    distances: np.ndarray
+    parents: np.ndarray
+    steps: Tuple[Point, ...]
+    expanded_nodes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def result(self, index: int) -> WavefrontResult:
+        """View one maze of the batch as a single-source `WavefrontResult`."""
+
+        return WavefrontResult(
+            self.sources[index],
+            self.distances[index],
+            self.parents[index],
+            self.steps,
+            int(self.expanded_nodes[index]),
+        )
+
+    def path_to(self, index: int, target: Point) -> List[Point]:
+        return self.result(index).path_to(target)
+
+    def paths_to(self, targets: Sequence[Point]) -> List[List[Point]]:
+        """Rebuild one path per maze, walking a single flat copy of the parents."""
+
+        if len(targets) != len(self.sources):
+            raise ValueError("targets must match the number of grids")
+        count, rows, cols = self.distances.shape
+        slot_size = rows * cols
+        offsets = [dr * cols + dc for dr, dc in self.steps]
+        parent = self.parents.ravel().tolist()
+        dist = self.distances.ravel()
+        paths: List[List[Point]] = []
+        for index, (source, target) in enumerate(zip(self.sources, targets)):
+            if not (0 <= target[0] < rows and 0 <= target[1] < cols):
+                paths.append([])
+                continue
+            base = index * slot_size
+            flat_target = base + target[0] * cols + target[1]
+            if dist[flat_target] < 0:
+                paths.append([])
+                continue
+            flat_source = base + source[0] * cols + source[1]
+            chain = _walk_parents(parent, offsets, flat_target, flat_source)
+            paths.append([divmod(flat - base, cols) for flat in chain])
+        return paths
+
+
+def batched_wavefront(
+    grids: Sequence[GridLike] | np.ndarray,
+    starts: Sequence[Point],
+    goals: Sequence[Point] | None = None,
+    *,
+    allow_diagonal: bool = False,
+) -> BatchedWavefrontResult:
+    """Expand one synchronized BFS wavefront over `N` same-sized grids.
+
+    The grids are stacked into an `(N, rows, cols)` occupancy array and every
+    BFS layer of every maze is advanced by the same handful of NumPy calls.
+    Mazes whose goal has been reached drop out of the shared frontier.
+    """
+
+    if isinstance(grids, np.ndarray) and grids.ndim == 3 and grids.dtype.kind in "biuf":
+        blocked = grids != 0
+    else:
+        masks = [occupancy_mask(grid) for grid in grids]
+        if len({mask.shape for mask in masks}) > 1:
+            raise ValueError("batched grids must all have the same shape")
+        blocked = np.stack(masks) if masks else np.zeros((0, 0, 0), dtype=bool)
+
+    count, rows, cols = blocked.shape
+    if len(starts) != count or (goals is not None and len(goals) != count):
+        raise ValueError("starts/goals must match the number of grids")
+
+    steps = CARDINAL_STEPS + DIAGONAL_STEPS if allow_diagonal else CARDINAL_STEPS
+    padded_cols = cols + 2
+    slot_size = (rows + 2) * padded_cols
+    free = _padded_free(blocked).ravel()
+    offsets = np.array([dr * padded_cols + dc for dr, dc in steps], dtype=np.int64)
+
+    def _flat(index: int, point: Point | None) -> int:
+        if point is None or not (0 <= point[0] < rows and 0 <= point[1] < cols):
+            return -1
+        return index * slot_size + (point[0] + 1) * padded_cols + (point[1] + 1)
+
+    source_indices = np.array([_flat(i, start) for i, start in enumerate(starts)], dtype=np.int64)
+    source_indices[~free[np.maximum(source_indices, 0)]] = -1
+    goal_indices = np.array(
+        [_flat(i, None if goals is None else goals[i]) for i in range(count)], dtype=np.int64
+    )
+
+    dist, parent, expanded = _expand_flat(free, source_indices, goal_indices, offsets, slot_size)
+    interior = (slice(None), slice(1, -1), slice(1, -1))
+    return BatchedWavefrontResult(
+        tuple((int(start[0]), int(start[1])) for start in starts),
+        np.ascontiguousarray(dist.reshape(count, rows + 2, padded_cols)[interior]),
+        np.ascontiguousarray(parent.reshape(count, rows + 2, padded_cols)[interior]),
+        steps,
+        expanded,
+    )
+
+
+def batched_wavefront_paths(
+    grids: Sequence[GridLike] | np.ndarray,
+    starts: Sequence[Point],
+    goals: Sequence[Point],
+    *,
+    allow_diagonal: bool = False,
+) -> List[List[Point]]:
+    """Solve a batch of same-sized mazes; returns one path per maze (or `[]`)."""
+
+    result = batched_wavefront(grids, starts, goals, allow_diagonal=allow_diagonal)
+    return result.paths_to(goals)
+
+
+def plan_wavefront(
+    grid: GridLike | np.ndarray,
+    start: Point,
+    goal: Point,
+    *,
+    allow_diagonal: bool = False,
+) -> Dict[str, Any]:
+    """Planner-registry compatible shortest-hop search using the wavefront."""
+
+    started_at = time.perf_counter()
+    result = wavefront(grid, start, goal=goal, allow_diagonal=allow_diagonal)
+    path = result.path_to(goal)
+    elapsed = time.perf_counter() - started_at
+    return {
+        "path": path,
+        "expanded_nodes": result.expanded_nodes,
+        "runtime_sec": elapsed,
+        "runtime_ms": elapsed * 1000.0,
+    }
+
+
+__all__ = [
+    "BatchedWavefrontResult",
+    "CARDINAL_STEPS",
+    "DIAGONAL_STEPS",
+    "NO_PARENT",
+    "UNREACHABLE",
+    "WavefrontResult",
+    "batched_wavefront",
+    "batched_wavefront_paths",
+    "occupancy_mask",
+    "plan_wavefront",
+    "wavefront",
+]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import dataclasses
+import importlib
 import importlib.util
 import sys
 from pathlib import Path
@@ -74,3 +76,819 @@ def test_benchmark_reports_written_to_output_dir(tmp_path):
     assert "algorithm" in csv_text
     assert "success_rate" not in csv_text  # CSV is per-trial detail.
     assert "| Planner | Success Rate |" in md_text
+
+
+def test_bidirectional_bfs_bitset_engine_matches_queue_engine():
+    r9 = importlib.import_module("alt_planners.r9_bidirectional_bfs")
+    grid, start, goal = benchmark.generate_benchmark_maze(
+        width=12, height=12, seed=5, algorithm="prim"
+    )
+
+    queue_path, queue_metrics = r9.plan_bidirectional_bfs(grid, start, goal, engine="queue")
+    bitset_path, bitset_metrics = r9.plan_bidirectional_bfs(grid, start, goal, engine="bitset")
+
+    assert bitset_metrics["engine"] == "bitset"
+    assert queue_metrics["engine"] == "queue"
+    assert len(bitset_path) == len(queue_path) > 1
+    assert bitset_path[0] == start and bitset_path[-1] == goal
+    valid, _, error = benchmark._validate_and_measure_path(grid, bitset_path, start, goal)
+    assert valid, error
+
+
+def test_wavefront_distances_match_bfs_backend():
+    wavefront = importlib.import_module("wavefront")
+    planners = importlib.import_module("planners")
+    grid, start, goal = benchmark.generate_benchmark_maze(
+        width=9, height=7, seed=3, algorithm="backtracker"
+    )
+
+    result = wavefront.wavefront(grid, start)
+    queue_path = planners.bfs(grid, start, goal)["path"]
+    wavefront_path = planners.bfs(grid, start, goal, backend="wavefront")["path"]
+
+    assert result.distances.dtype.name == "int32"
+    assert result.distance_to(goal) == len(queue_path) - 1
+    assert wavefront_path == result.path_to(goal)
+    assert len(wavefront_path) == len(queue_path)
+    assert result.distance_to((0, 0)) == wavefront.UNREACHABLE
+
+
+def test_batched_benchmark_mode_matches_per_maze_paths():
+    planners = {"dijkstra": benchmark.load_available_planners(include_alt=False)["dijkstra"]}
+    trials, summary = benchmark.run_benchmark(
+        planners=planners,
+        maze_count=6,
+        width=8,
+        height=8,
+        seed=4,
+        algorithm="backtracker",
+        batched=True,
+    )
+
+    batched = [t for t in trials if t.planner == benchmark.BATCHED_PLANNER_NAME]
+    single = {t.maze_index: t for t in trials if t.planner == "dijkstra"}
+    assert len(batched) == 6
+    assert all(t.success for t in batched)
+    assert all(t.path_length == single[t.maze_index].path_length for t in batched)
+    assert {row["planner"] for row in summary} == {"dijkstra", benchmark.BATCHED_PLANNER_NAME}
+
+
+def test_heuristic_table_cached_per_goal_and_matches_function():
+    heuristics = importlib.import_module("heuristics")
+
+    table = heuristics.heuristic_table("manhattan", (5, 7), (2, 3))
+    assert table is heuristics.heuristic_table(heuristics.manhattan_distance, (5, 7), (2, 3))
+    assert table[4 * 7 + 6] == heuristics.manhattan_distance((4, 6), (2, 3))
+    assert heuristics.heuristic_table(lambda a, b: 0.0, (5, 7), (2, 3)) is None
+
+    heuristics.register_heuristic("manhattan", heuristics.manhattan_distance, overwrite=True)
+    assert heuristics.heuristic_table("manhattan", (5, 7), (2, 3)) is not table
+
+
+def test_alt_landmark_heuristic_is_admissible_and_registered():
+    landmarks = importlib.import_module("landmarks")
+    planners = importlib.import_module("planners")
+
+    grid, start, goal = benchmark.generate_benchmark_maze(12, 12, seed=5)
+    for strategy in ("farthest", "avoid"):
+        alt = landmarks.build_alt_heuristic(grid, landmarks=4, strategy=strategy, name="alt_test")
+        assert len(alt.landmarks) == 4
+        assert alt.stats()["memory_bytes"] == 4 * len(grid) * len(grid[0]) * 4
+        assert 0.0 < alt.quality(grid, goal) <= 1.0
+
+        baseline = planners.astar(grid, start, goal)
+        guided = planners.astar(grid, start, goal, heuristic="alt_test")
+        assert len(guided["path"]) == len(baseline["path"])
+        assert guided["expanded_nodes"] <= baseline["expanded_nodes"]
+
+    r13 = importlib.import_module("alt_planners.r13_greedy_best_first")
+    unregistered = landmarks.build_alt_heuristic(grid, landmarks=4, name=None)
+    assert {unregistered: 1}[unregistered] == 1
+    by_object, _ = r13.plan_greedy_best_first(grid, start, goal, heuristic=unregistered)
+    by_name, _ = r13.plan_greedy_best_first(grid, start, goal, heuristic="alt_test")
+    assert by_object[0] == by_name[0] == start and by_object[-1] == by_name[-1] == goal
+
+    # Unregistered indexes still get cached tables, dropped along with the index.
+    heuristics = importlib.import_module("heuristics")
+    table = heuristics.heuristic_table(unregistered, unregistered.shape, goal)
+    assert table == unregistered.build_table(*unregistered.shape, goal)
+    assert heuristics.heuristic_table(unregistered, unregistered.shape, goal) is table
+    cached = len(heuristics._TABLES)
+    del unregistered
+    assert len(heuristics._TABLES) < cached
+
+
+def test_plan_cache_returns_immutable_copies_and_persists(tmp_path):
+    planners = importlib.import_module("planners")
+    plan_cache = importlib.import_module("plan_cache")
+
+    grid, start, goal = benchmark.generate_benchmark_maze(8, 8, seed=3)
+    cache = plan_cache.PlanCache(max_entries=2, path=tmp_path / "plans.sqlite")
+    first = planners.plan_path("astar", grid, start, goal, cache=cache)
+    first["expanded_nodes"] = -1
+    second = planners.plan_path("astar", grid, start, goal, cache=cache)
+    assert not isinstance(second["path"], list) and second["path"][0] == start
+    assert second["expanded_nodes"] > 0
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    planners.plan_path("astar", grid, start, goal, cache=cache, allow_diagonal=True)
+    planners.plan_path("bfs", grid, start, goal, cache=cache)
+    assert cache.stats.evictions == 1
+    cache.close()
+
+    reopened = plan_cache.PlanCache(path=tmp_path / "plans.sqlite")
+    again = planners.plan_path("astar", grid, start, goal, cache=reopened)
+    assert again["path"] == second["path"]
+    assert reopened.stats.disk_hits == 1
+    reopened.close()
+
+
+def test_line_of_sight_shortcutting_reduces_sim_waypoints():
+    path_smoothing = importlib.import_module("path_smoothing")
+    planners = importlib.import_module("planners")
+    sim = importlib.import_module("sim")
+
+    open_grid = [[0] * 10 for _ in range(10)]
+    open_grid[5][5] = 1
+    blocked = path_smoothing.inflate_obstacles(open_grid, 0.0)
+    staircase = [(0, c) for c in range(10)] + [(r, 9) for r in range(1, 10)]
+    for method in ("greedy", "optimal"):
+        shortcut = path_smoothing.shortcut_path(open_grid, staircase, method=method)
+        assert shortcut[0] == (0, 0) and shortcut[-1] == (9, 9) and len(shortcut) == 3
+        assert all(path_smoothing.line_of_sight(blocked, a, b) for a, b in zip(shortcut, shortcut[1:]))
+    assert not path_smoothing.line_of_sight(blocked, (0, 0), (9, 9))
+    assert path_smoothing.shortcut_path(open_grid, staircase, clearance=2.0)[1] != (7, 9)
+
+    maze = benchmark.maze_mod.generate_maze(width=8, height=8, seed=4, algorithm="prim")
+    grid, start, goal = benchmark.maze_to_occupancy_grid(maze)
+    plan = planners.astar(grid, start, goal)
+    raw = sim.MazeEpisodeSimulator(shortcut="none")._extract_waypoints(maze, plan)
+    assert sim.MazeEpisodeSimulator()._extract_waypoints(maze, plan) == raw
+    smoothed = sim.MazeEpisodeSimulator(shortcut="greedy")._extract_waypoints(maze, plan)
+    assert smoothed[0] == raw[0] and smoothed[-1] == raw[-1]
+    assert len(smoothed) < len(raw)
+
+    main = importlib.import_module("main")
+    config = main.parse_args(["--shortcut", "greedy", "--robot-radius", "0.1"])
+    simulator = main.load_simulator(shortcut=config.shortcut, robot_radius=config.robot_radius)
+    assert (simulator.shortcut, simulator.robot_radius) == ("greedy", 0.1)
+    assert main.parse_args([]).shortcut == "none"
+
+
+def test_planner_workspace_reuse_matches_fresh_searches():
+    planners = importlib.import_module("planners")
+    workspace_mod = importlib.import_module("workspace")
+
+    grid, start, goal = benchmark.generate_benchmark_maze(10, 10, seed=8, algorithm="prim")
+    workspace = workspace_mod.PlannerWorkspace(len(grid), len(grid[0]))
+    free = [(r, c) for r, row in enumerate(grid) for c, cell in enumerate(row) if cell == 0]
+    for target in (goal, free[len(free) // 2], free[-1], start):
+        for name in ("astar", "dijkstra", "greedy_best_first", "bfs"):
+            planner = getattr(planners, name)
+            reused = planner(grid, start, target, workspace=workspace)
+            fresh = planner(grid, start, target)
+            assert reused["path"] == fresh["path"]
+            assert reused["expanded_nodes"] == fresh["expanded_nodes"]
+    assert workspace.allocations == 1 and workspace.queries == 16
+
+    sparse = workspace_mod.PlannerWorkspace(sparse=True)
+    assert planners.bfs(grid, start, goal, workspace=sparse)["path"] == planners.bfs(grid, start, goal)["path"]
+
+
+def test_grid_path_is_compact_and_accepted_downstream():
+    paths = importlib.import_module("paths")
+    planners = importlib.import_module("planners")
+    sim = importlib.import_module("sim")
+
+    maze = benchmark.maze_mod.generate_maze(width=9, height=9, seed=2, algorithm="backtracker")
+    grid, start, goal = benchmark.maze_to_occupancy_grid(maze)
+    result = planners.bfs(grid, start, goal)
+    path = result["path"]
+    assert isinstance(path, paths.GridPath)
+    assert path == planners.bfs(grid, start, goal, backend="wavefront")["path"]
+    assert path[0] == start and path[-1] == goal and list(path[::-1])[0] == goal
+    assert path.nbytes == 4 * len(path)
+    assert path.to_numpy().shape == (len(path), 2)
+
+    assert benchmark._coerce_path(path) is path
+    assert benchmark._validate_and_measure_path(grid, path, start, goal) == (
+        benchmark._validate_and_measure_path(grid, path.to_list(), start, goal)
+    )
+    assert sim.MazeEpisodeSimulator(shortcut="none")._extract_waypoints(maze, result) == [
+        (col * 0.5, row * 0.5) for row, col in path
+    ]
+
+
+def test_parallel_benchmark_matches_sequential_ordering():
+    available = benchmark.load_available_planners(include_alt=True)
+    planners = {name: available[name] for name in ("astar", "dijkstra", "r9_bidirectional_bfs")}
+
+    def _untimed(trials):
+        return [dataclasses.replace(trial, solve_time_ms=0.0, timings_ms=()) for trial in trials]
+
+    sequential, _ = benchmark.run_benchmark(planners=planners, maze_count=5, width=7, height=7, seed=2)
+    parallel, summary = benchmark.run_benchmark(
+        planners=planners, maze_count=5, width=7, height=7, seed=2, jobs=2
+    )
+    assert _untimed(parallel) == _untimed(sequential)
+    assert {row["planner"] for row in summary} == set(planners)
+
+
+def test_repeated_timings_report_percentiles_and_confidence_intervals(tmp_path):
+    bench_stats = importlib.import_module("bench_stats")
+
+    assert bench_stats.percentile([4.0, 1.0, 3.0, 2.0], 50.0) == 2.5
+    assert bench_stats.percentile([1.0, 2.0], 100.0) == 2.0
+    ci = bench_stats.bootstrap_mean_ci([1.0, 2.0, 3.0, 4.0], seed=3)
+    assert ci == bench_stats.bootstrap_mean_ci([1.0, 2.0, 3.0, 4.0], seed=3)
+    assert 1.0 <= ci[0] <= 2.5 <= ci[1] <= 4.0
+    assert not bench_stats.intervals_overlap((1.0, 2.0), (2.5, 3.0))
+
+    available = benchmark.load_available_planners(include_alt=True)
+    planners = {name: available[name] for name in ("astar", "r6_lpa_star")}
+    trials, summary, csv_path, summary_path = benchmark.run_benchmark_and_write_reports(
+        planners=planners, maze_count=4, width=6, height=6, seed=1, warmup=1, repeats=3, output_dir=tmp_path
+    )
+    assert {len(t.timings_ms) for t in trials if t.planner == "astar"} == {3}
+    assert {len(t.timings_ms) for t in trials if t.planner == "r6_lpa_star"} == {1}
+    for trial in trials:
+        assert min(trial.timings_ms) <= trial.solve_time_ms <= max(trial.timings_ms)
+    for row in summary:
+        assert row["comparison_ci_low_ms"] <= row["mean_shared_solve_time_ms"] <= row["comparison_ci_high_ms"]
+        assert row["min_solve_time_ms"] <= row["median_solve_time_ms"] <= row["p99_solve_time_ms"]
+
+    tied = [
+        {**row, "comparison_ci_low_ms": 1.0, "comparison_ci_high_ms": 2.0} for row in summary
+    ]
+    assert benchmark.declared_winner(tied) is None
+    assert "overlaps #1" in benchmark.render_console_summary_table(tied)
+    assert "p95_ms" in csv_path.read_text(encoding="utf-8").splitlines()[0]
+    assert "- Winner:" in summary_path.read_text(encoding="utf-8")
+
+
+def test_hygiene_mode_prewarms_and_records_metadata(tmp_path):
+    import gc
+    import json
+
+    available = benchmark.load_available_planners(include_alt=False)
+    planners = {name: available[name] for name in ("astar", "greedy_best_first")}
+    assert gc.isenabled()
+    trials, summary, _, summary_path = benchmark.run_benchmark_and_write_reports(
+        planners=planners, maze_count=3, width=6, height=6, seed=2, hygiene=True, output_dir=tmp_path
+    )
+    assert gc.isenabled()
+    assert all(trial.success for trial in trials)
+    assert all(row["cold_solve_time_ms"] > 0.0 for row in summary)
+
+    metadata = json.loads((tmp_path / "benchmark_metadata.json").read_text(encoding="utf-8"))
+    assert metadata["timing"]["hygiene"]["enabled"] is True
+    assert set(metadata["cold_timings_ms"]) == set(planners)
+    assert "## Cold vs Warm" in summary_path.read_text(encoding="utf-8")
+
+
+def test_interrupted_benchmark_resumes_from_checkpoint_csv(tmp_path):
+    import pytest
+
+    astar = benchmark.load_available_planners(include_alt=False)["astar"]
+    calls = []
+
+    def flaky_astar(grid, start, goal, **kwargs):
+        calls.append(1)
+        if len(calls) == 4:
+            raise KeyboardInterrupt
+        return astar(grid, start, goal, **kwargs)
+
+    config = dict(maze_count=4, width=6, height=6, seed=3, output_dir=tmp_path, fsync_every=1)
+    with pytest.raises(KeyboardInterrupt):
+        benchmark.run_benchmark_and_write_reports(planners={"astar": flaky_astar}, **config)
+    checkpoint = tmp_path / "benchmark_results.csv"
+    with checkpoint.open("a", encoding="utf-8") as handle:
+        handle.write("astar,3,6,6")  # torn row from a crash mid-write
+    assert [t.maze_index for t in benchmark.read_results_csv(checkpoint)] == [0, 1, 2]
+
+    resumed, summary, _, _ = benchmark.run_benchmark_and_write_reports(
+        planners={"astar": flaky_astar}, resume=True, **config
+    )
+    assert len(calls) == 5
+    fresh, _ = benchmark.run_benchmark(planners={"astar": astar}, maze_count=4, width=6, height=6, seed=3)
+
+    def untimed(trials):
+        return [dataclasses.replace(t, solve_time_ms=0.0, timings_ms=()) for t in trials]
+
+    assert untimed(resumed) == untimed(fresh)
+    assert untimed(benchmark.read_results_csv(checkpoint)) == untimed(fresh)
+    assert summary[0]["runs"] == 4
+
+    with pytest.raises(ValueError):
+        benchmark.run_benchmark(
+            planners={"astar": astar}, maze_count=4, width=7, height=6, seed=3, completed_trials=resumed
+        )
+
+
+def test_size_sweep_fits_scaling_and_cuts_off_slow_planners():
+    import time
+
+    bench_stats = importlib.import_module("bench_stats")
+    assert abs(bench_stats.loglog_slope([1, 10, 100], [3, 300, 30000]) - 2.0) < 1e-9
+
+    astar = benchmark.load_available_planners(include_alt=False)["astar"]
+
+    def slow_astar(grid, start, goal):
+        time.sleep(0.005)
+        return astar(grid, start, goal)
+
+    trials, summary, scaling = benchmark.run_size_sweep(
+        planners={"astar": astar, "slow": slow_astar},
+        sizes=(8, 4, 6),
+        maze_count=2,
+        seed=1,
+        time_budget_ms=8.0,
+    )
+    by_planner = {row["planner"]: row for row in scaling}
+    assert by_planner["slow"]["cut_off_at"] == 6
+    assert sorted(by_planner["slow"]["runs"]) == [4]
+    assert by_planner["astar"]["cut_off_at"] is None
+    assert by_planner["astar"]["runs"] == {4: 2, 6: 2, 8: 2}
+    assert by_planner["astar"]["expansion_slope"] > 0.5
+    assert {row["planner"] for row in summary} == {"astar", "slow"}
+    assert "Cut Off At" in benchmark.render_console_scaling_table(scaling)
+    # Cut-off counts mazes, not trials: one maze with three queries is still short of two.
+    multi_query = [
+        benchmark.TrialResult("astar", 0, 1, 4, 4, "backtracker", True, 1.0, 7, 9, query_index=q) for q in range(3)
+    ]
+    assert benchmark.summarize_scaling(multi_query, [4], maze_count=2)[0]["cut_off_at"] == 4
+
+
+def test_baseline_comparison_flags_significant_regressions(tmp_path):
+    bench_stats = importlib.import_module("bench_stats")
+    _, p = bench_stats.mann_whitney_u([5, 6, 7, 8, 9, 10, 11, 12], [1, 2, 3, 4, 5, 6, 7, 8])
+    assert abs(p - 0.00666) < 1e-4
+
+    def trial(planner, index, time_ms, expansions=100):
+        return benchmark.TrialResult(planner, index, 7 + index, 8, 8, "backtracker", True, time_ms, 30, expansions)
+
+    baseline = [trial(name, i, 1.0 + 0.01 * i) for name in ("astar", "bfs", "dijkstra") for i in range(20)]
+    path = benchmark.save_baseline(baseline, tmp_path / "baseline.csv", calibration_ms=2.0)
+    loaded, calibration = benchmark.load_baseline(path)
+    assert calibration == 2.0 and len(loaded) == len(baseline)
+
+    # A machine twice as slow (calibration 4 ms) with identical normalized times is not a regression.
+    current = [trial("astar", i, 2.0 * (1.0 + 0.01 * i)) for i in range(20)]
+    current += [trial("bfs", i, 2.0 * 1.5 * (1.0 + 0.01 * i)) for i in range(20)]
+    current += [trial("dijkstra", i, 2.0 * (1.0 + 0.01 * i), expansions=120) for i in range(20)]
+    rows = {
+        row["planner"]: row
+        for row in benchmark.compare_to_baseline(
+            current, loaded, calibration_ms=4.0, baseline_calibration_ms=calibration
+        )
+    }
+    assert rows["astar"]["verdict"] == "unchanged"
+    assert rows["bfs"]["time_verdict"] == "regression" and rows["bfs"]["p_slower"] < 0.01
+    assert rows["dijkstra"]["time_verdict"] == "unchanged"
+    assert rows["dijkstra"]["expansion_verdict"] == "regression"
+    assert "REGRESSION" in benchmark.render_console_comparison_table(list(rows.values()))
+
+
+def test_columnar_npz_sink_round_trips_and_summarizes_lazily(tmp_path):
+    import pytest
+
+    trial_store = importlib.import_module("trial_store")
+    trial = benchmark.TrialResult("astar", 0, 7, 8, 8, "backtracker", False, 1.5, None, None, "boom", (1.0, 2.0))
+    assert not hasattr(trial, "__dict__")
+    with trial_store.ColumnarTrialWriter(tmp_path / "small.npz", chunk_size=2) as writer:
+        writer.write_many([trial, dataclasses.replace(trial, maze_index=1, timings_ms=()), trial])
+    assert list(trial_store.iter_trials(tmp_path / "small.npz")) == [
+        trial,
+        dataclasses.replace(trial, maze_index=1, timings_ms=()),
+        trial,
+    ]
+
+    planners = benchmark.load_available_planners(include_alt=False)
+    selected = {"astar": planners["astar"], "dijkstra": planners["dijkstra"]}
+    config = dict(planners=selected, maze_count=3, width=6, height=6, seed=5)
+    kept, _, store_path, _ = benchmark.run_benchmark_and_write_reports(
+        output_dir=tmp_path, sink="npz", export_csv=True, jobs=2, **config
+    )
+    assert kept == [] and store_path.name == "benchmark_results.npz"
+    fresh, _ = benchmark.run_benchmark(**config)
+
+    def untimed(trials):
+        return sorted(
+            (dataclasses.replace(t, solve_time_ms=0.0, timings_ms=()) for t in trials),
+            key=lambda t: (t.maze_index, t.planner),
+        )
+
+    stored = list(trial_store.iter_trials(store_path))
+    assert untimed(stored) == untimed(fresh)
+    assert untimed(benchmark.read_results_csv(tmp_path / "benchmark_results.csv")) == untimed(fresh)
+    assert benchmark.summarize_trials(store_path, seed=5) == benchmark.summarize_trials(stored, seed=5)
+    with pytest.raises(ValueError):
+        benchmark.run_benchmark_and_write_reports(output_dir=tmp_path, sink="npz", resume=True, **config)
+
+
+def test_online_summary_matches_batch_summary_incrementally():
+    import math
+    import random
+
+    bench_stats = importlib.import_module("bench_stats")
+    rng = random.Random(3)
+    values = [rng.lognormvariate(0.0, 1.0) for _ in range(20000)]
+    sketch = bench_stats.QuantileSketch()
+    moments = bench_stats.RunningMoments()
+    for value in values:
+        sketch.add(value)
+        moments.add(value)
+    assert len(sketch) < 1000
+    assert abs(sketch.quantile(0.99) / bench_stats.percentile(values, 99.0) - 1.0) < 0.01
+    assert math.isclose(moments.mean, sum(values) / len(values), rel_tol=1e-12)
+
+    planners = benchmark.load_available_planners(include_alt=False)
+    selected = {name: planners[name] for name in ("astar", "dijkstra", "greedy_best_first")}
+    online = benchmark.OnlineTrialSummary(selected)
+    pending_sizes = []
+
+    def on_trial(trial):
+        online.add(trial)
+        pending_sizes.append(online.pending_maze_count)
+
+    _, summary = benchmark.run_benchmark(
+        planners=selected, maze_count=5, width=7, height=7, seed=2, on_trial=on_trial
+    )
+    assert max(pending_sizes) <= 1 and online.pending_maze_count == 0
+    live = {row["planner"]: row for row in online.summary_rows()}
+    for row in summary:
+        other = live[row["planner"]]
+        for key in ("runs", "successes", "shared_success_maze_count", "median_solve_time_ms", "p95_solve_time_ms"):
+            assert math.isclose(other[key], row[key]), key
+        for key in ("mean_solve_time_ms", "mean_shared_path_length", "mean_expansions"):
+            assert math.isclose(other[key], row[key], rel_tol=1e-9), key
+    assert "15/15 (100%) trials, 5 shared mazes" in online.progress_line(15)
+
+
+def test_memory_profiling_records_peaks_and_ranks_planners(tmp_path):
+    planners = benchmark.load_available_planners(include_alt=True)
+    selected = {name: planners[name] for name in ("astar", "r2_bidirectional_astar", "r6_lpa_star")}
+    trials, summary, _, summary_path = benchmark.run_benchmark_and_write_reports(
+        planners=selected, maze_count=2, width=12, height=12, seed=4, output_dir=tmp_path, profile_memory=True
+    )
+    assert all(t.peak_memory_bytes > 0 and t.retained_blocks >= 0 for t in trials)
+    reread = benchmark.read_results_csv(tmp_path / "benchmark_results.csv")
+    assert [t.peak_memory_bytes for t in reread] == [t.peak_memory_bytes for t in trials]
+    assert sorted(row["memory_rank"] for row in summary) == [1, 2, 3]
+    assert "## Memory" in summary_path.read_text(encoding="utf-8")
+    assert "Mem #" in benchmark.render_console_summary_table(summary)
+
+    plain, plain_summary = benchmark.run_benchmark(planners=selected, maze_count=1, width=6, height=6)
+    assert plain[0].peak_memory_bytes is None
+    assert all(row["memory_rank"] is None for row in plain_summary)
+    assert "Mem #" not in benchmark.render_console_summary_table(plain_summary)
+
+
+def test_memory_profiling_keeps_tracing_out_of_stateful_planner_timings():
+    import statistics
+
+    lpa = {"r6_lpa_star": benchmark.load_available_planners(include_alt=True)["r6_lpa_star"]}
+    options = dict(planners=lpa, maze_count=8, width=13, height=13, seed=6)
+    plain, _ = benchmark.run_benchmark(**options)
+    profiled, _ = benchmark.run_benchmark(**options, profile_memory=True)
+    assert all(t.peak_memory_bytes > 0 for t in profiled)
+    # The forked profile leaves the planner's cache as the timed calls expect it.
+    assert [t.expansions for t in profiled] == [t.expansions for t in plain]
+    plain_ms = statistics.median(t.solve_time_ms for t in plain)
+    profiled_ms = statistics.median(t.solve_time_ms for t in profiled)
+    assert profiled_ms < 2.0 * plain_ms + 0.5
+
+
+def test_profiler_writes_per_planner_pstats_and_collapsed_stacks(tmp_path, capsys):
+    import pstats
+
+    import pytest
+
+    bench_profile = importlib.import_module("bench_profile")
+    planners = benchmark.load_available_planners(include_alt=True)
+    selected = {"astar": planners["astar"], "r6_lpa_star": planners["r6_lpa_star"]}
+    profiler = bench_profile.PlannerProfiler("cprofile")
+    benchmark.run_benchmark_and_write_reports(
+        planners=selected, maze_count=2, width=10, height=10, output_dir=tmp_path, profiler=profiler
+    )
+    assert profiler.calls == {"astar": 2, "r6_lpa_star": 2}
+    profiles = tmp_path / "profiles"
+    assert pstats.Stats(str(profiles / "astar.pstats")).total_calls > 0
+    stacks = (profiles / "r6_lpa_star.collapsed").read_text(encoding="utf-8").splitlines()
+    assert stacks and all(line.rsplit(" ", 1)[1].isdigit() for line in stacks)
+    assert any(line.startswith("r6_lpa_star:plan_lpa_star;") for line in stacks)
+    assert "r6_lpa_star" in benchmark.render_console_profile_table(profiler)
+
+    def busy(n):
+        return sum(i * i for i in range(n))
+
+    sampler = bench_profile.PlannerProfiler("sample")
+    sampler.profile("busy", lambda: busy(300_000))
+    assert sampler.top_functions("busy")[0]["self"] > 0
+    # Samples stop at the planner call: none land in the sampler thread's join.
+    assert not any("threading" in stack for stack in sampler.collapsed_stacks("busy"))
+    sampler.profile("instant", lambda: None)
+    written = sampler.write(tmp_path / "sampled")
+    assert [path.name for path in written] == ["busy.collapsed"]
+    assert "[WARN] No stacks recorded for instant" in capsys.readouterr().out
+    with pytest.raises(ValueError):
+        benchmark.run_benchmark(planners=selected, maze_count=2, width=6, height=6, jobs=2, profiler=profiler)
+
+
+def test_dynamic_scenarios_replay_updates_and_count_incremental_reuse(tmp_path):
+    import pytest
+
+    scenarios = importlib.import_module("scenarios")
+    bench_scenarios = importlib.import_module("bench_scenarios")
+    grid, start, goal = benchmark.generate_benchmark_maze(width=10, height=10, seed=3, algorithm="backtracker")
+    for kind in scenarios.SCENARIO_KINDS:
+        scenario = scenarios.generate_scenario(kind, grid, start, goal, steps=6, seed=3)
+        assert scenario == scenarios.generate_scenario(kind, grid, start, goal, steps=6, seed=3)
+        queries = list(scenario.queries())
+        assert len(queries) == scenario.query_count == len(scenario.solvable) == 7
+        for before, after, update in zip(queries, queries[1:], scenario.updates):
+            changed = {(r, c) for r, row in enumerate(after) for c, value in enumerate(row) if value != before[r][c]}
+            assert changed == set(update.blocked) | set(update.freed)
+            assert after[start[0]][start[1]] == 0 and after[goal[0]][goal[1]] == 0
+    with pytest.raises(ValueError):
+        scenarios.generate_scenario("earthquake", grid, start, goal)
+
+    planners = benchmark.load_available_planners(include_alt=True)
+    selected = {"astar": planners["astar"], "r6_lpa_star": planners["r6_lpa_star"]}
+    results, rows, csv_path, summary_path = bench_scenarios.run_scenarios_and_write_reports(
+        planners=selected, kinds=("doors", "robots"), scenario_count=2, width=10, height=10, steps=6,
+        output_dir=tmp_path,
+    )
+    assert len(results) == 2 * 2 * 2
+    assert all(len(result.update_times_ms) == 6 and result.failed_queries == 0 for result in results)
+    by_planner = {(row["kind"], row["planner"]): row for row in rows}
+    assert by_planner[("doors", "r6_lpa_star")]["reused_updates"] == 12
+    assert by_planner[("doors", "astar")]["full_resets"] == 12
+    assert by_planner[("robots", "astar")]["reuse_rate"] == 0.0
+    assert csv_path.read_text(encoding="utf-8").count("\n") == len(results) + 1
+    assert "Reused / Full" in summary_path.read_text(encoding="utf-8")
+
+
+def _sleeping_planner(grid, start, goal):
+    import time
+
+    time.sleep(30)
+
+
+def _hoarding_planner(grid, start, goal):
+    return bytearray(2 << 30)
+
+
+def test_isolated_trials_time_out_and_run_out_of_memory_without_hanging():
+    import time
+
+    import pytest
+
+    isolation = importlib.import_module("isolation")
+    planners = benchmark.load_available_planners(include_alt=True)
+    selected = {"astar": planners["astar"], "sleepy": _sleeping_planner, "r6_lpa_star": planners["r6_lpa_star"]}
+    if isolation.memory_limit_supported():
+        selected["hoarder"] = _hoarding_planner
+    started = time.perf_counter()
+    trials, summary = benchmark.run_benchmark(
+        planners=selected, maze_count=2, width=8, height=8, isolate=True, trial_timeout_ms=500, memory_limit_mb=256
+    )
+    assert time.perf_counter() - started < 20
+    by_planner = {name: [t for t in trials if t.planner == name] for name in selected}
+    assert all(t.success for t in by_planner["astar"] + by_planner["r6_lpa_star"])
+    assert all(not t.success and t.error.startswith("timeout") for t in by_planner["sleepy"])
+    assert all(t.solve_time_ms >= 500 for t in by_planner["sleepy"])
+    if "hoarder" in selected:
+        assert all(t.error.startswith("oom") for t in by_planner["hoarder"])
+    assert next(row for row in summary if row["planner"] == "sleepy")["success_rate"] == 0.0
+
+    # Isolated and in-process runs agree, including r6's reuse across mazes.
+    safe = {"astar": planners["astar"], "r6_lpa_star": planners["r6_lpa_star"]}
+    isolated, _ = benchmark.run_benchmark(planners=safe, maze_count=3, width=8, height=8, isolate=True)
+    inline, _ = benchmark.run_benchmark(planners=safe, maze_count=3, width=8, height=8)
+    assert [(t.planner, t.path_length, t.expansions) for t in isolated] == [
+        (t.planner, t.path_length, t.expansions) for t in inline
+    ]
+    with pytest.raises(ValueError):
+        benchmark.run_benchmark(planners=safe, maze_count=2, trial_timeout_ms=100)
+
+
+def test_query_mixes_amortize_indexed_planner_preprocessing(tmp_path):
+    import math
+
+    import pytest
+
+    queries = importlib.import_module("queries")
+    wavefront = importlib.import_module("wavefront")
+    grid, start, goal = benchmark.generate_benchmark_maze(width=12, height=12, seed=5, algorithm="backtracker")
+    assert queries.generate_queries(grid, start, goal) == [(start, goal)]
+    for mix in ("random", "farthest", "dead_ends"):
+        pairs = queries.generate_queries(grid, start, goal, mix, 5, seed=5)
+        assert pairs == queries.generate_queries(grid, start, goal, mix, 5, seed=5) and len(pairs) == 5
+        assert all(a != b and wavefront.wavefront(grid, a).distance_to(b) > 0 for a, b in pairs)
+    farthest = queries.generate_queries(grid, start, goal, "farthest", 1, seed=5)[0]
+    assert wavefront.wavefront(grid, farthest[0]).distance_to(farthest[1]) >= wavefront.wavefront(grid, start).distance_to(goal)
+
+    planners = benchmark.load_available_planners(include_alt=True)
+    assert "astar_alt" in planners and "astar_alt" not in benchmark._resolve_default_benchmark_planners(planners)
+    selected = {"astar": planners["astar"], "astar_alt": planners["astar_alt"]}
+    trials, summary, csv_path, _ = benchmark.run_benchmark_and_write_reports(
+        planners=selected, maze_count=2, width=8, height=8, query_mix="random", queries_per_maze=3, output_dir=tmp_path
+    )
+    assert len(trials) == 12 and all(t.success for t in trials)
+    assert sorted({t.query_index for t in trials}) == [0, 1, 2]
+    assert all((t.preprocess_ms is not None) == (t.planner == "astar_alt") for t in trials)
+    alt_paths = {(t.maze_index, t.query_index): t.path_length for t in trials if t.planner == "astar_alt"}
+    assert alt_paths == {(t.maze_index, t.query_index): t.path_length for t in trials if t.planner == "astar"}
+    rows = {row["planner"]: row for row in summary}
+    assert math.isnan(rows["astar"]["mean_preprocess_ms"]) and rows["astar_alt"]["mean_preprocess_ms"] > 0
+    assert rows["astar_alt"]["shared_success_maze_count"] == 6
+    assert benchmark._comparison_time_ms(rows["astar_alt"]) == pytest.approx(
+        rows["astar_alt"]["mean_shared_solve_time_ms"] + rows["astar_alt"]["mean_preprocess_ms"]
+    )
+    reread = benchmark.read_results_csv(csv_path)
+    assert [(t.query_index, t.preprocess_ms is None) for t in reread] == [
+        (t.query_index, t.preprocess_ms is None) for t in trials
+    ]
+    assert "## Preprocessing" in (tmp_path / "benchmark_summary.md").read_text(encoding="utf-8")
+    with pytest.raises(ValueError):
+        benchmark.run_benchmark(planners=selected, maze_count=1, query_mix="random", queries_per_maze=2, batched=True)
+    # A checkpoint cut off mid-cell reruns that cell instead of losing its other queries.
+    partial, _ = benchmark.run_benchmark(
+        planners={"astar": planners["astar"]}, maze_count=2, width=8, height=8, query_mix="random",
+        queries_per_maze=3, completed_trials=[t for t in reread if t.planner == "astar"][:1],
+    )
+    assert sorted((t.maze_index, t.query_index) for t in partial) == [(m, q) for m in range(2) for q in range(3)]
+
+
+def test_shards_partition_mazes_and_merge_back_into_the_full_run(tmp_path):
+    import json
+    import os
+    import time
+
+    import pytest
+
+    shards = importlib.import_module("shards")
+    assert shards.parse_shard("1/3") == shards.Shard(1, 3)
+    for text in ("3/3", "1", "a/2", "-1/2"):
+        with pytest.raises(ValueError):
+            shards.parse_shard(text)
+    assert sorted(i for shard in shards.all_shards(3) for i in shard.maze_indices(7)) == list(range(7))
+
+    planners = benchmark.load_available_planners(include_alt=False)
+    selected = {"astar": planners["astar"], "dijkstra": planners["dijkstra"]}
+    options = dict(planners=selected, maze_count=5, width=7, height=7, seed=3, output_dir=tmp_path, confidence=0.8)
+    full, _ = benchmark.run_benchmark(planners=selected, maze_count=5, width=7, height=7, seed=3)
+    for index in (0, 1):
+        benchmark.run_benchmark_and_write_reports(**options, shard=shards.Shard(index, 2))
+    with pytest.raises(ValueError, match="Missing shard"):
+        benchmark.merge_shard_results([tmp_path / "shards" / "0-of-2"], tmp_path / "merged")
+    shard_dirs = sorted((tmp_path / "shards").iterdir())
+    merged, summary, _, summary_path = benchmark.merge_shard_results(shard_dirs, tmp_path / "merged")
+    key = lambda t: (t.planner, t.maze_index, t.maze_seed, t.path_length, t.expansions)  # noqa: E731
+    assert sorted(map(key, merged)) == sorted(map(key, full))
+    assert {row["planner"] for row in summary} == {"astar", "dijkstra"}
+    assert all(row["ci_confidence"] == 0.8 for row in summary)
+    assert "merged from 2 of 2" in summary_path.read_text(encoding="utf-8")
+
+    # A shard rerun into a second directory duplicates its trials.
+    benchmark.run_benchmark_and_write_reports(**{**options, "output_dir": tmp_path / "again"}, shard=shards.Shard(1, 2))
+    with pytest.raises(ValueError, match="appears twice"):
+        benchmark.merge_shard_results([*shard_dirs, tmp_path / "again" / "shards" / "1-of-2"], tmp_path / "m2")
+    metadata_path = shard_dirs[1] / "benchmark_metadata.json"
+    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    metadata["benchmark"]["seed"] = 4
+    metadata_path.write_text(json.dumps(metadata), encoding="utf-8")
+    with pytest.raises(ValueError, match="different settings"):
+        benchmark.merge_shard_results(shard_dirs, tmp_path / "m3")
+
+    queue = shards.ShardQueue(tmp_path / "queue", 3)
+    first, second = queue.claim(), queue.claim()
+    assert (first, second) == (shards.Shard(0, 3), shards.Shard(1, 3))
+    queue.complete(first)
+    queue.release(second)
+    assert queue.pending() == [shards.Shard(1, 3), shards.Shard(2, 3)]
+    assert queue.claim() == shards.Shard(1, 3)
+    # A lock whose process is gone (same host) is reclaimed.
+    stale = json.loads((tmp_path / "queue" / "1-of-3.lock").read_text(encoding="utf-8"))
+    stale["pid"] = max(os.getpid(), 2**22) + 12345
+    (tmp_path / "queue" / "1-of-3.lock").write_text(json.dumps(stale), encoding="utf-8")
+    assert queue.claim() == shards.Shard(1, 3)
+    # A live lock moved aside by a reclaimer that misjudged it is put back.
+    real_is_stale, verdicts = queue._is_stale, iter([True])
+    queue._is_stale = lambda path: next(verdicts, None) or real_is_stale(path)
+    queue._reclaim_if_stale(shards.Shard(1, 3))
+    del queue._is_stale
+    assert json.loads((tmp_path / "queue" / "1-of-3.lock").read_text(encoding="utf-8"))["pid"] == os.getpid()
+    # An empty lock (claimer died mid-write) is reclaimed only after the grace period.
+    empty = tmp_path / "queue" / "2-of-3.lock"
+    empty.write_text("", encoding="utf-8")
+    assert queue.claim() is None and empty.read_text(encoding="utf-8") == ""
+    os.utime(empty, (time.time() - 2 * queue.lock_grace_s,) * 2)
+    assert queue.claim() == shards.Shard(2, 3) and queue.claim() is None
+    assert sorted(path.name for path in (tmp_path / "queue").iterdir()) == ["0-of-3.done", "1-of-3.lock", "2-of-3.lock"]
+
+
+def test_adaptive_sampling_stops_when_the_ranking_settles_or_runs_out_of_mazes(tmp_path):
+    import json
+    import time
+
+    import pytest
+
+    bench_adaptive = importlib.import_module("bench_adaptive")
+    planners = benchmark.load_available_planners(include_alt=False)
+
+    def slow_astar(grid, start, goal):
+        time.sleep(0.002)
+        return planners["astar"](grid, start, goal)
+
+    separated = {"astar": planners["astar"], "slow_astar": slow_astar}
+    trials, summary, outcome = bench_adaptive.run_adaptive_benchmark(
+        separated, batch_mazes=3, max_mazes=30, width=6, height=6, seed=2
+    )
+    assert outcome.stop_reason == "settled" and outcome.maze_count == 6 and outcome.batches == 2
+    assert [row["planner"] for row in summary] == ["astar", "slow_astar"] and not outcome.unsettled_pairs
+    assert sorted({t.maze_index for t in trials}) == list(range(6))
+
+    # Identical planners never separate, so the maze cap stops the run.
+    twins = {"astar": planners["astar"], "astar_twin": planners["astar"]}
+    _, summary, _, summary_path = benchmark.run_benchmark_and_write_reports(
+        planners=twins, maze_count=8, width=6, height=6, adaptive_batch_mazes=3, output_dir=tmp_path
+    )
+    metadata = json.loads((tmp_path / "benchmark_metadata.json").read_text(encoding="utf-8"))
+    adaptive = metadata["benchmark"]["adaptive"]
+    assert (adaptive["stop_reason"], adaptive["maze_count"], adaptive["batches"]) == ("max_mazes", 8, 3)
+    assert metadata["benchmark"]["maze_count"] == 8
+    assert adaptive["unsettled_pairs"] == [[row["planner"] for row in summary]]
+    assert "- Adaptive sampling: 8 mazes in 3 batch(es)" in summary_path.read_text(encoding="utf-8")
+    with pytest.raises(ValueError):
+        bench_adaptive.run_adaptive_benchmark(twins, batch_mazes=0)
+
+    # Batches run only their new mazes: a stateful planner is never replayed.
+    lpa = benchmark.load_available_planners(include_alt=True)["r6_lpa_star"]
+    calls = []
+
+    def counted_lpa(grid, start, goal):
+        calls.append(start)
+        return lpa(grid, start, goal)
+
+    counted_lpa.reuses_state = True
+    counted_lpa.reset_state = lpa.reset_state
+    trials, _, outcome = bench_adaptive.run_adaptive_benchmark(
+        {**twins, "lpa": counted_lpa}, batch_mazes=3, max_mazes=9, width=6, height=6
+    )
+    assert outcome.batches == 3 and len(calls) == len([t for t in trials if t.planner == "lpa"]) == 9
+
+
+def test_parameter_sweep_runs_variants_in_parallel_and_marks_the_pareto_front(tmp_path):
+    import pytest
+
+    sweeps = importlib.import_module("sweeps")
+    bench_sweeps = importlib.import_module("bench_sweeps")
+    planner, grid = sweeps.parse_param_grid("astar:tie_break=fifo,low_h;heuristic_weight=1,2.5")
+    assert (planner, grid) == ("astar", {"tie_break": ["fifo", "low_h"], "heuristic_weight": [1, 2.5]})
+    assert len(sweeps.expand_grid(grid)) == 4
+    for text in ("astar", "astar:tie_break", "astar:1x=2", "astar:a=1;a=2"):
+        with pytest.raises(ValueError):
+            sweeps.parse_param_grid(text)
+    assert sweeps.pareto_front([(1.0, 5.0), (2.0, 4.0), (2.0, 5.0), (float("nan"), 1.0)]) == [True, True, False, True]
+
+    available = benchmark.load_available_planners(include_alt=True)
+    with pytest.raises(ValueError, match="no parameter"):
+        bench_sweeps.build_sweep_variants([("astar", {"beam_width": [2]})], available)
+    with pytest.raises(ValueError, match=r"astar\[tie_break=sideways\]"):
+        bench_sweeps.build_sweep_variants([("astar", {"tie_break": ["sideways"]})], available)
+
+    variants = bench_sweeps.build_sweep_variants(
+        [("r7_beam_search", {"beam_width": [1, 16]}), ("astar", {"heuristic_weight": [1, 2]})], available
+    )
+    assert sorted(variants) == [
+        "astar[heuristic_weight=1]",
+        "astar[heuristic_weight=2]",
+        "r7_beam_search[beam_width=16]",
+        "r7_beam_search[beam_width=1]",
+    ]
+    trials, summary = benchmark.run_benchmark(planners=variants, maze_count=6, width=8, height=8, seed=4, jobs=2)
+    sequential, _ = benchmark.run_benchmark(planners=variants, maze_count=6, width=8, height=8, seed=4)
+    assert [(t.planner, t.path_length) for t in trials] == [(t.planner, t.path_length) for t in sequential]
+    sweep_rows = bench_sweeps.summarize_sweep(summary)
+    front = [row for row in sweep_rows if row["pareto"]]
+    assert front and sweep_rows[: len(front)] == front
+
+    def objectives(row):
+        return (
+            benchmark._comparison_time_ms(row),
+            benchmark._comparison_path_length(row),
+            -row["success_rate"],
+        )
+
+    for row in sweep_rows[len(front) :]:
+        assert any(
+            all(a <= b for a, b in zip(objectives(other), objectives(row))) and objectives(other) != objectives(row)
+            for other in front
+        )
+    report = bench_sweeps.write_sweep_markdown(
+        sweep_rows, tmp_path / "sweep.md", grids=[], maze_count=6, width=8, height=8, seed=4,
+        algorithm="backtracker", sizes=(12, 8),
+    ).read_text(encoding="utf-8")
+    assert "6 per size (8x8, 12x12 backtracker mazes" in report and "pools all sizes" in report